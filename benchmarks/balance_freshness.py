@@ -0,0 +1,68 @@
+"""
+Compares the number of requests of 'custom.current_balance_list' per freshness policy for wallets whose cached
+balances are current, lack a newly used chain, have drifted from the wallet value or can't be checked against it.
+The cache of every wallet also holds a chain the wallet no longer uses.
+
+The responses are synthetic and served by a client that doesn't send anything. Like in real responses, the 'time_at'
+of tokens is the time they were deployed at, years before the request, so it mustn't make cached balances look stale.
+
+Usage: python benchmarks/balance_freshness.py [chains]
+"""
+import sys
+from typing import Optional, Dict
+
+from py_debank import custom
+from py_debank.client import DebankClient
+from py_debank.models import Entrypoints, Freshness
+
+
+def make_token(chain: str, i: int, amount: float) -> dict:
+    return {
+        'chain': chain, 'id': f'0x{i:040x}', 'symbol': f'T{i}', 'decimals': 18, 'price': 2.0, 'amount': amount,
+        'is_core': True, 'is_verified': True, 'is_wallet': True, 'time_at': 1_500_000_000 + i * 86_400
+    }
+
+
+class SyntheticClient(DebankClient):
+    def __init__(self, chains: int, drift: float = 0.0, new_chains: int = 0, wallet_known: bool = True):
+        super().__init__()
+        self.chains = [f'chain{i}' for i in range(chains)]
+        self.cached_chains = self.chains[:chains - new_chains] + ['retired']
+        self.drift = drift
+        self.wallet_known = wallet_known
+        self.requests = 0
+
+    def get(self, url: str, params: dict, headers: Optional[Dict[str, str]] = None, **kwargs) -> dict:
+        self.requests += 1
+        if url == Entrypoints.PUBLIC.TOKEN + 'cache_balance_list':
+            return {'data': [make_token(chain=chain, i=i, amount=1.0) for i, chain in enumerate(self.cached_chains)]}
+
+        if url == Entrypoints.PUBLIC.TOKEN + 'balance_list':
+            i = self.chains.index(params['chain'])
+            return {'data': [make_token(chain=params['chain'], i=i, amount=1.0 + self.drift)]}
+
+        if url == Entrypoints.PUBLIC.USER + 'addr':
+            return {'data': {
+                'id': params['addr'], 'used_chains': self.chains,
+                'wallet_usd_value': 2.0 * (1.0 + self.drift) * len(self.chains) if self.wallet_known else None
+            }}
+
+        raise ValueError(f'unexpected request: {url}')
+
+
+def main() -> None:
+    chains = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    cases = (
+        ('current cache', {}), ('new chain', {'new_chains': 1}), ('drifted cache', {'drift': 0.5}),
+        ('no wallet value', {'wallet_known': False})
+    )
+    for name, kwargs in cases:
+        for freshness in (Freshness.FRESH, Freshness.CACHED, Freshness.AUTO):
+            client = SyntheticClient(chains=chains, **kwargs)
+            balances = custom.current_balance_list(address='0xwallet', freshness=freshness, client=client)
+            usd_value = sum(chain.usd_value for chain in balances.values())
+            print(f'{name:<16} {freshness:<7} {client.requests:>4} requests {usd_value:>10.2f} USD')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Compares the cost of building request headers per request: constructing UserAgent() every time as it was done before
+and taking a precomputed header set from HeaderProvider.
+
+Usage: python benchmarks/headers.py [requests]
+"""
+import sys
+import timeit
+
+from fake_useragent import UserAgent
+
+from py_debank.header_provider import HeaderProvider, BASE_HEADERS
+
+
+def build_with_user_agent() -> dict:
+    return {**BASE_HEADERS, 'user-agent': UserAgent().chrome}
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    provider = HeaderProvider()
+    offline_provider = HeaderProvider(use_fake_useragent=False)
+    cases = [
+        ('UserAgent() per request', build_with_user_agent, requests),
+        ('HeaderProvider.get()', provider.get, requests * 10_000),
+        ('HeaderProvider.get(proxy=...)', lambda: provider.get(proxy='http://127.0.0.1:8080'), requests * 10_000),
+        ('HeaderProvider.get() offline', offline_provider.get, requests * 10_000)
+    ]
+    provider.get()
+    offline_provider.get()
+    for name, function, number in cases:
+        seconds = timeit.timeit(function, number=number)
+        print(f'{name:<32} {seconds / number * 1e6:>12.3f} us per request')
+
+
+if __name__ == '__main__':
+    main()
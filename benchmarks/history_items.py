@@ -0,0 +1,134 @@
+"""
+Compares decoding sends and receives of NFT-heavy history pages: the former per-item path that built a Token in
+a try/except and fell back to NFT, and the schema-based classification of ModelRegistry. Both paths have to classify
+the same number of NFTs, otherwise the timings aren't comparable and the benchmark fails.
+
+Recorded pages can be passed as paths of files with raw 'history/list' response bodies. Without arguments, 200
+synthetic pages are used: 20 transactions per page, every item is an NFT with a probability of 0.8 and refers to one
+of a few hundred tokens and NFTs of the token dictionary. The synthetic NFTs carry their listing price as an object,
+so the Token constructor fails on them and the former path takes its NFT fallback.
+
+Usage: python benchmarks/history_items.py [response.json ...]
+"""
+import copy
+import json
+import random
+import sys
+import time
+from typing import List
+
+from py_debank.models import Token, NFT, ModelRegistry
+
+
+def make_page(index: int, nft_share: float) -> dict:
+    token_dict = {}
+    for i in range(50):
+        token_id = f'0x{i:040x}'
+        token_dict[token_id] = {
+            'chain': 'eth', 'id': token_id, 'symbol': f'T{i}', 'optimized_symbol': f'T{i}', 'name': f'Token {i}',
+            'decimals': 18, 'price': random.random() * 10, 'is_core': True, 'is_verified': True, 'is_wallet': True,
+            'logo_url': 'https://static.debank.com/token.png', 'protocol_id': '', 'time_at': 1_600_000_000
+        }
+
+    for i in range(200):
+        nft_id = f'{i:032x}'
+        token_dict[nft_id] = {
+            'chain': 'eth', 'id': nft_id, 'contract_id': f'0x{i % 20:040x}', 'inner_id': str(i), 'name': f'NFT #{i}',
+            'collection_id': f'eth:0x{i % 20:040x}', 'content_type': 'image_url', 'content': 'https://nft.png',
+            'thumbnail_url': 'https://nft_thumbnail.png', 'detail_url': 'https://opensea.io', 'is_erc721': True,
+            'pay_token': {'id': f'0x{i % 50:040x}'}, 'price': {'amount': random.random(), 'token_id': 'eth'}
+        }
+
+    token_ids = [token_id for token_id in token_dict if token_id.startswith('0x')]
+    nft_ids = [nft_id for nft_id in token_dict if not nft_id.startswith('0x')]
+    history_list = []
+    for i in range(20):
+        items = [
+            {'token_id': random.choice(nft_ids if random.random() < nft_share else token_ids), 'amount': 1}
+            for _ in range(random.randint(1, 4))
+        ]
+        history_list.append({
+            'chain': 'eth', 'id': f'0x{index:032x}{i:032x}', 'time_at': 1_700_000_000 - index * 20 - i,
+            'cate_id': 'receive', 'receives': items[:len(items) // 2 + 1], 'sends': items[len(items) // 2 + 1:]
+        })
+
+    return {'history_list': history_list, 'token_dict': token_dict}
+
+
+def decode_with_exception(page: dict) -> List[Token or NFT]:
+    token_dict = page['token_dict']
+    decoded = []
+    for tx in page['history_list']:
+        for item in (tx.get('receives') or []) + (tx.get('sends') or []):
+            token = token_dict.get(item.get('token_id'))
+            token['amount'] = item.get('amount')
+            try:
+                token = Token(data=token)
+
+            except:
+                pay_token = token.get('pay_token')
+                if pay_token:
+                    token['pay_token'] = token_dict.get(pay_token.get('id'))
+
+                token = NFT(data=token)
+
+            token.amount = item.get('amount')
+            decoded.append(token)
+
+    return decoded
+
+
+def decode_with_registry(page: dict, registry: ModelRegistry) -> List[Token or NFT]:
+    token_dict = page['token_dict']
+    decoded = []
+    for tx in page['history_list']:
+        for item in (tx.get('receives') or []) + (tx.get('sends') or []):
+            decoded.append(registry.get_token(
+                chain=tx['chain'], token_id=item.get('token_id'), token_dict=token_dict, amount=item.get('amount'),
+                tx_id=tx['id']
+            ))
+
+    return decoded
+
+
+def load_page(path: str) -> dict:
+    with open(path, 'rb') as file:
+        body = json.load(file)
+
+    return body['data'] if 'history_list' not in body else body
+
+
+def main() -> None:
+    random.seed(0)
+    if len(sys.argv) > 1:
+        pages = [load_page(path=path) for path in sys.argv[1:]]
+
+    else:
+        pages = [make_page(index=i, nft_share=0.8) for i in range(200)]
+
+    items = sum(len(tx.get('receives') or []) + len(tx.get('sends') or []) for page in pages
+                for tx in page['history_list'])
+
+    legacy_pages = copy.deepcopy(pages)
+    started_at = time.perf_counter()
+    legacy = [token for page in legacy_pages for token in decode_with_exception(page=page)]
+    legacy_seconds = time.perf_counter() - started_at
+
+    registry = ModelRegistry()
+    started_at = time.perf_counter()
+    current = [token for page in pages for token in decode_with_registry(page=page, registry=registry)]
+    current_seconds = time.perf_counter() - started_at
+
+    legacy_nfts = sum(isinstance(token, NFT) for token in legacy)
+    current_nfts = sum(isinstance(token, NFT) for token in current)
+    assert legacy_nfts == current_nfts, (
+        f'the paths classify different numbers of NFTs: {legacy_nfts} and {current_nfts} of {items} items'
+    )
+    for name, seconds in (('try Token / except NFT', legacy_seconds), ('ModelRegistry', current_seconds)):
+        print(f'{name:<24} {seconds / items * 1e6:>8.3f} us per item {current_nfts:>8} NFTs of {items} items')
+
+    print(f'malformed items reported: {len(registry.malformed)}')
+
+
+if __name__ == '__main__':
+    main()
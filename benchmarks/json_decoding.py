@@ -0,0 +1,102 @@
+"""
+Compares JSON decoder backends on large responses: decoding alone and decoding followed by building the models.
+
+Without arguments, synthetic 'token/balance_list' and 'history/list' responses of several MB are used. Recorded
+responses can be passed as paths of files with raw bodies, they are decoded only.
+
+Usage: python benchmarks/json_decoding.py [response.json ...]
+"""
+import json
+import random
+import sys
+import timeit
+from typing import List, Tuple, Callable, Optional
+
+from py_debank.decoders import DECODERS, JsonDecoder
+from py_debank.models import Chain, History
+
+
+def make_token(i: int) -> dict:
+    return {
+        'chain': 'eth', 'id': f'0x{i:040x}', 'symbol': f'T{i}', 'optimized_symbol': f'T{i}', 'display_symbol': None,
+        'name': f'Token {i}', 'decimals': 18, 'price': random.random() * 10, 'amount': random.random() * 1000,
+        'raw_amount': random.random() * 1e21, 'is_core': random.random() < 0.5, 'is_verified': True,
+        'is_wallet': True, 'logo_url': f'https://static.debank.com/image/eth_token/logo_url/{i}.png',
+        'protocol_id': '', 'price_24h_change': random.random() - 0.5, 'time_at': 1_600_000_000 + i
+    }
+
+
+def make_balance_list(tokens: int) -> bytes:
+    return json.dumps({'error_code': 0, 'data': [make_token(i) for i in range(tokens)]}).encode()
+
+
+def make_history_list(txs: int) -> bytes:
+    token_dict = {f'0x{i:040x}': make_token(i) for i in range(500)}
+    history_list = []
+    for i in range(txs):
+        token_ids = random.sample(list(token_dict), 3)
+        history_list.append({
+            'chain': 'eth', 'id': f'0x{i:064x}', 'time_at': 1_700_000_000 - i, 'cate_id': 'swap',
+            'project_id': 'uniswap3', 'other_addr': f'0x{i:040x}', 'token_approve': None,
+            'receives': [{'token_id': token_ids[0], 'amount': random.random(), 'from_addr': f'0x{i:040x}'}],
+            'sends': [{'token_id': token_id, 'amount': random.random(), 'to_addr': f'0x{i:040x}'}
+                      for token_id in token_ids[1:]],
+            'tx': {'name': 'exactInput', 'from_addr': f'0x{i:040x}', 'to_addr': f'0x{i + 1:040x}',
+                   'eth_gas_fee': random.random() / 100, 'usd_gas_fee': random.random() * 10, 'status': 1}
+        })
+
+    return json.dumps({'error_code': 0, 'data': {
+        'history_list': history_list, 'token_dict': token_dict,
+        'project_dict': {'uniswap3': {'chain': 'eth', 'id': 'uniswap3', 'name': 'Uniswap V3'}}
+    }}).encode()
+
+
+def get_decoders() -> List[JsonDecoder]:
+    decoders = []
+    for decoder_class in DECODERS.values():
+        try:
+            decoders.append(decoder_class())
+
+        except ImportError:
+            print(f'{decoder_class.name} is not installed')
+
+    return decoders
+
+
+def measure(function: Callable[[], object]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=5)) * 1000
+
+
+def main() -> None:
+    random.seed(0)
+    payloads: List[Tuple[str, bytes, Optional[Callable[[dict], object]]]] = []
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            with open(path, 'rb') as file:
+                payloads.append((path, file.read(), None))
+
+    else:
+        payloads.append((
+            'token/balance_list', make_balance_list(tokens=10_000),
+            lambda response: Chain(name='eth', tokens=response['data'])
+        ))
+        payloads.append((
+            'history/list', make_history_list(txs=5_000),
+            lambda response: History(address='0x0', data=response['data'])
+        ))
+
+    decoders = get_decoders()
+    for name, content, build in payloads:
+        print(f'{name} ({len(content) / 1024 / 1024:.1f} MiB)')
+        for decoder in decoders:
+            decode_ms = measure(lambda: decoder.loads(content))
+            line = f'    {decoder.name:<10} decode {decode_ms:>8.1f} ms'
+            if build:
+                total_ms = measure(lambda: build(decoder.loads(content)))
+                line += f'    decode + models {total_ms:>8.1f} ms'
+
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares the memory taken by the models and their compact variants holding the same Chain and History trees.
+
+Usage: python benchmarks/models_memory.py [wallets]
+"""
+import copy
+import gc
+import sys
+import tracemalloc
+
+from py_debank import models, compact_models
+
+
+def make_token(chain: str, index: int) -> dict:
+    return {
+        'chain': chain, 'id': f'0x{index:040x}', 'symbol': f'T{index}', 'optimized_symbol': f'T{index}',
+        'display_symbol': None, 'name': f'Token {index}', 'decimals': 18, 'logo_url': 'https://example.com/logo.png',
+        'protocol_id': '', 'price': 1.5, 'is_verified': True, 'is_core': True, 'is_wallet': True,
+        'time_at': 1600000000.0, 'amount': 10.0 + index
+    }
+
+
+def make_balances(chain: str) -> list:
+    return [make_token(chain=chain, index=index) for index in range(20)]
+
+
+def make_projects(chain: str) -> list:
+    return [{
+        'id': f'project{index}', 'chain': chain, 'name': f'Project {index}', 'site_url': 'https://example.com',
+        'logo_url': 'https://example.com/logo.png', 'has_supported_portfolio': True, 'tvl': 1000000.0,
+        'portfolio_item_list': [{
+            'name': 'Lending', 'stats': {'asset_usd_value': 100.0, 'debt_usd_value': 0.0, 'net_usd_value': 100.0},
+            'update_at': 1600000000.0, 'detail_types': ['lending'], 'pool': {'id': f'pool{index}'},
+            'details': {'supply_token_list': [make_token(chain=chain, index=index), make_token(chain=chain, index=99)]}
+        }]
+    } for index in range(5)]
+
+
+def make_history(chain: str) -> dict:
+    token_dict = {f'0x{index:040x}': make_token(chain=chain, index=index) for index in range(10)}
+    return {
+        'history_list': [{
+            'chain': chain, 'cate_id': 'receive', 'id': f'0xtx{index}', 'time_at': 1600000000.0 - index,
+            'other_addr': '0xother', 'project_id': 'project0',
+            'receives': [{'token_id': f'0x{index % 10:040x}', 'amount': 1.0, 'from_addr': '0xother'}],
+            'sends': [], 'tx': {'name': 'transfer', 'from_addr': '0xother', 'to_addr': '0xwallet',
+                                'eth_gas_fee': 0.001, 'usd_gas_fee': 2.0}
+        } for index in range(20)],
+        'token_dict': token_dict,
+        'project_dict': {'project0': make_projects(chain=chain)[0]}
+    }
+
+
+def measure(module, wallets: int, balances: list, projects: list, history: dict) -> int:
+    """
+    Get how many bytes the trees of all wallets retain.
+    """
+    gc.collect()
+    tracemalloc.start()
+    trees = []
+    for _ in range(wallets):
+        chain = module.Chain(name='eth', tokens=balances, projects=projects)
+        trees.append((chain, module.History(address='0xwallet', data=copy.deepcopy(history))))
+
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current
+
+
+def main() -> None:
+    wallets = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    balances = make_balances(chain='eth')
+    projects = make_projects(chain='eth')
+    history = make_history(chain='eth')
+    results = {}
+    for module in (models, compact_models):
+        results[module.__name__] = measure(
+            module=module, wallets=wallets, balances=balances, projects=projects, history=history
+        )
+        print(f'{module.__name__:<28} {results[module.__name__] / wallets / 1024:>10.1f} KiB per wallet')
+
+    saving = 1 - results[compact_models.__name__] / results[models.__name__]
+    print(f'{"saving":<28} {saving * 100:>10.1f} %')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+from typing import Optional, List
+
+from py_debank.aio.client import AsyncDebankClient, get_default_client
+from py_debank.models import Entrypoints, Curve
+
+
+async def net_curve_24h(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[AsyncDebankClient] = None
+) -> Curve:
+    """
+    Get an address's asset value history for the last 24 hours.
+
+    Args:
+        address (str): an address.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Curve: the address's asset value history for the last 24 hours.
+
+    """
+    client = client or get_default_client()
+    params = {
+        'user_addr': address
+    }
+    json_response = await client.get(url=Entrypoints.PUBLIC.ASSET + 'net_curve_24h', params=params, proxies=proxies)
+    return Curve(data=json_response['data'])
@@ -0,0 +1,436 @@
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Tuple, Any, Mapping
+
+import aiohttp
+
+from py_debank.backends import BackendCall, PublicBackend
+from py_debank.cache import ResponseCache
+from py_debank.client import _BoundModule, _MAX_PROXY_POOLS
+from py_debank.decoders import JsonDecoder, get_default_decoder
+from py_debank.header_provider import HeaderProvider, get_default_header_provider
+from py_debank.job_poller import JobPoller
+from py_debank.persistent_cache import PersistentCache
+from py_debank.proxy_pool import ProxyPool
+from py_debank.rate_limiter import RateLimiter
+from py_debank.retry import RetryPolicy
+from py_debank.utils import choose_proxy, get_proxy_url, parse_response
+
+
+class _Transport:
+    """
+    The HTTP session of an event loop, it is shared between a client and its copies.
+
+    Attributes:
+        session (Optional[aiohttp.ClientSession]): the HTTP session.
+        semaphore (Optional[asyncio.Semaphore]): the semaphore limiting the number of requests in flight.
+        loop (Optional[asyncio.AbstractEventLoop]): the event loop the session belongs to.
+        closer (Optional[asyncio.Task]): the task of the event loop that closes the session when it's cancelled.
+
+    """
+
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.closer: Optional[asyncio.Task] = None
+
+
+async def _close_on_cancel(session: aiohttp.ClientSession) -> None:
+    """
+    Wait until the task is cancelled and close the session, 'asyncio.run' cancels remaining tasks before closing
+    the event loop, so the session is closed in the loop it belongs to.
+
+    Args:
+        session (aiohttp.ClientSession): the HTTP session.
+
+    """
+    try:
+        await asyncio.Event().wait()
+
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+class AsyncDebankClient:
+    """
+    An asynchronous client that owns a pooled aiohttp session and sends all requests to the DeBank API through it.
+
+    All endpoint functions are available through the module attributes, e.g.
+    `await client.token.balance_list(address=address, chain='eth')`.
+
+    Attributes:
+        proxies (Optional[str or ProxyPool]): an HTTP proxy or a proxy pool for making requests.
+        timeout (Optional[float]): how many seconds to wait for a response.
+        max_concurrency (int): the maximum number of requests in flight at the same time.
+        rate_limiter (Optional[RateLimiter]): the limiter that paces requests before they are sent.
+        retry_policy (RetryPolicy): the policy of retrying failed requests.
+        job_poller (JobPoller): the poller of NFT endpoints that prepare data in a background job.
+        cache (Optional[ResponseCache]): the cache of responses shared by all endpoint functions.
+        persistent_cache (Optional[PersistentCache]): the on-disk cache of immutable responses, e.g. historical token
+            prices.
+        header_provider (HeaderProvider): the provider of request headers.
+        decoder (JsonDecoder): the decoder of response bodies.
+        backend (PublicBackend): the backend describing the requests of address data, the public or the Pro API.
+        asset (_BoundModule): the 'asset' functions.
+        custom (_BoundModule): the 'custom' functions.
+        history (_BoundModule): the 'history' functions.
+        nft (_BoundModule): the 'nft' functions.
+        portfolio (_BoundModule): the 'portfolio' functions.
+        token (_BoundModule): the 'token' functions.
+        user (_BoundModule): the 'user' functions.
+
+    """
+
+    def __init__(
+            self, proxies: Optional[str or List[str] or ProxyPool] = None, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = 30, max_concurrency: int = 100, limit_per_host: int = 0,
+            rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+            job_poller: Optional[JobPoller] = None, cache: Optional[ResponseCache] = None,
+            persistent_cache: Optional[PersistentCache] = None, header_provider: Optional[HeaderProvider] = None,
+            decoder: Optional[JsonDecoder] = None, backend: Optional[PublicBackend] = None
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list or a proxy pool for making
+                requests, lists are turned into proxy pools that prefer healthy proxies. (None)
+            headers (Optional[Dict[str, str]]): headers that will be added to every request. (None)
+            timeout (Optional[float]): how many seconds to wait for a response. (30)
+            max_concurrency (int): the maximum number of requests in flight at the same time. (100)
+            limit_per_host (int): the maximum number of connections to one host, 0 means no limit. (0)
+            rate_limiter (Optional[RateLimiter]): the limiter that paces requests before they are sent. (None)
+            retry_policy (Optional[RetryPolicy]): the policy of retrying failed requests. (3 attempts with backoff)
+            job_poller (Optional[JobPoller]): the poller of NFT endpoints that prepare data in a background job.
+                (adaptive polling with a 30-second deadline)
+            cache (Optional[ResponseCache]): the cache of responses shared by all endpoint functions. (None)
+            persistent_cache (Optional[PersistentCache]): the on-disk cache of immutable responses, e.g. historical
+                token prices. (None)
+            header_provider (Optional[HeaderProvider]): the provider of request headers. (the shared pool of Chrome
+                header sets)
+            decoder (Optional[JsonDecoder]): the decoder of response bodies. (the fastest installed JSON library)
+            backend (Optional[PublicBackend]): the backend describing the requests of address data, e.g.
+                'V1Backend' for the Pro API with an access key. (the public API)
+
+        """
+        self.proxies: Optional[str or ProxyPool] = ProxyPool(proxies=proxies) if isinstance(proxies, list) else proxies
+        self.timeout: Optional[float] = timeout
+        self.max_concurrency: int = max_concurrency
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.job_poller: JobPoller = job_poller or JobPoller()
+        self.cache: Optional[ResponseCache] = cache
+        self.persistent_cache: Optional[PersistentCache] = persistent_cache
+        self.header_provider: HeaderProvider = header_provider or get_default_header_provider()
+        self.decoder: JsonDecoder = decoder or get_default_decoder()
+        self.backend: PublicBackend = backend or PublicBackend()
+        self._proxy_pools: OrderedDict[Tuple[str, ...], ProxyPool] = OrderedDict()
+        self._headers: Dict[str, str] = headers or {}
+        self._limit_per_host: int = limit_per_host
+        self._transport: _Transport = _Transport()
+
+        self._bind_modules()
+
+    def _bind_modules(self) -> None:
+        """
+        Bind the endpoint modules to the client.
+        """
+        self.asset: _BoundModule = _BoundModule(client=self, module_name='aio.asset')
+        self.custom: _BoundModule = _BoundModule(client=self, module_name='aio.custom')
+        self.history: _BoundModule = _BoundModule(client=self, module_name='aio.history')
+        self.nft: _BoundModule = _BoundModule(client=self, module_name='aio.nft')
+        self.portfolio: _BoundModule = _BoundModule(client=self, module_name='aio.portfolio')
+        self.token: _BoundModule = _BoundModule(client=self, module_name='aio.token')
+        self.user: _BoundModule = _BoundModule(client=self, module_name='aio.user')
+
+    async def __aenter__(self) -> 'AsyncDebankClient':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the HTTP session and all its connections.
+        """
+        transport = self._transport
+        if transport.closer is not None:
+            transport.closer.cancel()
+            transport.closer = None
+
+        if transport.session and not transport.session.closed:
+            await transport.session.close()
+
+        transport.session = None
+
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> 'AsyncDebankClient':
+        """
+        Get a copy of the client with another retry policy, it shares the session, proxies and limits with the original.
+
+        Args:
+            retry_policy (RetryPolicy): the policy of retrying failed requests.
+
+        Returns:
+            AsyncDebankClient: the copy of the client.
+
+        """
+        client = copy.copy(self)
+        client.retry_policy = retry_policy
+        client._bind_modules()
+        return client
+
+    def _get_session(self) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        """
+        Get the HTTP session of the running event loop, it is created on the first call and closed when the loop
+        cancels its remaining tasks, e.g. at the end of 'asyncio.run'.
+
+        Returns:
+            Tuple[aiohttp.ClientSession, asyncio.Semaphore]: the HTTP session and the semaphore limiting the number of
+                requests in flight.
+
+        """
+        loop = asyncio.get_running_loop()
+        transport = self._transport
+        if transport.session is None or transport.session.closed or transport.loop is not loop:
+            # the previous session is closed by its closer in its own loop, a closed loop has already run it
+            if transport.closer is not None and not transport.loop.is_closed():
+                transport.closer.cancel()
+
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self._limit_per_host)
+            transport.session = aiohttp.ClientSession(
+                connector=connector, headers=self._headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            transport.semaphore = asyncio.Semaphore(self.max_concurrency)
+            transport.loop = loop
+            transport.closer = loop.create_task(_close_on_cancel(session=transport.session))
+
+        return transport.session, transport.semaphore
+
+    def resolve_proxies(
+            self, proxies: Optional[str or List[str] or ProxyPool] = None
+    ) -> Optional[str or ProxyPool]:
+        """
+        Get the proxies of a request, a proxy list is replaced with the pool the client keeps for it, so health of its
+        proxies is tracked across calls. The pools of the least recently used lists are dropped when there are more
+        than '_MAX_PROXY_POOLS' of them.
+
+        Args:
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list or a proxy pool.
+                (the client proxies)
+
+        Returns:
+            Optional[str or ProxyPool]: an HTTP proxy or a proxy pool.
+
+        """
+        proxies = proxies or self.proxies
+        if not isinstance(proxies, list):
+            return proxies
+
+        key = tuple(proxies)
+        pool = self._proxy_pools.get(key)
+        if pool is None:
+            pool = self._proxy_pools[key] = ProxyPool(proxies=proxies)
+            if len(self._proxy_pools) > _MAX_PROXY_POOLS:
+                self._proxy_pools.popitem(last=False)
+
+        else:
+            self._proxy_pools.move_to_end(key)
+
+        return pool
+
+    def _get_pools(self, proxies: Optional[str or ProxyPool], proxy: Optional[str]) -> List[ProxyPool]:
+        """
+        Get the pools to report the result of a request through a proxy to, the health of a proxy is the same in
+        every pool it belongs to.
+
+        Args:
+            proxies (Optional[str or ProxyPool]): the resolved proxies of the request.
+            proxy (Optional[str]): the chosen proxy.
+
+        Returns:
+            List[ProxyPool]: the pools.
+
+        """
+        if not proxy:
+            return []
+
+        pools = [proxies, self.proxies, *self._proxy_pools.values()]
+        unique = {id(pool): pool for pool in pools if isinstance(pool, ProxyPool) and proxy in pool}
+        return list(unique.values())
+
+    async def call(self, call: BackendCall, proxies: Optional[str or List[str] or ProxyPool] = None) -> Any:
+        """
+        Send the requests of a backend call concurrently and convert their responses.
+
+        Args:
+            call (BackendCall): the call.
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for health-weighted choice or
+                a proxy pool for making requests. (the client proxies)
+
+        Returns:
+            Any: the data of the call.
+
+        """
+        responses = await asyncio.gather(*(
+            self.get(url=url, params=params, proxies=proxies, headers=call.headers) for url, params in call.requests
+        ))
+        return call.convert(list(responses))
+
+    async def get(
+            self, url: str, params: dict, proxies: Optional[str or List[str] or ProxyPool] = None,
+            retry_policy: Optional[RetryPolicy] = None, persistent: bool = False,
+            headers: Optional[Dict[str, str]] = None
+    ) -> dict:
+        """
+        Send a GET request and check its response, retrying transient failures through other proxies, or get
+        the response from the cache.
+
+        Args:
+            url (str): the URL.
+            params (dict): the query parameters.
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for health-weighted choice or
+                a proxy pool for making a request. (the client proxies)
+            retry_policy (Optional[RetryPolicy]): the policy of retrying failed requests. (the client policy)
+            persistent (bool): whether the response is immutable and may be kept in the persistent cache. (False)
+            headers (Optional[Dict[str, str]]): headers added to the ones of the header provider. (None)
+
+        Returns:
+            dict: the json-encoded content of a response.
+
+        """
+        if self.cache is not None:
+            content = self.cache.get(url=url, params=params)
+            if content is not None:
+                return parse_response(status_code=200, content=content, decoder=self.decoder)
+
+        persistent = persistent and self.persistent_cache is not None
+        if persistent:
+            content = self.persistent_cache.get(url=url, params=params)
+            if content is not None:
+                return parse_response(status_code=200, content=content, decoder=self.decoder)
+
+        retry_policy = retry_policy or self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                return await self._send(
+                    url=url, params=params, proxies=proxies, persistent=persistent, headers=headers
+                )
+
+            except Exception as e:
+                if not retry_policy.should_retry(attempt=attempt, exception=e):
+                    raise
+
+                await asyncio.sleep(retry_policy.get_delay(attempt=attempt, exception=e))
+                attempt += 1
+
+    async def _send(
+            self, url: str, params: dict, proxies: Optional[str or List[str] or ProxyPool] = None,
+            persistent: bool = False, headers: Optional[Dict[str, str]] = None
+    ) -> dict:
+        """
+        Send a GET request once and check its response.
+
+        Args:
+            url (str): the URL.
+            params (dict): the query parameters.
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for health-weighted choice or
+                a proxy pool for making a request. (the client proxies)
+            persistent (bool): whether the response is immutable and may be kept in the persistent cache. (False)
+            headers (Optional[Dict[str, str]]): headers added to the ones of the header provider. (None)
+
+        Returns:
+            dict: the json-encoded content of a response.
+
+        """
+        session, semaphore = self._get_session()
+        proxies = self.resolve_proxies(proxies=proxies)
+        proxy = choose_proxy(proxies=proxies)
+        pools = self._get_pools(proxies=proxies, proxy=proxy)
+        if self.rate_limiter:
+            delay = self.rate_limiter.reserve(url=url, proxy=proxy)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        async with semaphore:
+            started_at = time.monotonic()
+            try:
+                async with session.get(
+                        url=url, params=params, headers=self._get_headers(proxy=proxy, headers=headers),
+                        proxy=get_proxy_url(proxies=proxy)
+                ) as response:
+                    status_code = response.status
+                    response_headers = response.headers
+                    content = await response.read()
+
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                for pool in pools:
+                    pool.report(proxy=proxy, error=True)
+
+                raise
+
+        for pool in pools:
+            pool.report(proxy=proxy, latency=time.monotonic() - started_at, status_code=status_code)
+
+        json_response = parse_response(
+            status_code=status_code, content=content, headers=response_headers, decoder=self.decoder
+        )
+        if self.cache is not None and self.cache.is_cacheable(response=json_response):
+            self.cache.set(url=url, params=params, content=content)
+
+        if persistent:
+            self.persistent_cache.set(url=url, params=params, content=content)
+
+        return json_response
+
+    def _get_headers(self, proxy: Optional[str], headers: Optional[Dict[str, str]] = None) -> Mapping[str, str]:
+        """
+        Get headers of a request.
+
+        Args:
+            proxy (Optional[str]): the proxy the request is sent through.
+            headers (Optional[Dict[str, str]]): headers added to the ones of the header provider. (None)
+
+        Returns:
+            Mapping[str, str]: the headers.
+
+        """
+        provided = self.header_provider.get(proxy=proxy)
+        if not headers:
+            return provided
+
+        return {**provided, **headers}
+
+
+_default_client: Optional[AsyncDebankClient] = None
+
+
+def get_default_client() -> AsyncDebankClient:
+    """
+    Get the client used by the module-level functions, it is created on the first call.
+
+    Returns:
+        AsyncDebankClient: the default client.
+
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = AsyncDebankClient()
+
+    return _default_client
+
+
+def set_default_client(client: Optional[AsyncDebankClient]) -> None:
+    """
+    Replace the client used by the module-level functions.
+
+    Args:
+        client (Optional[AsyncDebankClient]): the new default client, if None, it will be created on the next call.
+
+    """
+    global _default_client
+    _default_client = client
@@ -0,0 +1,354 @@
+import asyncio
+import itertools
+from typing import Dict, Optional, List, Awaitable, Iterable, AsyncIterator
+
+from py_debank.aio import history
+from py_debank.aio import nft
+from py_debank.aio import portfolio
+from py_debank.aio import token
+from py_debank.aio import user
+from py_debank.aio.client import AsyncDebankClient, get_default_client
+from py_debank.aio.token import balance_list
+from py_debank.aio.user import addr
+from py_debank.custom import _make_chains, has_drifted
+from py_debank.models import Chain, ChainNames, Freshness, LazyChain, Operations, ScanResult
+from py_debank.utils import sort_by_usd_value
+
+
+async def get_balance(
+        address: str, chain: ChainNames or str = '', parse_nfts: bool = True,
+        proxies: Optional[str or List[str]] = None, lazy: bool = False, client: Optional[AsyncDebankClient] = None,
+        freshness: str = Freshness.FRESH, tolerance: float = 0.05
+) -> Dict[str, Chain]:
+    """
+    Get the following information of an address of one or all chains:
+
+    - token balances
+    - projects where the account's assets are located
+    - owned NFTs
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        parse_nfts (bool): whether to parse NFT, it leads to a high probability of "429 Too Many Requests" error. (True)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        lazy (bool): if True, tokens, projects and NFTs will be created only when they are accessed. (False)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+        freshness (str): how fresh token balances of all chains have to be, see 'current_balance_list'. (fresh)
+        tolerance (float): the allowed relative drift of cached token balances in the 'auto' mode. (0.05)
+
+    Returns:
+        Chain: the address information.
+
+    """
+    operations = [Operations.BALANCES, Operations.PROJECTS]
+    if parse_nfts:
+        operations.append(Operations.NFTS)
+
+    return await _get_chains(
+        address=address, chain=chain, operations=operations, proxies=proxies, lazy=lazy,
+        client=client or get_default_client(), freshness=freshness, tolerance=tolerance
+    )
+
+
+async def current_balance_list(
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[AsyncDebankClient] = None, freshness: str = Freshness.FRESH,
+        tolerance: float = 0.05
+) -> Dict[str, Chain] or Dict[str, dict]:
+    """
+    Get current token balances of an address of all chains, with one request if the client backend has
+    an all-chain endpoint or according to the freshness policy otherwise:
+
+    - 'fresh': the user and one balance list per used chain are requested
+    - 'cached': only the cached balances of all chains are requested, they may be outdated
+    - 'auto': the cached balances and the user are requested together, if the value of the cached balances differs
+      from the wallet value of the user by more than 'tolerance' or the wallet value is unknown, the used chains
+      missing from the cache are requested and, if the balances still drift, so are the other used chains
+
+    Args:
+        address (str): an address.
+        raw_data: if True, it will return the unprocessed dictionary. (False)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        lazy (bool): if True, tokens will be created only when they are accessed. (False)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+        freshness (str): how fresh the balances have to be, see the 'Freshness' class. (fresh)
+        tolerance (float): the allowed relative drift of cached balances from the wallet value in the 'auto'
+            mode. (0.05)
+
+    Returns:
+        Dict[str, Chain] or Dict[str, dict]: token balances.
+        ::
+
+            {
+                'eth': Chain(..., tokens=...),
+                'bsc': Chain(..., tokens=...)
+            }
+
+    """
+    client = client or get_default_client()
+    call = client.backend.all_balance_list(address=address)
+    if call is not None:
+        return _make_chains(chain_dict=await client.call(call=call, proxies=proxies), raw_data=raw_data, lazy=lazy)
+
+    if freshness == Freshness.CACHED:
+        return await token.cache_balance_list(
+            address=address, raw_data=raw_data, proxies=proxies, lazy=lazy, client=client
+        )
+
+    if freshness == Freshness.AUTO:
+        chain_dict = await _get_auto_balance_list(
+            address=address, tolerance=tolerance, proxies=proxies, client=client
+        )
+        return _make_chains(chain_dict=chain_dict, raw_data=raw_data, lazy=lazy)
+
+    if freshness != Freshness.FRESH:
+        raise ValueError(f'unknown freshness: {freshness}')
+
+    used_chains = (await addr(address=address, proxies=proxies, client=client)).used_chains
+    balances = await asyncio.gather(*[
+        balance_list(address=address, chain=chain, raw_data=raw_data, proxies=proxies, lazy=lazy, client=client)
+        for chain in used_chains
+    ])
+    chain_dict = {}
+    for chain, balance in zip(used_chains, balances):
+        if raw_data:
+            if balance[chain]:
+                chain_dict[chain] = balance[chain]
+
+        elif balance.tokens:
+            chain_dict[chain] = balance
+
+    if not raw_data:
+        chain_dict = sort_by_usd_value(instances=chain_dict)
+
+    return chain_dict
+
+
+async def _get_auto_balance_list(
+        address: str, tolerance: float, proxies: Optional[str or List[str]], client: AsyncDebankClient
+) -> Dict[str, list]:
+    """
+    Get token balances of all chains from the cache and request them again only if they have drifted from
+    the wallet value of the user. Cached chains the user no longer uses are dropped, used chains missing from
+    the cache are requested first and the other used chains only if the balances still drift.
+
+    Args:
+        address (str): an address.
+        tolerance (float): the allowed relative drift of cached balances from the wallet value of the user.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        client (AsyncDebankClient): a client for making requests.
+
+    Returns:
+        Dict[str, list]: the tokens by chain.
+
+    """
+    chain_dict, debank_user = await asyncio.gather(
+        token.cache_balance_list(address=address, raw_data=True, proxies=proxies, client=client),
+        addr(address=address, proxies=proxies, client=client)
+    )
+    used_chains = debank_user.used_chains
+    if used_chains is None:
+        used_chains = list(chain_dict)
+
+    chain_dict = {chain: tokens for chain, tokens in chain_dict.items() if chain in used_chains}
+    if not has_drifted(chain_dict=chain_dict, user=debank_user, tolerance=tolerance):
+        return chain_dict
+
+    # Chains used since the balances were cached are the likeliest cause of the drift
+    missing = [chain for chain in used_chains if chain not in chain_dict]
+    if missing:
+        chain_dict.update(await _refresh_balance_list(address=address, chains=missing, proxies=proxies, client=client))
+        if not has_drifted(chain_dict=chain_dict, user=debank_user, tolerance=tolerance):
+            return chain_dict
+
+    chains = [chain for chain in used_chains if chain not in missing]
+    chain_dict.update(await _refresh_balance_list(address=address, chains=chains, proxies=proxies, client=client))
+    return chain_dict
+
+
+async def _refresh_balance_list(
+        address: str, chains: List[str], proxies: Optional[str or List[str]], client: AsyncDebankClient
+) -> Dict[str, list]:
+    """
+    Request current token balances of chains.
+
+    Args:
+        address (str): an address.
+        chains (List[str]): chains.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        client (AsyncDebankClient): a client for making requests.
+
+    Returns:
+        Dict[str, list]: the tokens by chain.
+
+    """
+    balances = await asyncio.gather(*[
+        balance_list(address=address, chain=chain, raw_data=True, proxies=proxies, client=client) for chain in chains
+    ])
+    return {chain: balance[chain] for chain, balance in zip(chains, balances)}
+
+
+async def scan(
+        addresses: Iterable[str], operations: Iterable[str] = (Operations.BALANCES, Operations.PROJECTS),
+        chain: ChainNames or str = '', max_workers: int = 16, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[AsyncDebankClient] = None
+) -> AsyncIterator[ScanResult]:
+    """
+    Run operations on many addresses concurrently, one failed address doesn't stop the others.
+
+    The addresses are consumed lazily, so it may be a generator of any length. The total number of requests in flight
+    is limited by the client's 'max_concurrency'.
+
+    Args:
+        addresses (Iterable[str]): addresses.
+        operations (Iterable[str]): what to get for every address, see the 'Operations' class.
+            (balances and projects)
+        chain (ChainNames or str): a chain. (all chains)
+        max_workers (int): the maximum number of addresses processed at the same time. (16)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        lazy (bool): if True, tokens, projects and NFTs will be created only when they are accessed. (False)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        AsyncIterator[ScanResult]: scan results in the order of completion, a result contains either the address
+            information or the exception raised while getting it.
+
+    """
+    client = client or get_default_client()
+    addresses = iter(addresses)
+    operations = list(operations)
+    tasks = {
+        asyncio.create_task(
+            _scan_address(
+                address=address, chain=chain, operations=operations, proxies=proxies, lazy=lazy, client=client
+            )
+        ) for address in itertools.islice(addresses, max_workers)
+    }
+    try:
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for address in itertools.islice(addresses, len(done)):
+                tasks.add(asyncio.create_task(
+                    _scan_address(
+                        address=address, chain=chain, operations=operations, proxies=proxies, lazy=lazy, client=client
+                    )
+                ))
+
+            for task in done:
+                yield task.result()
+
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _scan_address(
+        address: str, chain: ChainNames or str, operations: List[str], proxies: Optional[str or List[str]],
+        lazy: bool, client: AsyncDebankClient
+) -> ScanResult:
+    """
+    Run operations on an address.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain.
+        operations (List[str]): what to get, see the 'Operations' class.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        lazy (bool): if True, tokens, projects and NFTs will be created only when they are accessed.
+        client (AsyncDebankClient): a client for making requests.
+
+    Returns:
+        ScanResult: the scan result.
+
+    """
+    result = ScanResult(address=address)
+    try:
+        if set(operations) & {Operations.BALANCES, Operations.PROJECTS, Operations.NFTS}:
+            result.chains = await _get_chains(
+                address=address, chain=chain, operations=operations, proxies=proxies, lazy=lazy, client=client
+            )
+
+        if Operations.HISTORY in operations:
+            result.history = await history.list_(address=address, chain=chain, proxies=proxies, client=client)
+
+        if Operations.TOTAL_BALANCE in operations:
+            result.total_balance = await user.total_balance(address=address, proxies=proxies, client=client)
+
+    except Exception as e:
+        return ScanResult(address=address, exception=e)
+
+    return result
+
+
+async def _get_chains(
+        address: str, chain: ChainNames or str, operations: Iterable[str], proxies: Optional[str or List[str]],
+        lazy: bool, client: AsyncDebankClient, freshness: str = Freshness.FRESH, tolerance: float = 0.05
+) -> Dict[str, Chain]:
+    """
+    Get token balances, projects and owned NFTs of an address concurrently and merge them into chains.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain.
+        operations (Iterable[str]): what to get: 'balances', 'projects' and/or 'nfts'.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        lazy (bool): if True, tokens, projects and NFTs will be created only when they are accessed.
+        client (AsyncDebankClient): a client for making requests.
+        freshness (str): how fresh token balances of all chains have to be, see 'current_balance_list'. (fresh)
+        tolerance (float): the allowed relative drift of cached token balances in the 'auto' mode. (0.05)
+
+    Returns:
+        Dict[str, Chain]: the address information.
+
+    """
+    kwargs = {'address': address, 'raw_data': True, 'proxies': proxies, 'client': client}
+    sources = []
+    if Operations.BALANCES in operations:
+        if chain:
+            sources.append(('parse_tokens', token.balance_list(chain=chain, **kwargs)))
+
+        else:
+            sources.append(('parse_tokens', current_balance_list(
+                freshness=freshness, tolerance=tolerance, **kwargs
+            )))
+
+    if Operations.PROJECTS in operations:
+        sources.append(('parse_projects', portfolio.project_list(**kwargs)))
+
+    if Operations.NFTS in operations:
+        sources.append(('parse_nfts', nft.collection_list(chain=chain, **kwargs)))
+
+    async def get_data(parse: str, coroutine: Awaitable[dict]) -> tuple:
+        return parse, await coroutine
+
+    chain_class = LazyChain if lazy else Chain
+    chains: Dict[str, Chain] = {chain: chain_class(name=chain)} if chain else {}
+    tasks = [asyncio.ensure_future(get_data(parse, coroutine)) for parse, coroutine in sources]
+    try:
+        for future in asyncio.as_completed(tasks):
+            parse, data = await future
+            for name, chain_data in data.items():
+                if chain and name != chain:
+                    continue
+
+                if name not in chains:
+                    chains[name] = chain_class(name=name)
+
+                getattr(chains[name], parse)(chain_data)
+
+    finally:
+        # the other sources mustn't keep running when one of them has failed
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return sort_by_usd_value(instances=chains)
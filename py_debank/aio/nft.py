@@ -0,0 +1,317 @@
+import asyncio
+from typing import Optional, List, Dict, AsyncIterator
+
+from py_debank.aio.client import AsyncDebankClient, get_default_client
+from py_debank.models import (
+    Entrypoints, ChainNames, Chain, LazyChain, ProfitLeaderboard, NFTHistory, NFTTx, PendingJob, ModelRegistry
+)
+from py_debank.utils import choose_proxy, sort_by_usd_value
+
+
+async def collection_list(
+        address: str, chain: ChainNames or str = '', raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[AsyncDebankClient] = None
+) -> Dict[str, Chain] or Dict[str, list or PendingJob]:
+    """
+    Get owned collections (raw data) or NFTs by an address.
+
+    If DeBank hasn't prepared the data of a chain before the deadline of the client job poller, the chain has
+    the pending job instead of NFTs. Backends with all-chain endpoints get NFTs of all chains with one request.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        raw_data (bool): if True, it will return the unprocessed dictionary. (False)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        lazy (bool): if True, NFTs will be created only when they are accessed. (False)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Dict[str, Chain] or Dict[str, list or PendingJob]: owned collections (raw data) or NFTs.
+        ::
+
+            {
+                'eth': Chain(..., nfts=...),
+                'bsc': Chain(..., nfts=...)
+            }
+
+    """
+    client = client or get_default_client()
+    call = client.backend.collection_list(address=address, chain=chain)
+    if call is not None:
+        chain_dict = await client.call(call=call, proxies=proxies)
+
+    else:
+        chains = [chain] if chain else await used_chains(address=address, proxies=proxies, client=client)
+        chain_dict = await _get_job_results(
+            address=address, chains=chains, method='collection_list', proxies=proxies, client=client
+        )
+
+    if not raw_data:
+        chain_class = LazyChain if lazy else Chain
+        chain_dict = sort_by_usd_value(
+            instances={
+                name: chain_class(name=name, collections=collections) for name, collections in chain_dict.items()
+            }
+        )
+
+    return chain_dict
+
+
+async def history_collection_list(
+        address: str, chain: ChainNames or str = '', proxies: Optional[str or List[str]] = None,
+        client: Optional[AsyncDebankClient] = None
+) -> Dict[str, ProfitLeaderboard or PendingJob]:
+    """
+    Get a profit leaderboard for all the NFT collections the address has ever owned.
+
+    If DeBank hasn't prepared the data of a chain before the deadline of the client job poller, the pending job is
+    returned for it after the leaderboards.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Dict[str, ProfitLeaderboard or PendingJob]: the profit leaderboard.
+        ::
+
+            {
+                'eth': ProfitLeaderboard(...),
+                'bsc': ProfitLeaderboard(...)
+            }
+
+    """
+    client = client or get_default_client()
+    chains = [chain] if chain else await used_chains(address=address, proxies=proxies, client=client)
+    profit_dict = await _get_job_results(
+        address=address, chains=chains, method='history_collection_list', proxies=proxies, client=client
+    )
+    leaderboards = sort_by_usd_value(
+        instances={
+            name: ProfitLeaderboard(chain=name, profits=data) for name, data in profit_dict.items()
+            if data and not isinstance(data, PendingJob)
+        },
+        attribute='usd_profit'
+    )
+    leaderboards.update({name: data for name, data in profit_dict.items() if isinstance(data, PendingJob)})
+    return leaderboards
+
+
+async def history_list(
+        address: str, chain: ChainNames or str = '', proxies: Optional[str or List[str]] = None,
+        client: Optional[AsyncDebankClient] = None
+) -> Dict[str, NFTHistory] or Dict[str, dict]:
+    """
+    Get a NFT transaction history of an address.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Dict[str, NFTHistory] or Dict[str, dict]: the NFT transaction history.
+        ::
+
+            {
+                'eth': NFTHistory(...),
+                'bsc': NFTHistory(...)
+            }
+
+    """
+    client = client or get_default_client()
+    chains = [chain] if chain else await used_chains(address=address, proxies=proxies, client=client)
+    histories = await asyncio.gather(*[
+        _history_list(address=address, chain=chain, proxies=proxies, client=client) for chain in chains
+    ])
+    return dict(zip(chains, histories))
+
+
+async def iter_history(
+        address: str, chain: ChainNames or str = '', until: Optional[int or str] = None, limit: Optional[int] = None,
+        proxies: Optional[str or List[str]] = None, client: Optional[AsyncDebankClient] = None
+) -> AsyncIterator[NFTTx]:
+    """
+    Iterate over a complete NFT transaction history of an address following the anchor cursor of every chain.
+
+    Next pages of all chains are requested concurrently, transactions are yielded page by page in the order of
+    the chains, from newer to older ones within a chain.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        until (Optional[int or str]): stop a chain at the first transaction older than this time. (None)
+        limit (Optional[int]): the maximum number of transactions per chain. (unlimited)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        AsyncIterator[NFTTx]: the NFT transactions.
+
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    client = client or get_default_client()
+    chains = [chain] if chain else await used_chains(address=address, proxies=proxies, client=client)
+    until = float(until) if until is not None else None
+    registry = ModelRegistry()
+    cursors = {chain: ('', '') for chain in chains}
+    counts = dict.fromkeys(chains, 0)
+    while cursors:
+        active = list(cursors)
+        page_counts = {chain: 20 if limit is None else min(20, limit - counts[chain]) for chain in active}
+        pages = await asyncio.gather(*[
+            _get_history_page(
+                address=address, chain=chain, anchor_time=cursors[chain][0], anchor_id=cursors[chain][1],
+                page_count=page_counts[chain], proxies=proxies, client=client
+            ) for chain in active
+        ])
+        for chain, page in zip(active, pages):
+            anchor_id = cursors.pop(chain)[1]
+            history_list = page.get('history_list') or []
+            txs = [tx for tx in history_list if not anchor_id or tx.get('id') != anchor_id]
+            finished = len(history_list) < page_counts[chain] or not txs
+            for tx in txs:
+                if until is not None and float(tx.get('time_at')) < until:
+                    finished = True
+                    break
+
+                yield NFTTx(chain=chain, data=tx, registry=registry)
+                counts[chain] += 1
+
+            if limit is not None and counts[chain] >= limit:
+                finished = True
+
+            if not finished:
+                cursors[chain] = (txs[-1].get('time_at'), txs[-1].get('id'))
+
+
+async def used_chains(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[AsyncDebankClient] = None
+) -> List[str]:
+    """
+    Get chains in which there was interaction with NFT.
+
+    Args:
+        address (str): an address.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        List[str]: chains.
+
+    """
+    client = client or get_default_client()
+    params = {
+        'user_addr': address
+    }
+    json_response = await client.get(url=Entrypoints.PUBLIC.NFT + 'used_chains', params=params, proxies=proxies)
+    return json_response['data']
+
+
+async def _get_job_results(
+        address: str, chains: List[str], method: str, proxies: Optional[str or List[str]], client: AsyncDebankClient
+) -> Dict[str, list or PendingJob]:
+    """
+    Get the results of an NFT endpoint that prepares data in a background job, polling the jobs of all chains together.
+
+    Args:
+        address (str): an address.
+        chains (List[str]): chains.
+        method (str): the endpoint method, e.g. 'collection_list'.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        client (AsyncDebankClient): a client for making requests.
+
+    Returns:
+        Dict[str, list or PendingJob]: the results or pending jobs if they haven't finished before the deadline.
+
+    """
+    chain_proxies = {chain: choose_proxy(proxies=client.resolve_proxies(proxies=proxies)) for chain in chains}
+
+    async def fetch(chain: str) -> dict:
+        params = {
+            'user_addr': address,
+            'chain': chain
+        }
+        json_response = await client.get(
+            url=Entrypoints.PUBLIC.NFT + method, params=params, proxies=chain_proxies[chain]
+        )
+        return json_response['data']
+
+    results = {}
+    for chain, data in zip(chains, await client.job_poller.poll_async(fetch=fetch, items=chains)):
+        if client.job_poller.is_pending(data):
+            results[chain] = PendingJob(address=address, chain=chain, method=method, job=data['job'])
+
+        else:
+            results[chain] = data['result']['data']
+
+    return results
+
+
+async def _history_list(
+        address: str, chain: ChainNames or str, proxies: Optional[str or List[str]], client: AsyncDebankClient
+) -> NFTHistory:
+    """
+    Get a NFT transaction history of an address of a certain chain.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        client (AsyncDebankClient): a client for making requests.
+
+    Returns:
+        NFTHistory: the NFT transaction history.
+
+    """
+    data = await _get_history_page(
+        address=address, chain=chain, anchor_time='', anchor_id='', page_count=20, proxies=proxies, client=client
+    )
+    return NFTHistory(chain=chain, address=address, data=data)
+
+
+async def _get_history_page(
+        address: str, chain: ChainNames or str, anchor_time: int or str, anchor_id: str, page_count: int,
+        proxies: Optional[str or List[str]], client: AsyncDebankClient
+) -> dict:
+    """
+    Get a page of a NFT transaction history of an address of a certain chain.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain.
+        anchor_time (int or str): the time of the last transaction of the previous page, empty for the first page.
+        anchor_id (str): the ID of the last transaction of the previous page, empty for the first page.
+        page_count (int): how many transactions to parse, no more than 20.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        client (AsyncDebankClient): a client for making requests.
+
+    Returns:
+        dict: the page data.
+
+    """
+    params = {
+        'user_addr': address,
+        'chain': chain,
+        'type': '',
+        'anchor_time': str(anchor_time),
+        'anchor_id': anchor_id,
+        'page_count': str(page_count),
+        'direction': ''
+    }
+    json_response = await client.get(url=Entrypoints.PUBLIC.NFT + 'history_list', params=params, proxies=proxies)
+    return json_response['data']
@@ -0,0 +1,41 @@
+from typing import Optional, Dict, List
+
+from py_debank.aio.client import AsyncDebankClient, get_default_client
+from py_debank.models import Chain, LazyChain
+from py_debank.utils import sort_by_usd_value
+
+
+async def project_list(
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[AsyncDebankClient] = None
+) -> Dict[str, Chain] or Dict[str, dict]:
+    """
+    Get projects where the account's assets are located (liquidity, staking, etc.)
+
+    Args:
+        address (str): an address.
+        raw_data (bool): if True, it will return the unprocessed dictionary. (False)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        lazy (bool): if True, projects will be created only when they are accessed. (False)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Dict[str, Chain] or Dict[str, dict]: projects where the account's assets are located.
+        ::
+
+            {
+                'eth': Chain(..., projects=...),
+                'bsc': Chain(..., projects=...)
+            }
+
+    """
+    client = client or get_default_client()
+    chain_dict = await client.call(call=client.backend.project_list(address=address), proxies=proxies)
+    if not raw_data:
+        chain_class = LazyChain if lazy else Chain
+        chain_dict = sort_by_usd_value(
+            instances={name: chain_class(name=name, projects=projects) for name, projects in chain_dict.items()}
+        )
+
+    return chain_dict
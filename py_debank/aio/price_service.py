@@ -0,0 +1,126 @@
+import asyncio
+from typing import Optional, List, Dict, Tuple, Iterable
+
+from py_debank.aio import history
+from py_debank.aio.client import AsyncDebankClient, get_default_client
+
+
+class AsyncPriceService:
+    """
+    Looks up historical token prices in batches on top of 'history.token_price'.
+
+    Timestamps are rounded down to buckets, duplicate lookups are requested once, unique ones are requested
+    concurrently and historical prices are kept in a cache shared by all batches of the service.
+
+    Attributes:
+        client (AsyncDebankClient): a client for making requests.
+        bucket (int): the width in seconds of buckets timestamps are rounded down to, 0 disables rounding.
+        max_concurrency (int): the maximum number of prices requested concurrently.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making requests.
+
+    """
+
+    def __init__(
+            self, bucket: int = 300, max_concurrency: Optional[int] = None, proxies: Optional[str or List[str]] = None,
+            client: Optional[AsyncDebankClient] = None
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            bucket (int): the width in seconds of buckets timestamps are rounded down to, 0 disables rounding. (300)
+            max_concurrency (Optional[int]): the maximum number of prices requested concurrently.
+                (the client max_concurrency)
+            proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+                requests. (the client proxies)
+            client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+        """
+        self.client: AsyncDebankClient = client or get_default_client()
+        self.bucket: int = bucket
+        self.max_concurrency: int = max_concurrency or self.client.max_concurrency
+        self.proxies: Optional[str or List[str]] = proxies
+        self._prices: Dict[tuple, float] = {}
+
+    def make_key(self, token_id: str, chain: str, time_at: Optional[int or str] = None) -> tuple:
+        """
+        Make a key of a lookup with the timestamp rounded down to its bucket.
+
+        Args:
+            token_id (str): a token contract address or a coin name.
+            chain (str): a chain.
+            time_at (Optional[int or str]): at what point in time to get a token price. (current time)
+
+        Returns:
+            tuple: the key.
+
+        """
+        if time_at is not None and self.bucket:
+            time_at = int(float(time_at)) // self.bucket * self.bucket
+
+        return token_id.lower(), chain, time_at
+
+    async def get_prices(self, lookups: Iterable[Tuple[str, str, Optional[int or str]]]) -> List[float]:
+        """
+        Get token prices of a batch of lookups.
+
+        Args:
+            lookups (Iterable[Tuple[str, str, Optional[int or str]]]): token ID, chain and time lookups, a time of
+                None means the current price, current prices aren't cached between batches.
+
+        Returns:
+            List[float]: the prices in the order of the lookups.
+
+        """
+        keys = [self.make_key(*lookup) for lookup in lookups]
+        prices = {key: self._prices[key] for key in keys if key in self._prices}
+        missing = list(dict.fromkeys(key for key in keys if key not in prices))
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+        fetched = await asyncio.gather(*(self._fetch(key=key, semaphore=semaphore) for key in missing))
+
+        prices.update(zip(missing, fetched))
+        return [prices[key] for key in keys]
+
+    async def get_price(self, token_id: str, chain: str, time_at: Optional[int or str] = None) -> float:
+        """
+        Get a token price at a certain point in time.
+
+        Args:
+            token_id (str): a token contract address or a coin name.
+            chain (str): a chain.
+            time_at (Optional[int or str]): at what point in time to get a token price. (current time)
+
+        Returns:
+            float: the token price.
+
+        """
+        return (await self.get_prices(lookups=[(token_id, chain, time_at)]))[0]
+
+    async def _fetch(self, key: tuple, semaphore: asyncio.Semaphore) -> float:
+        """
+        Request a price and cache it if it's historical.
+
+        Args:
+            key (tuple): the key of the lookup.
+            semaphore (asyncio.Semaphore): the semaphore limiting the number of prices requested concurrently.
+
+        Returns:
+            float: the token price.
+
+        """
+        token_id, chain, time_at = key
+        async with semaphore:
+            price = await history.token_price(
+                token_id=token_id, chain=chain, time_at=time_at, proxies=self.proxies, client=self.client
+            )
+
+        if time_at is not None:
+            self._prices[key] = price
+
+        return price
+
+    def clear(self) -> None:
+        """
+        Remove all cached prices.
+        """
+        self._prices.clear()
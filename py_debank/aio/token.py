@@ -0,0 +1,70 @@
+from typing import Optional, List, Dict
+
+from py_debank.aio.client import AsyncDebankClient, get_default_client
+from py_debank.models import Chain, ChainNames, LazyChain
+from py_debank.utils import sort_by_usd_value
+
+
+async def balance_list(
+        address: str, chain: ChainNames or str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[AsyncDebankClient] = None
+) -> Chain or dict:
+    """
+    Get token balances of an address of a certain chain.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        raw_data (bool): if True, it will return the unprocessed dictionary. (False)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        lazy (bool): if True, tokens will be created only when they are accessed. (False)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Chain: token balances.
+
+    """
+    client = client or get_default_client()
+    tokens = await client.call(call=client.backend.balance_list(address=address, chain=chain), proxies=proxies)
+    if raw_data:
+        return {chain: tokens}
+
+    chain_class = LazyChain if lazy else Chain
+    return chain_class(name=chain, tokens=tokens)
+
+
+async def cache_balance_list(
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[AsyncDebankClient] = None
+) -> Dict[str, Chain] or Dict[str, dict]:
+    """
+    Get cached token balances of an address of all chains (current at the time of the last balance_list queries).
+
+    Args:
+        address (str): an address.
+        raw_data (bool): if True, it will return the unprocessed dictionary. (False)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        lazy (bool): if True, tokens will be created only when they are accessed. (False)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Dict[str, Chain] or Dict[str, dict]: token balances.
+        ::
+
+            {
+                'eth': Chain(..., tokens=...),
+                'bsc': Chain(..., tokens=...)
+            }
+
+    """
+    client = client or get_default_client()
+    chain_dict = await client.call(call=client.backend.cache_balance_list(address=address), proxies=proxies)
+    if not raw_data:
+        chain_class = LazyChain if lazy else Chain
+        chain_dict = sort_by_usd_value(
+            instances={name: chain_class(name=name, tokens=tokens) for name, tokens in chain_dict.items()}
+        )
+
+    return chain_dict
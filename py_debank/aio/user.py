@@ -0,0 +1,68 @@
+from typing import Optional, List
+
+from py_debank.aio.client import AsyncDebankClient, get_default_client
+from py_debank.models import Info, User, Entrypoints
+
+
+async def addr(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[AsyncDebankClient] = None
+) -> User:
+    """
+    Get a DeBank user.
+
+    Args:
+        address (str): an address.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        User: the DeBank user.
+
+    """
+    client = client or get_default_client()
+    return User(data=await client.call(call=client.backend.addr(address=address), proxies=proxies))
+
+
+async def info(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[AsyncDebankClient] = None
+) -> Info:
+    """
+    Get an information about a DeBank user.
+
+    Args:
+        address (str): an address.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Info: the information about the DeBank user.
+
+    """
+    client = client or get_default_client()
+    params = {
+        'id': address
+    }
+    json_response = await client.get(url=Entrypoints.PUBLIC.ENTRYPOINT + 'hi/user/info', params=params, proxies=proxies)
+    return Info(data=json_response['data'])
+
+
+async def total_balance(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[AsyncDebankClient] = None
+) -> float:
+    """
+    Get a total balance of an address.
+
+    Args:
+        address (str): an address.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        float: the total balance.
+
+    """
+    client = client or get_default_client()
+    return await client.call(call=client.backend.total_balance(address=address), proxies=proxies)
@@ -0,0 +1,90 @@
+import time
+from typing import Optional, List, Dict, Iterable
+
+from py_debank.aio import custom
+from py_debank.aio import history
+from py_debank.aio.client import AsyncDebankClient, get_default_client
+from py_debank.aio.price_service import AsyncPriceService
+from py_debank.models import Chain, Curve, Tx
+from py_debank.valuation import ValuationEngine
+
+
+class AsyncValuationEngine(ValuationEngine):
+    """
+    Builds a net worth curve of an address's wallet tokens by replaying its transaction history backwards from
+    the current balances and valuing the holdings with batched historical prices.
+
+    The curve is extended incrementally: marks that were built are kept, an update values only the new points in time
+    and needs only transactions made after the last mark.
+
+    Attributes:
+        address (str): the address.
+        start_time (int): the time of the first point of the curve.
+        resolution (int): the interval in seconds between points of the curve.
+        price_service (AsyncPriceService): the service for looking up historical prices.
+        marks (List[Mark]): the built points of the curve from older to newer ones.
+        updated_at (Optional[float]): the time of the balances the curve was last updated with.
+
+    """
+
+    def __init__(
+            self, address: str, start_time: int, resolution: int = 3600,
+            price_service: Optional[AsyncPriceService] = None, client: Optional[AsyncDebankClient] = None
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            address (str): the address.
+            start_time (int): the time of the first point of the curve, it's rounded up to the resolution.
+            resolution (int): the interval in seconds between points of the curve. (3600)
+            price_service (Optional[AsyncPriceService]): the service for looking up historical prices. (a new service)
+            client (Optional[AsyncDebankClient]): a client for making requests. (the default client)
+
+        """
+        client = client or get_default_client()
+        super().__init__(
+            address=address, start_time=start_time, resolution=resolution,
+            price_service=price_service or AsyncPriceService(client=client), client=client
+        )
+
+    async def update(
+            self, chains: Dict[str, Chain], txs: Iterable[Tx], now: Optional[float] = None
+    ) -> Optional[Curve]:
+        """
+        Extend the curve up to the time of the current balances.
+
+        Args:
+            chains (Dict[str, Chain]): the current chain balances.
+            txs (Iterable[Tx]): transactions made after the last mark, older ones are ignored.
+            now (Optional[float]): the time of the balances, transactions made after it are ignored. (current time)
+
+        Returns:
+            Optional[Curve]: the built curve.
+
+        """
+        now = now or time.time()
+        times, snapshots, lookups = self._plan(chains=chains, txs=txs, now=now)
+        prices = await self.price_service.get_prices(lookups=lookups)
+        return self._add_marks(times=times, snapshots=snapshots, lookups=lookups, prices=prices, now=now)
+
+    async def refresh(self, proxies: Optional[str or List[str]] = None) -> Optional[Curve]:
+        """
+        Request the current balances and the transactions made after the last mark and extend the curve.
+
+        Args:
+            proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+                requests. (None)
+
+        Returns:
+            Optional[Curve]: the built curve.
+
+        """
+        chains = await custom.current_balance_list(address=self.address, proxies=proxies, client=self.client)
+        now = time.time()
+        txs = [
+            tx async for tx in history.iter_history(
+                address=self.address, until=self.next_time, proxies=proxies, client=self.client
+            )
+        ]
+        return await self.update(chains=chains, txs=txs, now=now)
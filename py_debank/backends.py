@@ -0,0 +1,322 @@
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+from py_debank.models import Entrypoints
+from py_debank.utils import group_by_chain
+
+
+class BackendCall:
+    """
+    The requests of one operation of a backend and the conversion of their responses to the data the models are
+    created from, it doesn't send anything itself, clients send the requests concurrently.
+
+    Attributes:
+        requests (List[Tuple[str, dict]]): URLs and query parameters of the requests.
+        convert (Callable[[List[Any]], Any]): the function that takes the responses in the order of the requests and
+            returns the data in the format of the public API.
+        headers (Optional[Dict[str, str]]): headers added to the requests.
+
+    """
+
+    def __init__(
+            self, requests: List[Tuple[str, dict]], convert: Callable[[List[Any]], Any],
+            headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            requests (List[Tuple[str, dict]]): URLs and query parameters of the requests.
+            convert (Callable[[List[Any]], Any]): the function that takes the responses in the order of the requests
+                and returns the data in the format of the public API.
+            headers (Optional[Dict[str, str]]): headers added to the requests. (None)
+
+        """
+        self.requests: List[Tuple[str, dict]] = requests
+        self.convert: Callable[[List[Any]], Any] = convert
+        self.headers: Optional[Dict[str, str]] = headers
+
+
+class PublicBackend:
+    """
+    Gets address data from the public API used by the DeBank website.
+    """
+
+    def balance_list(self, address: str, chain: str) -> BackendCall:
+        """
+        Get token balances of an address of a certain chain.
+
+        Args:
+            address (str): an address.
+            chain (str): a chain.
+
+        Returns:
+            BackendCall: the call returning a list of tokens.
+
+        """
+        params = {
+            'user_addr': address,
+            'is_all': 'false',
+            'chain': chain
+        }
+        return BackendCall(
+            requests=[(Entrypoints.PUBLIC.TOKEN + 'balance_list', params)],
+            convert=lambda responses: responses[0]['data']
+        )
+
+    def all_balance_list(self, address: str) -> Optional[BackendCall]:
+        """
+        Get current token balances of an address of all chains in one call.
+
+        Args:
+            address (str): an address.
+
+        Returns:
+            Optional[BackendCall]: the call returning tokens by chain or None if the backend can only get them chain
+                by chain.
+
+        """
+        return
+
+    def cache_balance_list(self, address: str) -> BackendCall:
+        """
+        Get token balances of an address of all chains, they may be cached by the API.
+
+        Args:
+            address (str): an address.
+
+        Returns:
+            BackendCall: the call returning tokens by chain.
+
+        """
+        params = {
+            'user_addr': address
+        }
+        return BackendCall(
+            requests=[(Entrypoints.PUBLIC.TOKEN + 'cache_balance_list', params)],
+            convert=lambda responses: group_by_chain(items=responses[0]['data'])
+        )
+
+    def project_list(self, address: str) -> BackendCall:
+        """
+        Get projects where the assets of an address are located.
+
+        Args:
+            address (str): an address.
+
+        Returns:
+            BackendCall: the call returning projects by chain.
+
+        """
+        params = {
+            'user_addr': address
+        }
+        return BackendCall(
+            requests=[(Entrypoints.PUBLIC.PORTFOLIO + 'project_list', params)],
+            convert=lambda responses: group_by_chain(items=responses[0]['data'])
+        )
+
+    def collection_list(self, address: str, chain: str = '') -> Optional[BackendCall]:
+        """
+        Get owned NFT collections of an address.
+
+        Args:
+            address (str): an address.
+            chain (str): a chain. (all chains)
+
+        Returns:
+            Optional[BackendCall]: the call returning collections by chain or None if the backend prepares them in
+                background jobs that are polled by the 'nft' module.
+
+        """
+        return
+
+    def addr(self, address: str) -> BackendCall:
+        """
+        Get a DeBank user.
+
+        Args:
+            address (str): an address.
+
+        Returns:
+            BackendCall: the call returning the user data.
+
+        """
+        params = {
+            'addr': address
+        }
+        return BackendCall(
+            requests=[(Entrypoints.PUBLIC.USER + 'addr', params)],
+            convert=lambda responses: responses[0]['data']
+        )
+
+    def total_balance(self, address: str) -> BackendCall:
+        """
+        Get a total balance of an address.
+
+        Args:
+            address (str): an address.
+
+        Returns:
+            BackendCall: the call returning the total balance.
+
+        """
+        params = {
+            'addr': address
+        }
+        return BackendCall(
+            requests=[(Entrypoints.PUBLIC.USER + 'total_balance', params)],
+            convert=lambda responses: responses[0]['data']['total_usd_value']
+        )
+
+
+class V1Backend(PublicBackend):
+    """
+    Gets address data from the Pro OpenAPI with an access key, all-chain endpoints are used wherever possible, so
+    a wallet is fetched with one request per data type instead of one per chain.
+
+    Attributes:
+        access_key (str): the access key.
+        entrypoint (str): the URL of the API, e.g. of a local stand-in server.
+
+    """
+
+    def __init__(self, access_key: str, entrypoint: Optional[str] = None):
+        """
+        Initialize the class.
+
+        Args:
+            access_key (str): the access key.
+            entrypoint (Optional[str]): the URL of the API, e.g. of a local stand-in server. (Entrypoints.V1)
+
+        """
+        self.access_key: str = access_key
+        self.entrypoint: str = entrypoint or Entrypoints.V1.ENTRYPOINT
+
+    def _call(self, requests: List[Tuple[str, dict]], convert: Callable[[List[Any]], Any]) -> BackendCall:
+        """
+        Make a call of user endpoints authorized with the access key.
+
+        Args:
+            requests (List[Tuple[str, dict]]): endpoint paths, e.g. 'user/token_list', and query parameters.
+            convert (Callable[[List[Any]], Any]): the function converting the responses.
+
+        Returns:
+            BackendCall: the call.
+
+        """
+        return BackendCall(
+            requests=[(self.entrypoint + path, params) for path, params in requests], convert=convert,
+            headers={'AccessKey': self.access_key}
+        )
+
+    def balance_list(self, address: str, chain: str) -> BackendCall:
+        params = {
+            'id': address,
+            'chain_id': chain,
+            'is_all': 'false'
+        }
+        return self._call(requests=[('user/token_list', params)], convert=lambda responses: responses[0])
+
+    def all_balance_list(self, address: str) -> BackendCall:
+        params = {
+            'id': address,
+            'is_all': 'false'
+        }
+        return self._call(
+            requests=[('user/all_token_list', params)], convert=lambda responses: group_by_chain(items=responses[0])
+        )
+
+    def cache_balance_list(self, address: str) -> BackendCall:
+        return self.all_balance_list(address=address)
+
+    def project_list(self, address: str) -> BackendCall:
+        params = {
+            'id': address
+        }
+        return self._call(
+            requests=[('user/all_complex_protocol_list', params)],
+            convert=lambda responses: group_by_chain(items=[to_public_project(data=data) for data in responses[0]])
+        )
+
+    def collection_list(self, address: str, chain: str = '') -> BackendCall:
+        if chain:
+            request = ('user/nft_list', {'id': address, 'chain_id': chain})
+
+        else:
+            request = ('user/all_nft_list', {'id': address})
+
+        return self._call(requests=[request], convert=lambda responses: group_nfts(nfts=responses[0]))
+
+    def addr(self, address: str) -> BackendCall:
+        params = {
+            'id': address
+        }
+        return self._call(
+            requests=[('user/used_chain_list', params), ('user/total_balance', params)],
+            convert=lambda responses: {
+                'id': address.lower(),
+                'used_chains': [chain['id'] for chain in responses[0]],
+                'usd_value': responses[1]['total_usd_value']
+            }
+        )
+
+    def total_balance(self, address: str) -> BackendCall:
+        params = {
+            'id': address
+        }
+        return self._call(
+            requests=[('user/total_balance', params)], convert=lambda responses: responses[0]['total_usd_value']
+        )
+
+
+def to_public_project(data: dict) -> dict:
+    """
+    Convert a protocol of the Pro OpenAPI to the format of the public API, the details of its portfolio items are
+    called 'detail' instead of 'details'.
+
+    Args:
+        data (dict): the protocol.
+
+    Returns:
+        dict: the converted protocol.
+
+    """
+    items = data.get('portfolio_item_list')
+    if not items:
+        return data
+
+    return {
+        **data,
+        'portfolio_item_list': [
+            {**item, 'details': item['detail']} if 'detail' in item and 'details' not in item else item
+            for item in items
+        ]
+    }
+
+
+def group_nfts(nfts: List[dict]) -> Dict[str, List[dict]]:
+    """
+    Group NFTs of the Pro OpenAPI into collections of the public API by chain.
+
+    Args:
+        nfts (List[dict]): the NFTs.
+
+    Returns:
+        Dict[str, List[dict]]: the collections with the 'nft_list' by chain.
+
+    """
+    collections = {}
+    for nft in nfts:
+        collection_id = nft.get('collection_id') or nft.get('contract_id')
+        key = (nft['chain'], collection_id)
+        if key not in collections:
+            collections[key] = {
+                'chain': nft['chain'],
+                'id': collection_id,
+                'name': nft.get('collection_name') or nft.get('contract_name'),
+                'nft_list': []
+            }
+
+        collections[key]['nft_list'].append(nft)
+
+    return group_by_chain(items=list(collections.values()))
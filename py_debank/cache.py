@@ -0,0 +1,279 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple, Set
+from urllib.parse import urlparse
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+DEFAULT_TTLS: Dict[str, float] = {
+    'asset/net_curve_24h': 60,
+    'hi/user/info': 300,
+    'history/list': 60,
+    'history/token_price': 3600,
+    'nft/collection_list': 300,
+    'nft/history_collection_list': 300,
+    'nft/history_list': 60,
+    'nft/used_chains': 3600,
+    'portfolio/project_list': 30,
+    'token/balance_list': 15,
+    'token/cache_balance_list': 15,
+    'user/addr': 60,
+    'user/total_balance': 15,
+    'v1/user/all_complex_protocol_list': 30,
+    'v1/user/all_nft_list': 300,
+    'v1/user/all_token_list': 15,
+    'v1/user/nft_list': 300,
+    'v1/user/token_list': 15,
+    'v1/user/total_balance': 15,
+    'v1/user/used_chain_list': 3600
+}
+ADDRESS_PARAMS = ('user_addr', 'addr', 'id')
+
+_ENTRY_OVERHEAD = 200
+
+
+def get_endpoint(url: str) -> str:
+    """
+    Get the endpoint of a URL, e.g. 'nft/used_chains' for 'https://api.debank.com/nft/used_chains'.
+
+    Args:
+        url (str): the URL.
+
+    Returns:
+        str: the endpoint.
+
+    """
+    return urlparse(url).path.strip('/')
+
+
+class CacheStats(AutoRepr):
+    def __init__(self, hits: int, misses: int, evictions: int, expirations: int, entries: int, memory: int):
+        self.hits: int = hits
+        self.misses: int = misses
+        self.evictions: int = evictions
+        self.expirations: int = expirations
+        self.entries: int = entries
+        self.memory: int = memory
+
+
+class _Entry:
+    """
+    A cached response.
+
+    Attributes:
+        content (bytes): the body of the response.
+        expires_at (float): when the entry expires.
+        size (int): the approximate memory the entry takes in bytes.
+        addresses (Tuple[str, ...]): the addresses the response belongs to.
+
+    """
+
+    def __init__(self, content: bytes, expires_at: float, size: int, addresses: Tuple[str, ...]):
+        self.content: bytes = content
+        self.expires_at: float = expires_at
+        self.size: int = size
+        self.addresses: Tuple[str, ...] = addresses
+
+
+class ResponseCache:
+    """
+    A thread-safe in-memory cache of successful responses with per-endpoint TTLs and LRU eviction.
+
+    Responses are kept as raw bodies and decoded on every hit, so callers never share mutable data.
+
+    Attributes:
+        ttls (Dict[str, float]): TTLs in seconds of endpoints, e.g. {'nft/used_chains': 3600}, 0 disables caching.
+        default_ttl (float): the TTL in seconds of endpoints that aren't in the TTLs.
+        max_entries (int): the maximum number of cached responses.
+        max_memory (int): the maximum memory in bytes cached responses may take.
+
+    """
+
+    def __init__(
+            self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 30.0, max_entries: int = 10_000,
+            max_memory: int = 64 * 1024 * 1024
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            ttls (Optional[Dict[str, float]]): TTLs in seconds of endpoints, e.g. {'nft/used_chains': 3600}, they
+                override the default ones, 0 disables caching. (DEFAULT_TTLS)
+            default_ttl (float): the TTL in seconds of endpoints that aren't in the TTLs. (30)
+            max_entries (int): the maximum number of cached responses. (10000)
+            max_memory (int): the maximum memory in bytes cached responses may take. (64 MiB)
+
+        """
+        self.ttls: Dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl: float = default_ttl
+        self.max_entries: int = max_entries
+        self.max_memory: int = max_memory
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._address_keys: Dict[str, Set[tuple]] = {}
+        self._memory: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, url: str) -> float:
+        """
+        Get the TTL of a URL.
+
+        Args:
+            url (str): the URL.
+
+        Returns:
+            float: the TTL in seconds.
+
+        """
+        return self.ttls.get(get_endpoint(url), self.default_ttl)
+
+    @staticmethod
+    def _make_key(url: str, params: Optional[dict]) -> tuple:
+        return url, tuple(sorted((key, str(value)) for key, value in (params or {}).items()))
+
+    @staticmethod
+    def is_cacheable(response: dict) -> bool:
+        """
+        Check if a decoded response may be cached, responses of unfinished background jobs may not.
+
+        Args:
+            response (dict): the json-encoded content of a response.
+
+        Returns:
+            bool: True if the response may be cached.
+
+        """
+        if not isinstance(response, dict):
+            return True
+
+        data = response.get('data')
+        return not (isinstance(data, dict) and data.get('job'))
+
+    def get(self, url: str, params: Optional[dict] = None) -> Optional[bytes]:
+        """
+        Get a cached response.
+
+        Args:
+            url (str): the URL.
+            params (Optional[dict]): the query parameters. (None)
+
+        Returns:
+            Optional[bytes]: the body of the response or None if it isn't cached or has expired.
+
+        """
+        key = self._make_key(url=url, params=params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.expires_at <= time.monotonic():
+                self._remove(key=key)
+                self._expirations += 1
+                entry = None
+
+            if not entry:
+                self._misses += 1
+                return
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.content
+
+    def set(self, url: str, params: Optional[dict], content: bytes) -> None:
+        """
+        Cache a response.
+
+        Args:
+            url (str): the URL.
+            params (Optional[dict]): the query parameters.
+            content (bytes): the body of the response.
+
+        """
+        ttl = self.get_ttl(url=url)
+        if ttl <= 0:
+            return
+
+        key = self._make_key(url=url, params=params)
+        size = len(content) + sys.getsizeof(url) + _ENTRY_OVERHEAD
+        if size > self.max_memory:
+            return
+
+        addresses = tuple(
+            str(params[name]).lower() for name in ADDRESS_PARAMS if params and params.get(name)
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key=key)
+
+            self._entries[key] = _Entry(
+                content=content, expires_at=time.monotonic() + ttl, size=size, addresses=addresses
+            )
+            self._memory += size
+            for address in addresses:
+                self._address_keys.setdefault(address, set()).add(key)
+
+            while len(self._entries) > self.max_entries or self._memory > self.max_memory:
+                self._remove(key=next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: tuple) -> None:
+        """
+        Remove an entry, the lock must be held.
+
+        Args:
+            key (tuple): the key of the entry.
+
+        """
+        entry = self._entries.pop(key)
+        self._memory -= entry.size
+        for address in entry.addresses:
+            keys = self._address_keys.get(address)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self._address_keys[address]
+
+    def invalidate(self, address: Optional[str] = None) -> int:
+        """
+        Remove cached responses of an address or all cached responses.
+
+        Args:
+            address (Optional[str]): the address. (all responses)
+
+        Returns:
+            int: the number of removed responses.
+
+        """
+        with self._lock:
+            if address is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._address_keys.clear()
+                self._memory = 0
+                return removed
+
+            keys = list(self._address_keys.get(address.lower(), ()))
+            for key in keys:
+                self._remove(key=key)
+
+            return len(keys)
+
+    def stats(self) -> CacheStats:
+        """
+        Get statistics of the cache.
+
+        Returns:
+            CacheStats: the statistics.
+
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, evictions=self._evictions, expirations=self._expirations,
+                entries=len(self._entries), memory=self._memory
+            )
@@ -0,0 +1,144 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Optional, List
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+
+class Checkpoint(AutoRepr):
+    def __init__(self, address: str, chain: str, time_at: float, tx_ids: List[str], updated_at: float):
+        self.address: str = address
+        self.chain: str = chain
+        self.time_at: float = time_at
+        self.tx_ids: List[str] = tx_ids
+        self.updated_at: float = updated_at
+
+
+class CheckpointStore:
+    """
+    An on-disk SQLite store of per-address history checkpoints used by the incremental history sync.
+
+    A checkpoint keeps the time of the newest synced transaction of an address on a chain and the IDs of all synced
+    transactions with this time, so that transactions on the boundary are not returned twice.
+
+    Attributes:
+        path (str): the path to the database file.
+
+    """
+
+    def __init__(self, path: str = 'py_debank_checkpoints.sqlite3'):
+        """
+        Initialize the class.
+
+        Args:
+            path (str): the path to the database file. ('py_debank_checkpoints.sqlite3')
+
+        """
+        self.path: str = path
+        self._local = threading.local()
+
+        connection = self._get_connection()
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS checkpoints ('
+            'address TEXT NOT NULL, chain TEXT NOT NULL, time_at REAL NOT NULL, tx_ids TEXT NOT NULL, '
+            'updated_at REAL NOT NULL, PRIMARY KEY (address, chain))'
+        )
+        connection.commit()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the database connection of the current thread, it is created on the first call.
+
+        Returns:
+            sqlite3.Connection: the connection.
+
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+
+        return connection
+
+    def close(self) -> None:
+        """
+        Close the database connection of the current thread.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def get(self, address: str, chain: str = '') -> Optional[Checkpoint]:
+        """
+        Get the checkpoint of an address.
+
+        Args:
+            address (str): the address.
+            chain (str): the chain. (all chains)
+
+        Returns:
+            Optional[Checkpoint]: the checkpoint or None if the address wasn't synced.
+
+        """
+        address = address.lower()
+        row = self._get_connection().execute(
+            'SELECT time_at, tx_ids, updated_at FROM checkpoints WHERE address = ? AND chain = ?', (address, chain)
+        ).fetchone()
+        if not row:
+            return
+
+        return Checkpoint(address=address, chain=chain, time_at=row[0], tx_ids=json.loads(row[1]), updated_at=row[2])
+
+    def set(self, address: str, chain: str, time_at: float, tx_ids: List[str]) -> Checkpoint:
+        """
+        Save the checkpoint of an address.
+
+        Args:
+            address (str): the address.
+            chain (str): the chain, an empty string for all chains.
+            time_at (float): the time of the newest synced transaction.
+            tx_ids (List[str]): the IDs of synced transactions with this time.
+
+        Returns:
+            Checkpoint: the checkpoint.
+
+        """
+        checkpoint = Checkpoint(
+            address=address.lower(), chain=chain, time_at=float(time_at), tx_ids=list(tx_ids), updated_at=time.time()
+        )
+        connection = self._get_connection()
+        connection.execute(
+            'INSERT OR REPLACE INTO checkpoints (address, chain, time_at, tx_ids, updated_at) VALUES (?, ?, ?, ?, ?)',
+            (checkpoint.address, chain, checkpoint.time_at, json.dumps(checkpoint.tx_ids), checkpoint.updated_at)
+        )
+        connection.commit()
+        return checkpoint
+
+    def remove(self, address: str, chain: Optional[str] = None) -> int:
+        """
+        Remove checkpoints of an address, so that its history is synced from scratch.
+
+        Args:
+            address (str): the address.
+            chain (Optional[str]): the chain, an empty string for all chains. (checkpoints of all chains)
+
+        Returns:
+            int: the number of removed checkpoints.
+
+        """
+        connection = self._get_connection()
+        if chain is None:
+            cursor = connection.execute('DELETE FROM checkpoints WHERE address = ?', (address.lower(),))
+
+        else:
+            cursor = connection.execute(
+                'DELETE FROM checkpoints WHERE address = ? AND chain = ?', (address.lower(), chain)
+            )
+
+        connection.commit()
+        return cursor.rowcount
@@ -0,0 +1,450 @@
+import contextlib
+import copy
+import functools
+import importlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Iterable, Mapping, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from py_debank.backends import BackendCall, PublicBackend
+from py_debank.cache import ResponseCache
+from py_debank.decoders import JsonDecoder, get_default_decoder
+from py_debank.header_provider import HeaderProvider, get_default_header_provider
+from py_debank.job_poller import JobPoller
+from py_debank.persistent_cache import PersistentCache
+from py_debank.proxy_pool import ProxyPool
+from py_debank.rate_limiter import RateLimiter
+from py_debank.retry import RetryPolicy
+from py_debank.utils import choose_proxy, get_proxy_dict, check_response, parse_response
+
+_MAX_PROXY_POOLS = 64
+
+
+def _takes_client(function: Callable) -> bool:
+    """
+    Check if a function has a 'client' parameter.
+
+    Args:
+        function (Callable): the function.
+
+    Returns:
+        bool: True if it has.
+
+    """
+    try:
+        return 'client' in inspect.signature(function).parameters
+
+    except (TypeError, ValueError):
+        return False
+
+
+class _BoundModule:
+    """
+    An endpoint module whose endpoint functions, the ones with a 'client' parameter, are bound to a client.
+
+    Attributes:
+        _client (DebankClient): the client the functions are bound to.
+        _module_name (str): the name of the endpoint module.
+
+    """
+
+    def __init__(self, client: 'DebankClient', module_name: str):
+        self._client: DebankClient = client
+        self._module_name: str = module_name
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(importlib.import_module(f'py_debank.{self._module_name}'), name)
+        if callable(attribute) and not isinstance(attribute, type) and _takes_client(function=attribute):
+            return functools.partial(attribute, client=self._client)
+
+        return attribute
+
+    def __dir__(self) -> List[str]:
+        return dir(importlib.import_module(f'py_debank.{self._module_name}'))
+
+
+class DebankClient:
+    """
+    A client that owns a pooled keep-alive HTTP session and sends all requests to the DeBank API through it.
+
+    All endpoint functions are available through the module attributes, e.g.
+    `client.token.balance_list(address=address, chain='eth')`.
+
+    Attributes:
+        session (requests.Session): the pooled HTTP session.
+        proxies (Optional[str or ProxyPool]): an HTTP proxy or a proxy pool for making requests.
+        timeout (Optional[float]): how many seconds to wait for the server to send data.
+        max_workers (int): the maximum number of requests sent concurrently by one function call, e.g. one per chain.
+        max_concurrency (Optional[int]): the maximum number of requests in flight at the same time across all calls.
+        rate_limiter (Optional[RateLimiter]): the limiter that paces requests before they are sent.
+        retry_policy (RetryPolicy): the policy of retrying failed requests.
+        job_poller (JobPoller): the poller of NFT endpoints that prepare data in a background job.
+        cache (Optional[ResponseCache]): the cache of responses shared by all endpoint functions.
+        persistent_cache (Optional[PersistentCache]): the on-disk cache of immutable responses, e.g. historical token
+            prices.
+        header_provider (HeaderProvider): the provider of request headers.
+        decoder (JsonDecoder): the decoder of response bodies.
+        backend (PublicBackend): the backend describing the requests of address data, the public or the Pro API.
+        asset (_BoundModule): the 'asset' functions.
+        custom (_BoundModule): the 'custom' functions.
+        history (_BoundModule): the 'history' functions.
+        nft (_BoundModule): the 'nft' functions.
+        portfolio (_BoundModule): the 'portfolio' functions.
+        token (_BoundModule): the 'token' functions.
+        user (_BoundModule): the 'user' functions.
+
+    """
+
+    def __init__(
+            self, proxies: Optional[str or List[str] or ProxyPool] = None, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = 30, max_workers: int = 8, max_concurrency: Optional[int] = None,
+            rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+            job_poller: Optional[JobPoller] = None, cache: Optional[ResponseCache] = None,
+            persistent_cache: Optional[PersistentCache] = None, header_provider: Optional[HeaderProvider] = None,
+            pool_connections: int = 10, pool_maxsize: int = 32, decoder: Optional[JsonDecoder] = None,
+            backend: Optional[PublicBackend] = None
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list or a proxy pool for making
+                requests, lists are turned into proxy pools that prefer healthy proxies. (None)
+            headers (Optional[Dict[str, str]]): headers that will be added to every request. (None)
+            timeout (Optional[float]): how many seconds to wait for the server to send data. (30)
+            max_workers (int): the maximum number of requests sent concurrently by one function call, e.g. one per
+                chain. (8)
+            max_concurrency (Optional[int]): the maximum number of requests in flight at the same time across all
+                calls. (unlimited)
+            rate_limiter (Optional[RateLimiter]): the limiter that paces requests before they are sent. (None)
+            retry_policy (Optional[RetryPolicy]): the policy of retrying failed requests. (3 attempts with backoff)
+            job_poller (Optional[JobPoller]): the poller of NFT endpoints that prepare data in a background job.
+                (adaptive polling with a 30-second deadline)
+            cache (Optional[ResponseCache]): the cache of responses shared by all endpoint functions. (None)
+            persistent_cache (Optional[PersistentCache]): the on-disk cache of immutable responses, e.g. historical
+                token prices. (None)
+            header_provider (Optional[HeaderProvider]): the provider of request headers. (the shared pool of Chrome
+                header sets)
+            pool_connections (int): the number of connection pools to cache. (10)
+            pool_maxsize (int): the maximum number of connections to keep in a pool. (32)
+            decoder (Optional[JsonDecoder]): the decoder of response bodies. (the fastest installed JSON library)
+            backend (Optional[PublicBackend]): the backend describing the requests of address data, e.g.
+                'V1Backend' for the Pro API with an access key. (the public API)
+
+        """
+        self.proxies: Optional[str or ProxyPool] = ProxyPool(proxies=proxies) if isinstance(proxies, list) else proxies
+        self.timeout: Optional[float] = timeout
+        self.max_workers: int = max_workers
+        self.max_concurrency: Optional[int] = max_concurrency
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.job_poller: JobPoller = job_poller or JobPoller()
+        self.cache: Optional[ResponseCache] = cache
+        self.persistent_cache: Optional[PersistentCache] = persistent_cache
+        self.header_provider: HeaderProvider = header_provider or get_default_header_provider()
+        self.decoder: JsonDecoder = decoder or get_default_decoder()
+        self.backend: PublicBackend = backend or PublicBackend()
+        self._proxy_pools: OrderedDict[Tuple[str, ...], ProxyPool] = OrderedDict()
+        self._proxy_pools_lock = threading.Lock()
+        self._semaphore: Optional[threading.BoundedSemaphore] = None
+        if max_concurrency:
+            self._semaphore = threading.BoundedSemaphore(max_concurrency)
+
+        self.session: requests.Session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        self._bind_modules()
+
+    def _bind_modules(self) -> None:
+        """
+        Bind the endpoint modules to the client.
+        """
+        self.asset: _BoundModule = _BoundModule(client=self, module_name='asset')
+        self.custom: _BoundModule = _BoundModule(client=self, module_name='custom')
+        self.history: _BoundModule = _BoundModule(client=self, module_name='history')
+        self.nft: _BoundModule = _BoundModule(client=self, module_name='nft')
+        self.portfolio: _BoundModule = _BoundModule(client=self, module_name='portfolio')
+        self.token: _BoundModule = _BoundModule(client=self, module_name='token')
+        self.user: _BoundModule = _BoundModule(client=self, module_name='user')
+
+    def __enter__(self) -> 'DebankClient':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the HTTP session and all its connections.
+        """
+        self.session.close()
+
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> 'DebankClient':
+        """
+        Get a copy of the client with another retry policy, it shares the session, proxies and limits with the original.
+
+        Args:
+            retry_policy (RetryPolicy): the policy of retrying failed requests.
+
+        Returns:
+            DebankClient: the copy of the client.
+
+        """
+        client = copy.copy(self)
+        client.retry_policy = retry_policy
+        client._bind_modules()
+        return client
+
+    def fan_out(self, function: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Call a function for each item concurrently using no more than 'max_workers' threads.
+
+        Args:
+            function (Callable[[Any], Any]): the function that takes an item.
+            items (Iterable[Any]): the items.
+
+        Returns:
+            List[Any]: the results in the same order as the items.
+
+        """
+        items = list(items)
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [function(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(function, items))
+
+    def resolve_proxies(
+            self, proxies: Optional[str or List[str] or ProxyPool] = None
+    ) -> Optional[str or ProxyPool]:
+        """
+        Get the proxies of a request, a proxy list is replaced with the pool the client keeps for it, so health of its
+        proxies is tracked across calls. The pools of the least recently used lists are dropped when there are more
+        than '_MAX_PROXY_POOLS' of them.
+
+        Args:
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list or a proxy pool.
+                (the client proxies)
+
+        Returns:
+            Optional[str or ProxyPool]: an HTTP proxy or a proxy pool.
+
+        """
+        proxies = proxies or self.proxies
+        if not isinstance(proxies, list):
+            return proxies
+
+        key = tuple(proxies)
+        with self._proxy_pools_lock:
+            pool = self._proxy_pools.get(key)
+            if pool is None:
+                pool = self._proxy_pools[key] = ProxyPool(proxies=proxies)
+                if len(self._proxy_pools) > _MAX_PROXY_POOLS:
+                    self._proxy_pools.popitem(last=False)
+
+            else:
+                self._proxy_pools.move_to_end(key)
+
+        return pool
+
+    def _get_pools(self, proxies: Optional[str or ProxyPool], proxy: Optional[str]) -> List[ProxyPool]:
+        """
+        Get the pools to report the result of a request through a proxy to, the health of a proxy is the same in
+        every pool it belongs to.
+
+        Args:
+            proxies (Optional[str or ProxyPool]): the resolved proxies of the request.
+            proxy (Optional[str]): the chosen proxy.
+
+        Returns:
+            List[ProxyPool]: the pools.
+
+        """
+        if not proxy:
+            return []
+
+        with self._proxy_pools_lock:
+            pools = [proxies, self.proxies, *self._proxy_pools.values()]
+        unique = {id(pool): pool for pool in pools if isinstance(pool, ProxyPool) and proxy in pool}
+        return list(unique.values())
+
+    def call(self, call: BackendCall, proxies: Optional[str or List[str] or ProxyPool] = None) -> Any:
+        """
+        Send the requests of a backend call concurrently and convert their responses.
+
+        Args:
+            call (BackendCall): the call.
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for health-weighted choice or
+                a proxy pool for making requests. (the client proxies)
+
+        Returns:
+            Any: the data of the call.
+
+        """
+        responses = self.fan_out(
+            lambda request: self.get(url=request[0], params=request[1], proxies=proxies, headers=call.headers),
+            call.requests
+        )
+        return call.convert(responses)
+
+    def get(
+            self, url: str, params: dict, proxies: Optional[str or List[str] or ProxyPool] = None,
+            retry_policy: Optional[RetryPolicy] = None, persistent: bool = False,
+            headers: Optional[Dict[str, str]] = None
+    ) -> dict:
+        """
+        Send a GET request and check its response, retrying transient failures through other proxies, or get
+        the response from the cache.
+
+        Args:
+            url (str): the URL.
+            params (dict): the query parameters.
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for health-weighted choice or
+                a proxy pool for making a request. (the client proxies)
+            retry_policy (Optional[RetryPolicy]): the policy of retrying failed requests. (the client policy)
+            persistent (bool): whether the response is immutable and may be kept in the persistent cache. (False)
+            headers (Optional[Dict[str, str]]): headers added to the ones of the header provider. (None)
+
+        Returns:
+            dict: the json-encoded content of a response.
+
+        """
+        if self.cache is not None:
+            content = self.cache.get(url=url, params=params)
+            if content is not None:
+                return parse_response(status_code=200, content=content, decoder=self.decoder)
+
+        persistent = persistent and self.persistent_cache is not None
+        if persistent:
+            content = self.persistent_cache.get(url=url, params=params)
+            if content is not None:
+                return parse_response(status_code=200, content=content, decoder=self.decoder)
+
+        retry_policy = retry_policy or self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                return self._send(
+                    url=url, params=params, proxies=proxies, persistent=persistent, headers=headers
+                )
+
+            except Exception as e:
+                if not retry_policy.should_retry(attempt=attempt, exception=e):
+                    raise
+
+                time.sleep(retry_policy.get_delay(attempt=attempt, exception=e))
+                attempt += 1
+
+    def _send(
+            self, url: str, params: dict, proxies: Optional[str or List[str] or ProxyPool] = None,
+            persistent: bool = False, headers: Optional[Dict[str, str]] = None
+    ) -> dict:
+        """
+        Send a GET request once and check its response.
+
+        Args:
+            url (str): the URL.
+            params (dict): the query parameters.
+            proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for health-weighted choice or
+                a proxy pool for making a request. (the client proxies)
+            persistent (bool): whether the response is immutable and may be kept in the persistent cache. (False)
+            headers (Optional[Dict[str, str]]): headers added to the ones of the header provider. (None)
+
+        Returns:
+            dict: the json-encoded content of a response.
+
+        """
+        proxies = self.resolve_proxies(proxies=proxies)
+        proxy = choose_proxy(proxies=proxies)
+        pools = self._get_pools(proxies=proxies, proxy=proxy)
+        if self.rate_limiter:
+            delay = self.rate_limiter.reserve(url=url, proxy=proxy)
+            if delay > 0:
+                time.sleep(delay)
+
+        with self._semaphore or contextlib.nullcontext():
+            started_at = time.monotonic()
+            try:
+                response = self.session.get(
+                    url=url, params=params, headers=self._get_headers(proxy=proxy, headers=headers),
+                    proxies=get_proxy_dict(proxies=proxy), timeout=self.timeout
+                )
+
+            except requests.RequestException:
+                for pool in pools:
+                    pool.report(proxy=proxy, error=True)
+
+                raise
+
+        for pool in pools:
+            pool.report(proxy=proxy, latency=time.monotonic() - started_at, status_code=response.status_code)
+
+        json_response = check_response(response=response, decoder=self.decoder)
+        if self.cache is not None and self.cache.is_cacheable(response=json_response):
+            self.cache.set(url=url, params=params, content=response.content)
+
+        if persistent:
+            self.persistent_cache.set(url=url, params=params, content=response.content)
+
+        return json_response
+
+    def _get_headers(self, proxy: Optional[str], headers: Optional[Dict[str, str]] = None) -> Mapping[str, str]:
+        """
+        Get headers of a request.
+
+        Args:
+            proxy (Optional[str]): the proxy the request is sent through.
+            headers (Optional[Dict[str, str]]): headers added to the ones of the header provider. (None)
+
+        Returns:
+            Mapping[str, str]: the headers.
+
+        """
+        provided = self.header_provider.get(proxy=proxy)
+        if not headers:
+            return provided
+
+        return {**provided, **headers}
+
+
+_default_client: Optional[DebankClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> DebankClient:
+    """
+    Get the client used by the module-level functions, it is created on the first call.
+
+    Returns:
+        DebankClient: the default client.
+
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = DebankClient()
+
+    return _default_client
+
+
+def set_default_client(client: Optional[DebankClient]) -> None:
+    """
+    Replace the client used by the module-level functions.
+
+    Args:
+        client (Optional[DebankClient]): the new default client, if None, it will be created on the next call.
+
+    """
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
@@ -0,0 +1,97 @@
+"""
+Memory-compact variants of the models.
+
+The classes have the same names, attributes, methods and repr as the ones in 'models', but instances of Token, NFT,
+Collection, Tx, NFTTx, PortfolioItem and Project store attributes in '__slots__' instead of a per-instance '__dict__'.
+The containers (Chain, History, NFTHistory) and ModelRegistry create the compact classes, so a whole tree can be kept
+compact, e.g. `compact_models.Chain(name='eth', tokens=token.balance_list(..., raw_data=True)['eth'])`.
+
+The classes share the parsing logic with the regular models through the base classes of 'models', so e.g.
+`isinstance(token, models.BaseToken)` holds for both variants.
+"""
+import sys
+from typing import Any
+
+from py_debank import models
+
+
+class CompactModel(models.Model):
+    __slots__ = ()
+    _models: Any = sys.modules[__name__]
+
+    def __repr__(self) -> str:
+        values = (
+            '{}={!r}'.format(slot, getattr(self, slot)) for slot in self.__slots__ if hasattr(self, slot)
+        )
+        return '{}({})'.format(self.__class__.__name__, ', '.join(values))
+
+
+class Token(models.BaseToken, CompactModel):
+    __slots__ = (
+        'chain', 'symbol', 'usd_value', 'amount', 'price', 'decimals', 'display_symbol', 'id', 'is_core',
+        'is_verified', 'is_wallet', 'logo_url', 'name', 'optimized_symbol', 'protocol_id', 'timestamp'
+    )
+
+
+class PortfolioItem(models.BasePortfolioItem, CompactModel):
+    __slots__ = (
+        'name', 'asset_usd_value', 'debt_usd_value', 'net_usd_value', 'tokens', 'asset_dict', 'detail_types', 'pool',
+        'position_index', 'proxy_detail', 'update_at'
+    )
+
+
+class Project(models.BaseProject, CompactModel):
+    __slots__ = (
+        'chain', 'name', 'site_url', 'tvl', 'usd_value', 'portfolio_item_list', 'has_supported_portfolio', 'id',
+        'is_tvl', 'is_visible_in_defi', 'logo_url', 'platform_token_id', 'tag_ids'
+    )
+
+
+class Collection(models.BaseCollection, CompactModel):
+    __slots__ = (
+        'chain', 'name', 'id', 'nft_amount', 'spent_token', 'avg_price_24h', 'avg_price_last_24h', 'floor_price',
+        'floor_price_24h', 'max_price_24h', 'max_price_last_24h', 'volume_24h', 'volume_last_24h', 'description',
+        'is_core', 'is_visible', 'logo_url', 'rank_at', 'thirdparty'
+    )
+
+
+class NFT(models.BaseNFT, CompactModel):
+    __slots__ = (
+        'chain', 'collection', 'name', 'contract_id', 'usd_spent', 'amount', 'mint_gas_token', 'mint_pay_token',
+        'pay_token', 'content', 'content_type', 'detail_url', 'id', 'inner_id', 'minter', 'thumbnail_url'
+    )
+
+
+class NFTTx(models.BaseNFTTx, CompactModel):
+    __slots__ = ('chain', 'type', 'tx_id', 'timestamp', 'address', 'nft', 'pay_token', 'id')
+
+
+class Tx(models.BaseTx, CompactModel):
+    __slots__ = (
+        'chain', 'type', 'tx_id', 'timestamp', 'sender', 'recipient', 'receives', 'sends', 'token_approve',
+        'eth_gas_fee', 'usd_gas_fee', 'project'
+    )
+
+
+class TxToken(models.TxItem, Token):
+    __slots__ = ('prototype',)
+
+
+class TxNFT(models.TxItem, NFT):
+    __slots__ = ('prototype',)
+
+
+class Chain(models.Chain):
+    _models: Any = sys.modules[__name__]
+
+
+class History(models.History):
+    _models: Any = sys.modules[__name__]
+
+
+class NFTHistory(models.NFTHistory):
+    _models: Any = sys.modules[__name__]
+
+
+class ModelRegistry(models.ModelRegistry):
+    _models: Any = sys.modules[__name__]
@@ -1,15 +1,24 @@
-from typing import Dict, Optional, List
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import Dict, Optional, List, Iterable, Iterator
 
+from py_debank import history
 from py_debank import nft
 from py_debank import portfolio
 from py_debank import token
-from py_debank.models import Chain, ChainNames
+from py_debank import user
+from py_debank.client import DebankClient, get_default_client
+from py_debank.models import Chain, ChainNames, Freshness, LazyChain, Operations, ScanResult, User
 from py_debank.token import balance_list
 from py_debank.user import addr
+from py_debank.utils import sort_by_usd_value
 
 
 def get_balance(
-        address: str, chain: ChainNames or str = '', parse_nfts: bool = True, proxies: Optional[str or List[str]] = None
+        address: str, chain: ChainNames or str = '', parse_nfts: bool = True,
+        proxies: Optional[str or List[str]] = None, lazy: bool = False, client: Optional[DebankClient] = None,
+        freshness: str = Freshness.FRESH, tolerance: float = 0.05
 ) -> Dict[str, Chain]:
     """
     Get the following information of an address of one or all chains:
@@ -24,61 +33,50 @@ def get_balance(
         parse_nfts (bool): whether to parse NFT, it leads to a high probability of "429 Too Many Requests" error. (True)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        lazy (bool): if True, tokens, projects and NFTs will be created only when they are accessed. (False)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
+        freshness (str): how fresh token balances of all chains have to be, see 'current_balance_list'. (fresh)
+        tolerance (float): the allowed relative drift of cached token balances in the 'auto' mode. (0.05)
 
     Returns:
         Chain: the address information.
 
     """
-    chains: Dict[str, Chain] = {}
-    if chain:
-        tokens = token.balance_list(address=address, chain=chain, proxies=proxies)
-        chains.update({chain: tokens})
+    operations = [Operations.BALANCES, Operations.PROJECTS]
+    if parse_nfts:
+        operations.append(Operations.NFTS)
 
-        if parse_nfts:
-            nfts = nft.collection_list(address=address, chain=chain, raw_data=True, proxies=proxies)
-            if nfts:
-                chains[chain].parse_nfts(nfts[chain])
-
-        projects = portfolio.project_list(address=address, raw_data=True, proxies=proxies)
-        if chain in projects:
-            chains[chain].parse_projects(projects[chain])
-
-    else:
-        tokens = current_balance_list(address=address, proxies=proxies)
-        chains.update(tokens)
-
-        if parse_nfts:
-            nfts = nft.collection_list(address=address, raw_data=True, proxies=proxies)
-            for name, nft_dict in nfts.items():
-                if name in chains:
-                    chains[name].parse_nfts(nft_dict)
-
-                else:
-                    chains[name] = Chain(name=name, tokens=nft_dict)
-
-        projects = portfolio.project_list(address=address, raw_data=True, proxies=proxies)
-        for name, project_dict in projects.items():
-            if name in chains:
-                chains[name].parse_projects(project_dict)
-
-            else:
-                chains[name] = Chain(name=name, projects=project_dict)
-
-    chains = {key: value for key, value in sorted(chains.items(), key=lambda item: item[1].usd_value, reverse=True)}
-    return chains
+    return _get_chains(
+        address=address, chain=chain, operations=operations, proxies=proxies, lazy=lazy,
+        client=client or get_default_client(), freshness=freshness, tolerance=tolerance
+    )
 
 
 def current_balance_list(
-        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[DebankClient] = None, freshness: str = Freshness.FRESH,
+        tolerance: float = 0.05
 ) -> Dict[str, Chain] or Dict[str, dict]:
     """
-    Get current token balances of an address of all chains.
+    Get current token balances of an address of all chains, with one request if the client backend has
+    an all-chain endpoint or according to the freshness policy otherwise:
+
+    - 'fresh': the user and one balance list per used chain are requested
+    - 'cached': only the cached balances of all chains are requested, they may be outdated
+    - 'auto': the cached balances and the user are requested together, if the value of the cached balances differs
+      from the wallet value of the user by more than 'tolerance' or the wallet value is unknown, the used chains
+      missing from the cache are requested and, if the balances still drift, so are the other used chains
 
     Args:
         address (str): an address.
         raw_data: if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        lazy (bool): if True, tokens will be created only when they are accessed. (False)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
+        freshness (str): how fresh the balances have to be, see the 'Freshness' class. (fresh)
+        tolerance (float): the allowed relative drift of cached balances from the wallet value in the 'auto'
+            mode. (0.05)
 
     Returns:
         Dict[str, Chain] or Dict[str, dict]: token balances.
@@ -90,16 +88,286 @@ def current_balance_list(
             }
 
     """
+    client = client or get_default_client()
+    call = client.backend.all_balance_list(address=address)
+    if call is not None:
+        return _make_chains(chain_dict=client.call(call=call, proxies=proxies), raw_data=raw_data, lazy=lazy)
+
+    if freshness == Freshness.CACHED:
+        return token.cache_balance_list(address=address, raw_data=raw_data, proxies=proxies, lazy=lazy, client=client)
+
+    if freshness == Freshness.AUTO:
+        chain_dict = _get_auto_balance_list(
+            address=address, tolerance=tolerance, proxies=proxies, client=client
+        )
+        return _make_chains(chain_dict=chain_dict, raw_data=raw_data, lazy=lazy)
+
+    if freshness != Freshness.FRESH:
+        raise ValueError(f'unknown freshness: {freshness}')
+
+    used_chains = addr(address=address, proxies=proxies, client=client).used_chains
+    balances = client.fan_out(
+        functools.partial(balance_list, address, raw_data=raw_data, proxies=proxies, lazy=lazy, client=client),
+        used_chains
+    )
     chain_dict = {}
-    used_chains = addr(address=address, proxies=proxies).used_chains
-    for chain in used_chains:
-        balance = balance_list(address=address, chain=chain, raw_data=raw_data, proxies=proxies)
-        if balance.tokens:
+    for chain, balance in zip(used_chains, balances):
+        if raw_data:
+            if balance[chain]:
+                chain_dict[chain] = balance[chain]
+
+        elif balance.tokens:
             chain_dict[chain] = balance
 
     if not raw_data:
-        chain_dict = {
-            key: value for key, value in sorted(chain_dict.items(), key=lambda item: item[1].usd_value, reverse=True)
-        }
+        chain_dict = sort_by_usd_value(instances=chain_dict)
 
     return chain_dict
+
+
+def _make_chains(chain_dict: Dict[str, list], raw_data: bool, lazy: bool) -> Dict[str, Chain] or Dict[str, list]:
+    """
+    Make chains of tokens grouped by chain.
+
+    Args:
+        chain_dict (Dict[str, list]): the tokens by chain.
+        raw_data (bool): if True, the tokens will be returned as they are.
+        lazy (bool): if True, tokens will be created only when they are accessed.
+
+    Returns:
+        Dict[str, Chain] or Dict[str, list]: token balances.
+
+    """
+    chain_dict = {name: tokens for name, tokens in chain_dict.items() if tokens}
+    if raw_data:
+        return chain_dict
+
+    chain_class = LazyChain if lazy else Chain
+    return sort_by_usd_value(
+        instances={name: chain_class(name=name, tokens=tokens) for name, tokens in chain_dict.items()}
+    )
+
+
+def _get_auto_balance_list(
+        address: str, tolerance: float, proxies: Optional[str or List[str]], client: DebankClient
+) -> Dict[str, list]:
+    """
+    Get token balances of all chains from the cache and request them again only if they have drifted from
+    the wallet value of the user. Cached chains the user no longer uses are dropped, used chains missing from
+    the cache are requested first and the other used chains only if the balances still drift.
+
+    Args:
+        address (str): an address.
+        tolerance (float): the allowed relative drift of cached balances from the wallet value of the user.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        client (DebankClient): a client for making requests.
+
+    Returns:
+        Dict[str, list]: the tokens by chain.
+
+    """
+    chain_dict, debank_user = client.fan_out(lambda get_data: get_data(), [
+        functools.partial(token.cache_balance_list, address=address, raw_data=True, proxies=proxies, client=client),
+        functools.partial(addr, address=address, proxies=proxies, client=client)
+    ])
+    used_chains = debank_user.used_chains
+    if used_chains is None:
+        used_chains = list(chain_dict)
+
+    chain_dict = {chain: tokens for chain, tokens in chain_dict.items() if chain in used_chains}
+    if not has_drifted(chain_dict=chain_dict, user=debank_user, tolerance=tolerance):
+        return chain_dict
+
+    # Chains used since the balances were cached are the likeliest cause of the drift
+    missing = [chain for chain in used_chains if chain not in chain_dict]
+    if missing:
+        chain_dict.update(_refresh_balance_list(address=address, chains=missing, proxies=proxies, client=client))
+        if not has_drifted(chain_dict=chain_dict, user=debank_user, tolerance=tolerance):
+            return chain_dict
+
+    chains = [chain for chain in used_chains if chain not in missing]
+    chain_dict.update(_refresh_balance_list(address=address, chains=chains, proxies=proxies, client=client))
+    return chain_dict
+
+
+def _refresh_balance_list(
+        address: str, chains: List[str], proxies: Optional[str or List[str]], client: DebankClient
+) -> Dict[str, list]:
+    """
+    Request current token balances of chains.
+
+    Args:
+        address (str): an address.
+        chains (List[str]): chains.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        client (DebankClient): a client for making requests.
+
+    Returns:
+        Dict[str, list]: the tokens by chain.
+
+    """
+    balances = client.fan_out(
+        functools.partial(balance_list, address, raw_data=True, proxies=proxies, client=client), chains
+    )
+    return {chain: balance[chain] for chain, balance in zip(chains, balances)}
+
+
+def has_drifted(chain_dict: Dict[str, list], user: User, tolerance: float) -> bool:
+    """
+    Check if the value of token balances differs from the wallet value of a user by more than the tolerance.
+
+    Args:
+        chain_dict (Dict[str, list]): the tokens by chain.
+        user (User): the user.
+        tolerance (float): the allowed relative difference, for wallets worth less than 1 USD, of 1 USD.
+
+    Returns:
+        bool: True if the balances have drifted or the user has no wallet value to check them against.
+
+    """
+    if user.wallet_usd_value is None:
+        return True
+
+    usd_value = sum(
+        (item.get('amount') or 0) * (item.get('price') or 0) for tokens in chain_dict.values() for item in tokens
+    )
+    return abs(usd_value - user.wallet_usd_value) > tolerance * max(user.wallet_usd_value, 1.0)
+
+
+def scan(
+        addresses: Iterable[str], operations: Iterable[str] = (Operations.BALANCES, Operations.PROJECTS),
+        chain: ChainNames or str = '', max_workers: int = 16, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[DebankClient] = None
+) -> Iterator[ScanResult]:
+    """
+    Run operations on many addresses concurrently, one failed address doesn't stop the others.
+
+    The addresses are consumed lazily, so it may be a generator of any length. To limit the total number of
+    requests in flight, create the client with 'max_concurrency'.
+
+    Args:
+        addresses (Iterable[str]): addresses.
+        operations (Iterable[str]): what to get for every address, see the 'Operations' class.
+            (balances and projects)
+        chain (ChainNames or str): a chain. (all chains)
+        max_workers (int): the maximum number of addresses processed at the same time. (16)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        lazy (bool): if True, tokens, projects and NFTs will be created only when they are accessed. (False)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        Iterator[ScanResult]: scan results in the order of completion, a result contains either the address
+            information or the exception raised while getting it.
+
+    """
+    client = client or get_default_client()
+    addresses = iter(addresses)
+    operations = list(operations)
+    scan_address = functools.partial(
+        _scan_address, chain=chain, operations=operations, proxies=proxies, lazy=lazy, client=client
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(scan_address, address) for address in itertools.islice(addresses, max_workers)}
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            futures |= {executor.submit(scan_address, address) for address in itertools.islice(addresses, len(done))}
+            for future in done:
+                yield future.result()
+
+
+def _scan_address(
+        address: str, chain: ChainNames or str, operations: List[str], proxies: Optional[str or List[str]],
+        lazy: bool, client: DebankClient
+) -> ScanResult:
+    """
+    Run operations on an address.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain.
+        operations (List[str]): what to get, see the 'Operations' class.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        lazy (bool): if True, tokens, projects and NFTs will be created only when they are accessed.
+        client (DebankClient): a client for making requests.
+
+    Returns:
+        ScanResult: the scan result.
+
+    """
+    result = ScanResult(address=address)
+    try:
+        if set(operations) & {Operations.BALANCES, Operations.PROJECTS, Operations.NFTS}:
+            result.chains = _get_chains(
+                address=address, chain=chain, operations=operations, proxies=proxies, lazy=lazy, client=client
+            )
+
+        if Operations.HISTORY in operations:
+            result.history = history.list_(address=address, chain=chain, proxies=proxies, client=client)
+
+        if Operations.TOTAL_BALANCE in operations:
+            result.total_balance = user.total_balance(address=address, proxies=proxies, client=client)
+
+    except Exception as e:
+        return ScanResult(address=address, exception=e)
+
+    return result
+
+
+def _get_chains(
+        address: str, chain: ChainNames or str, operations: Iterable[str], proxies: Optional[str or List[str]],
+        lazy: bool, client: DebankClient, freshness: str = Freshness.FRESH, tolerance: float = 0.05
+) -> Dict[str, Chain]:
+    """
+    Get token balances, projects and owned NFTs of an address concurrently and merge them into chains.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain.
+        operations (Iterable[str]): what to get: 'balances', 'projects' and/or 'nfts'.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request.
+        lazy (bool): if True, tokens, projects and NFTs will be created only when they are accessed.
+        client (DebankClient): a client for making requests.
+        freshness (str): how fresh token balances of all chains have to be, see 'current_balance_list'. (fresh)
+        tolerance (float): the allowed relative drift of cached token balances in the 'auto' mode. (0.05)
+
+    Returns:
+        Dict[str, Chain]: the address information.
+
+    """
+    kwargs = {'address': address, 'raw_data': True, 'proxies': proxies, 'client': client}
+    sources = []
+    if Operations.BALANCES in operations:
+        if chain:
+            sources.append(('parse_tokens', functools.partial(token.balance_list, chain=chain, **kwargs)))
+
+        else:
+            sources.append(('parse_tokens', functools.partial(
+                current_balance_list, freshness=freshness, tolerance=tolerance, **kwargs
+            )))
+
+    if Operations.PROJECTS in operations:
+        sources.append(('parse_projects', functools.partial(portfolio.project_list, **kwargs)))
+
+    if Operations.NFTS in operations:
+        sources.append(('parse_nfts', functools.partial(nft.collection_list, chain=chain, **kwargs)))
+
+    chain_class = LazyChain if lazy else Chain
+    chains: Dict[str, Chain] = {chain: chain_class(name=chain)} if chain else {}
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {executor.submit(get_data): parse for parse, get_data in sources}
+        for future in as_completed(futures):
+            for name, data in future.result().items():
+                if chain and name != chain:
+                    continue
+
+                if name not in chains:
+                    chains[name] = chain_class(name=name)
+
+                getattr(chains[name], futures[future])(data)
+
+    return sort_by_usd_value(instances=chains)
@@ -0,0 +1,119 @@
+import json
+from typing import Optional, Any, Dict
+
+
+class JsonDecoder:
+    """
+    Decodes JSON bodies of responses with the standard library.
+
+    Attributes:
+        name (str): the name of the decoder backend.
+
+    """
+    name: str = 'json'
+
+    def loads(self, content: bytes or str) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            content (bytes or str): the document.
+
+        Returns:
+            Any: the decoded object.
+
+        """
+        return json.loads(content)
+
+
+class OrjsonDecoder(JsonDecoder):
+    """
+    Decodes JSON bodies of responses with 'orjson', documents it rejects are decoded with the standard library.
+
+    Depending on the 'orjson' version, integers over 64 bits are either rejected or decoded as floats.
+    """
+    name: str = 'orjson'
+
+    def __init__(self):
+        """
+        Initialize the class.
+        """
+        import orjson
+
+        self._loads = orjson.loads
+        self._error = orjson.JSONDecodeError
+
+    def loads(self, content: bytes or str) -> Any:
+        try:
+            return self._loads(content)
+
+        except self._error:
+            return json.loads(content)
+
+
+class MsgspecDecoder(JsonDecoder):
+    """
+    Decodes JSON bodies of responses with 'msgspec', documents it rejects are decoded with the standard library.
+    """
+    name: str = 'msgspec'
+
+    def __init__(self):
+        """
+        Initialize the class.
+        """
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._error = msgspec.DecodeError
+
+    def loads(self, content: bytes or str) -> Any:
+        try:
+            return self._decoder.decode(content)
+
+        except self._error:
+            return json.loads(content)
+
+
+DECODERS: Dict[str, type] = {
+    'orjson': OrjsonDecoder,
+    'msgspec': MsgspecDecoder,
+    'json': JsonDecoder
+}
+
+
+def get_decoder(name: Optional[str] = None) -> JsonDecoder:
+    """
+    Get a JSON decoder.
+
+    Args:
+        name (Optional[str]): the name of the backend: 'orjson', 'msgspec' or 'json'. (the fastest installed one)
+
+    Returns:
+        JsonDecoder: the decoder.
+
+    """
+    if name:
+        return DECODERS[name]()
+
+    for decoder_class in DECODERS.values():
+        try:
+            return decoder_class()
+
+        except ImportError:
+            pass
+
+    return JsonDecoder()
+
+
+_default_decoder: JsonDecoder = get_decoder()
+
+
+def get_default_decoder() -> JsonDecoder:
+    """
+    Get the JSON decoder used by clients that weren't given one.
+
+    Returns:
+        JsonDecoder: the default decoder.
+
+    """
+    return _default_decoder
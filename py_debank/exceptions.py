@@ -2,9 +2,21 @@ from typing import Optional
 
 
 class DebankException(Exception):
-    def __init__(self, status_code: int, error_msg: Optional[str] = None):
+    def __init__(self, status_code: int, error_msg: Optional[str] = None, retry_after: Optional[float] = None):
         self.status_code: int = status_code
         self.error_msg: Optional[str] = error_msg
+        self.retry_after: Optional[float] = retry_after
 
     def __str__(self):
         return f'Status code: {self.status_code}, Error message: {self.error_msg}'
+
+
+class MalformedItemException(Exception):
+    def __init__(self, chain: str, tx_id: Optional[str], token_id: Optional[str], reason: str):
+        self.chain: str = chain
+        self.tx_id: Optional[str] = tx_id
+        self.token_id: Optional[str] = token_id
+        self.reason: str = reason
+
+    def __str__(self):
+        return f'Chain: {self.chain}, Transaction: {self.tx_id}, Token: {self.token_id}, Reason: {self.reason}'
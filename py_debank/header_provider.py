@@ -0,0 +1,141 @@
+import itertools
+import threading
+from types import MappingProxyType
+from typing import Optional, List, Dict, Mapping, Iterator
+
+BASE_HEADERS: Dict[str, str] = {
+    'accept': '*/*',
+    'accept-language': 'en-US,en;q=0.9',
+    'origin': 'https://debank.com',
+    'referer': 'https://debank.com/',
+    'source': 'web'
+}
+FALLBACK_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 '
+    'Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 '
+    'Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
+)
+
+
+class HeaderProvider:
+    """
+    Hands out request headers from a fixed pool of header sets that is built once, on the first use.
+
+    User agents are taken from the fake_useragent database if it's available offline, otherwise from a built-in
+    list. Header sets are read-only and shared, so getting headers allocates nothing.
+
+    Attributes:
+        pool_size (int): the number of header sets in the pool.
+        pin_to_proxy (bool): whether to always send the same header set through a proxy.
+
+    """
+
+    def __init__(
+            self, pool_size: int = 32, user_agents: Optional[List[str]] = None, pin_to_proxy: bool = True,
+            use_fake_useragent: bool = True
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            pool_size (int): the number of header sets in the pool. (32)
+            user_agents (Optional[List[str]]): user agents to build the pool from. (Chrome user agents)
+            pin_to_proxy (bool): whether to always send the same header set through a proxy. (True)
+            use_fake_useragent (bool): whether to take user agents from the fake_useragent database. (True)
+
+        """
+        self.pool_size: int = pool_size
+        self.pin_to_proxy: bool = pin_to_proxy
+        self._user_agents: Optional[List[str]] = user_agents
+        self._use_fake_useragent: bool = use_fake_useragent
+        self._pool: Optional[List[Mapping[str, str]]] = None
+        self._cycle: Optional[Iterator[Mapping[str, str]]] = None
+        self._pinned: Dict[str, Mapping[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _load_user_agents(self) -> List[str]:
+        """
+        Load user agents for the pool.
+
+        Returns:
+            List[str]: the user agents.
+
+        """
+        if self._user_agents:
+            return list(self._user_agents)
+
+        if self._use_fake_useragent:
+            try:
+                from fake_useragent import UserAgent
+
+                user_agent = UserAgent()
+                user_agents = list(dict.fromkeys(user_agent.chrome for _ in range(self.pool_size * 4)))
+                if user_agents:
+                    return user_agents
+
+            except Exception:
+                pass
+
+        return list(FALLBACK_USER_AGENTS)
+
+    def _build(self) -> List[Mapping[str, str]]:
+        """
+        Build the pool of header sets, it is built once.
+
+        Returns:
+            List[Mapping[str, str]]: the header sets.
+
+        """
+        with self._lock:
+            if self._pool is None:
+                user_agents = self._load_user_agents()
+                pool = [
+                    MappingProxyType({**BASE_HEADERS, 'user-agent': user_agents[i % len(user_agents)]})
+                    for i in range(max(self.pool_size, 1))
+                ]
+                self._cycle = itertools.cycle(pool)
+                self._pool = pool
+
+            return self._pool
+
+    def get(self, proxy: Optional[str] = None) -> Mapping[str, str]:
+        """
+        Get headers for a request.
+
+        Args:
+            proxy (Optional[str]): the proxy the request will be sent through. (None)
+
+        Returns:
+            Mapping[str, str]: the read-only headers.
+
+        """
+        if self._pool is None:
+            self._build()
+
+        if proxy and self.pin_to_proxy:
+            headers = self._pinned.get(proxy)
+            if headers is None:
+                headers = self._pinned.setdefault(proxy, next(self._cycle))
+
+            return headers
+
+        return next(self._cycle)
+
+
+_default_header_provider: HeaderProvider = HeaderProvider()
+
+
+def get_default_header_provider() -> HeaderProvider:
+    """
+    Get the header provider used by clients that weren't given one.
+
+    Returns:
+        HeaderProvider: the default header provider.
+
+    """
+    return _default_header_provider
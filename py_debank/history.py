@@ -1,14 +1,22 @@
-from typing import Optional, List
+import heapq
+import itertools
+import queue
+import threading
+from typing import Optional, List, Iterator
 
-import requests
+from py_debank import user
+from py_debank.checkpoints import CheckpointStore
+from py_debank.client import DebankClient, get_default_client
+from py_debank.models import Entrypoints, History, Tx, ModelRegistry, ChainNames
 
-from py_debank.models import Entrypoints, History, ChainNames
-from py_debank.utils import get_proxy_dict, check_response, get_headers
+_PREFETCH_SIZE = 40
+_END = object()
 
 
 def list_(
         address: str, chain: ChainNames or str = '', start_time: int or str = 0, page_count: int or str = 20,
-        proxies: Optional[str or List[str]] = None
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None,
+        registry: Optional[ModelRegistry] = None
 ) -> History:
     """
     Get a transaction history of an address.
@@ -20,82 +28,343 @@ def list_(
         page_count (int or str): how many recent transactions to parse. (20)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
+        registry (Optional[ModelRegistry]): the registry of token, project and collection models, malformed items
+            are reported in it. (a new registry)
 
     Returns:
         History: the transaction history.
 
     """
+    client = client or get_default_client()
+    page_count = int(page_count)
+    page_counts = [20] * (page_count // 20)
+    if page_count % 20 or not page_counts:
+        page_counts.append(page_count % 20)
+
     data = {}
-    if page_count <= 20:
-        params = {
-            'user_addr': address,
-            'chain': chain,
-            'start_time': str(start_time),
-            'page_count': str(page_count)
-        }
-        response = requests.get(
-            url=Entrypoints.PUBLIC.HISTORY + 'list', params=params, headers=get_headers(),
-            proxies=get_proxy_dict(proxies=proxies)
+    for page_count in page_counts:
+        page = _get_page(
+            address=address, chain=chain, start_time=start_time, page_count=page_count, proxies=proxies, client=client
         )
-        json_response = check_response(response=response)
-        data = json_response['data']
+        if data:
+            data['history_list'] += page['history_list']
+            data['project_dict'].update(page['project_dict'])
+            data['token_dict'].update(page['token_dict'])
+
+        else:
+            data = page
+
+        if len(page['history_list']) < page_count:
+            break
+
+        start_time = int(data['history_list'][-1]['time_at'])
+
+    return History(address=address, data=data, registry=registry)
+
+
+def iter_history(
+        address: str, chain: ChainNames or str = '', start_time: int or str = 0, until: Optional[int or str] = None,
+        limit: Optional[int] = None, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None,
+        registry: Optional[ModelRegistry] = None, sharded: bool = False
+) -> Iterator[Tx]:
+    """
+    Iterate over a transaction history of an address from newer to older transactions, requesting pages as they are
+    consumed.
+
+    Only one page of raw transactions is kept at a time, token and project metadata is interned in a registry shared
+    by all transactions.
+
+    In the sharded mode, the history of all chains is requested chain by chain: the used chains of the address are
+    paginated concurrently a few pages ahead and their transactions are merged lazily by time.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        start_time (int or str): before what time to parse transactions. (0)
+        until (Optional[int or str]): stop at the first transaction older than this time. (None)
+        limit (Optional[int]): the maximum number of transactions. (unlimited)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
+        registry (Optional[ModelRegistry]): the registry of token, project and collection models, malformed items
+            are reported in it. (a new registry)
+        sharded (bool): if True and the chain isn't specified, paginate every used chain concurrently. (False)
+
+    Returns:
+        Iterator[Tx]: the transactions.
+
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    client = client or get_default_client()
+    address = address.lower()
+    until = float(until) if until is not None else None
+    registry = registry or ModelRegistry()
+    if sharded and not chain:
+        yield from _iter_sharded(
+            address=address, start_time=start_time, until=until, limit=limit, registry=registry, proxies=proxies,
+            client=client
+        )
+        return
+
+    count = 0
+    while limit is None or count < limit:
+        page_count = 20 if limit is None else min(20, limit - count)
+        page = _get_page(
+            address=address, chain=chain, start_time=start_time, page_count=page_count, proxies=proxies, client=client
+        )
+        txs = page.get('history_list')
+        if not txs:
+            return
+
+        for tx in txs:
+            if until is not None and float(tx['time_at']) < until:
+                return
+
+            tx.update({'address': address, 'project_dict': page.get('project_dict'),
+                       'token_dict': page.get('token_dict')})
+            yield Tx(data=tx, registry=registry)
+            count += 1
+
+        if len(txs) < page_count:
+            return
+
+        start_time = int(txs[-1]['time_at'])
+
+
+def sync(
+        address: str, store: CheckpointStore, chain: ChainNames or str = '', initial_limit: Optional[int] = None,
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> List[Tx]:
+    """
+    Get transactions of an address made since the previous sync and move its checkpoint to the newest of them.
+
+    Pages are requested until the checkpoint is reached, transactions on the checkpoint boundary that were already
+    returned are skipped. The checkpoint is saved only after all new transactions are received.
+
+    Args:
+        address (str): an address.
+        store (CheckpointStore): the store of checkpoints.
+        chain (ChainNames or str): a chain. (all chains)
+        initial_limit (Optional[int]): how many recent transactions to parse if the address has no checkpoint.
+            (all transactions)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
+
+    Returns:
+        List[Tx]: the new transactions from newer to older ones.
+
+    """
+    client = client or get_default_client()
+    checkpoint = store.get(address=address, chain=chain)
+    if checkpoint:
+        known_ids = set(checkpoint.tx_ids)
+        txs = []
+        for tx in iter_history(
+                address=address, chain=chain, until=checkpoint.time_at, proxies=proxies, client=client
+        ):
+            if float(tx.timestamp) == checkpoint.time_at and tx.tx_id in known_ids:
+                continue
+
+            txs.append(tx)
 
     else:
-        page_counts = [20] * (page_count // 20)
-        page_counts.append(page_count - len(page_counts) * 20)
-        for page_count in page_counts:
-            params = {
-                'user_addr': address,
-                'chain': chain,
-                'start_time': str(start_time),
-                'page_count': str(page_count)
-            }
-            response = requests.get(
-                url=Entrypoints.PUBLIC.HISTORY + 'list', params=params, headers=get_headers(),
-                proxies=get_proxy_dict(proxies=proxies)
-            )
-            json_response = check_response(response=response)
-            if data:
-                data['history_list'] += json_response['data']['history_list']
-                data['project_dict'].update(json_response['data']['project_dict'])
-                data['token_dict'].update(json_response['data']['token_dict'])
-
-            else:
-                data = json_response['data']
-
-            start_time = int(data['history_list'][-1]['time_at'])
-
-    return History(address=address, data=data)
+        txs = list(iter_history(address=address, chain=chain, limit=initial_limit, proxies=proxies, client=client))
+
+    if txs:
+        time_at = float(txs[0].timestamp)
+        tx_ids = [tx.tx_id for tx in txs if float(tx.timestamp) == time_at]
+        if checkpoint and checkpoint.time_at == time_at:
+            tx_ids = checkpoint.tx_ids + tx_ids
+
+        store.set(address=address, chain=chain, time_at=time_at, tx_ids=tx_ids)
+
+    return txs
 
 
 def token_price(
         token_id: str, chain: ChainNames or str, time_at: Optional[int or str] = None,
-        proxies: Optional[str or List[str]] = None
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
 ) -> float:
     """
     Get a token price at a certain point in time.
 
+    If the client has a persistent cache, a settled point in time is rounded down to its price bucket and the price is
+    kept on disk.
+
     Args:
         token_id (str): a token contract address or a coin name.
         chain (ChainNames or str): a chain.
         time_at (Optional[int or str]): at what point in time to get a token price. (current time)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
 
     Returns:
         float: the token price.
 
     """
+    client = client or get_default_client()
     params = {
         'chain': chain,
         'token_id': token_id
     }
+    persistent = _is_settled(time_at=time_at, client=client)
+    if persistent:
+        time_at = client.persistent_cache.bucket_time(time_at=time_at)
+
     if time_at:
         params['time_at'] = time_at
 
-    response = requests.get(
-        url=Entrypoints.PUBLIC.HISTORY + 'token_price', params=params, headers=get_headers(),
-        proxies=get_proxy_dict(proxies=proxies)
+    json_response = client.get(
+        url=Entrypoints.PUBLIC.HISTORY + 'token_price', params=params, proxies=proxies, persistent=persistent
     )
-    json_response = check_response(response=response)
     return json_response['data']['price']
+
+
+def _is_settled(time_at: Optional[int or str], client: DebankClient) -> bool:
+    """
+    Check if responses at a point in time are immutable and may be kept in the persistent cache of the client.
+
+    Args:
+        time_at (Optional[int or str]): the point in time.
+        client (DebankClient): a client for making requests.
+
+    Returns:
+        bool: True if responses may be kept in the persistent cache.
+
+    """
+    return bool(time_at) and client.persistent_cache is not None and client.persistent_cache.is_settled(time_at=time_at)
+
+
+def _get_page(
+        address: str, chain: ChainNames or str, start_time: int or str, page_count: int,
+        proxies: Optional[str or List[str]], client: DebankClient
+) -> dict:
+    """
+    Get a page of a transaction history.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain.
+        start_time (int or str): before what time to parse transactions.
+        page_count (int): how many transactions to parse, no more than 20.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making a request.
+        client (DebankClient): a client for making requests.
+
+    Returns:
+        dict: the page data.
+
+    """
+    params = {
+        'user_addr': address,
+        'chain': chain,
+        'start_time': str(start_time),
+        'page_count': str(page_count)
+    }
+    json_response = client.get(
+        url=Entrypoints.PUBLIC.HISTORY + 'list', params=params, proxies=proxies,
+        persistent=_is_settled(time_at=start_time, client=client)
+    )
+    return json_response['data']
+
+
+def _iter_sharded(
+        address: str, start_time: int or str, until: Optional[float], limit: Optional[int], registry: ModelRegistry,
+        proxies: Optional[str or List[str]], client: DebankClient
+) -> Iterator[Tx]:
+    """
+    Iterate over a transaction history of all used chains of an address merging the histories of the chains by time.
+
+    Args:
+        address (str): an address.
+        start_time (int or str): before what time to parse transactions.
+        until (Optional[float]): stop at the first transaction older than this time.
+        limit (Optional[int]): the maximum number of transactions.
+        registry (ModelRegistry): the registry of token, project and collection models.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making a request.
+        client (DebankClient): a client for making requests.
+
+    Returns:
+        Iterator[Tx]: the transactions.
+
+    """
+    chains = user.addr(address=address, proxies=proxies, client=client).used_chains or []
+    stop = threading.Event()
+    semaphore = threading.Semaphore(max(client.max_workers, 1))
+    streams = [
+        _prefetch(
+            iterator=iter_history(
+                address=address, chain=chain, start_time=start_time, until=until, limit=limit, registry=registry,
+                proxies=proxies, client=client
+            ), size=_PREFETCH_SIZE, stop=stop, semaphore=semaphore
+        ) for chain in chains
+    ]
+    try:
+        merged = heapq.merge(*streams, key=lambda tx: float(tx.timestamp), reverse=True)
+        yield from itertools.islice(merged, limit)
+
+    finally:
+        stop.set()
+
+
+def _prefetch(
+        iterator: Iterator[Tx], size: int, stop: threading.Event, semaphore: threading.Semaphore
+) -> Iterator[Tx]:
+    """
+    Start consuming an iterator in a background thread that keeps up to a certain number of items ahead.
+
+    Args:
+        iterator (Iterator[Tx]): the iterator.
+        size (int): how many items to keep ahead.
+        stop (threading.Event): the event that stops the thread when the items are no longer needed.
+        semaphore (threading.Semaphore): the semaphore limiting the number of threads requesting pages.
+
+    Returns:
+        Iterator[Tx]: the items.
+
+    """
+    items = queue.Queue(maxsize=size)
+
+    def put(item: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+
+            except queue.Full:
+                pass
+
+        return False
+
+    def produce() -> None:
+        try:
+            while True:
+                with semaphore:
+                    item = next(iterator, _END)
+
+                if item is _END or not put(item=(item, None)):
+                    break
+
+            put(item=(_END, None))
+
+        except Exception as e:
+            put(item=(_END, e))
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    def consume() -> Iterator[Tx]:
+        while True:
+            item, exception = items.get()
+            if exception:
+                raise exception
+
+            if item is _END:
+                return
+
+            yield item
+
+    return consume()
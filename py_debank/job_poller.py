@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+from typing import Optional, List, Any, Callable, Awaitable
+
+
+class _Job:
+    """
+    The polling state of one job.
+
+    Attributes:
+        item (Any): the item the job is polled for, e.g. a chain.
+        data (Optional[dict]): the 'data' of the latest response.
+        started_at (float): when the job was requested for the first time.
+        due_at (float): when to poll the job next time.
+        delay (float): the latest delay between polls.
+
+    """
+
+    def __init__(self, item: Any, now: float):
+        self.item: Any = item
+        self.data: Optional[dict] = None
+        self.started_at: float = now
+        self.due_at: float = now
+        self.delay: float = 0.0
+
+
+class JobPoller:
+    """
+    Polls endpoints that prepare data in a background job and return {'job': ..., 'result': ...} until it's finished.
+
+    All pending jobs are polled together, the delay before the first repeat adapts to how long jobs usually take and
+    then grows with every poll. Jobs that aren't finished before the deadline are returned as they are.
+
+    Attributes:
+        initial_delay (float): the delay in seconds before the first repeat if there is no job duration statistics.
+        multiplier (float): how many times the delay grows with every poll.
+        max_delay (float): the maximum delay in seconds between polls.
+        deadline (float): how many seconds to wait for all jobs.
+        smoothing (float): the weight of the latest job in the average job duration.
+
+    """
+
+    def __init__(
+            self, initial_delay: float = 1.0, multiplier: float = 1.5, max_delay: float = 5.0, deadline: float = 30.0,
+            smoothing: float = 0.2
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            initial_delay (float): the delay in seconds before the first repeat if there is no job duration
+                statistics. (1)
+            multiplier (float): how many times the delay grows with every poll. (1.5)
+            max_delay (float): the maximum delay in seconds between polls. (5)
+            deadline (float): how many seconds to wait for all jobs. (30)
+            smoothing (float): the weight of the latest job in the average job duration. (0.2)
+
+        """
+        self.initial_delay: float = initial_delay
+        self.multiplier: float = multiplier
+        self.max_delay: float = max_delay
+        self.deadline: float = deadline
+        self.smoothing: float = smoothing
+        self.average_duration: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_pending(data: dict) -> bool:
+        """
+        Check if a job is still running.
+
+        Args:
+            data (dict): the 'data' of a response.
+
+        Returns:
+            bool: True if the job is still running.
+
+        """
+        return bool(data.get('job'))
+
+    def _update(self, job: _Job, now: float) -> None:
+        """
+        Schedule the next poll of a pending job or update the average job duration if it's finished.
+
+        Args:
+            job (_Job): the job.
+            now (float): the current time.
+
+        """
+        if not self.is_pending(job.data):
+            duration = now - job.started_at
+            with self._lock:
+                if self.average_duration is None:
+                    self.average_duration = duration
+
+                else:
+                    self.average_duration += self.smoothing * (duration - self.average_duration)
+
+            return
+
+        if not job.delay:
+            expected = self.average_duration if self.average_duration is not None else self.initial_delay
+            job.delay = min(max(expected - (now - job.started_at), 0.1), self.max_delay)
+
+        else:
+            job.delay = min(job.delay * self.multiplier, self.max_delay)
+
+        job.due_at = now + job.delay
+
+    def poll(self, fetch: Callable[[Any], dict], items: List[Any], fan_out: Callable[[Callable, List], list]) -> list:
+        """
+        Poll jobs until all of them are finished or the deadline is reached.
+
+        Args:
+            fetch (Callable[[Any], dict]): the function that sends a request for an item and returns the 'data'.
+            items (List[Any]): the items to poll jobs for, e.g. chains.
+            fan_out (Callable[[Callable, List], list]): the function that calls a function for items concurrently.
+
+        Returns:
+            list: the 'data' of the latest response for every item, it's pending if the deadline was reached.
+
+        """
+        now = time.monotonic()
+        deadline_at = now + self.deadline
+        jobs = [_Job(item=item, now=now) for item in items]
+        pending = jobs
+        while pending:
+            due = [job for job in pending if job.due_at <= now]
+            for job, data in zip(due, fan_out(fetch, [job.item for job in due])):
+                job.data = data
+
+            now = time.monotonic()
+            for job in due:
+                self._update(job=job, now=now)
+
+            pending = [job for job in pending if self.is_pending(job.data)]
+            if not pending or now >= deadline_at:
+                break
+
+            wake_at = min(min(job.due_at for job in pending), deadline_at)
+            time.sleep(max(wake_at - now, 0.0))
+            now = time.monotonic()
+            if now >= deadline_at:
+                for job in pending:
+                    job.due_at = now
+
+        return [job.data for job in jobs]
+
+    async def poll_async(self, fetch: Callable[[Any], Awaitable[dict]], items: List[Any]) -> list:
+        """
+        Poll jobs concurrently without blocking until all of them are finished or the deadline is reached.
+
+        Args:
+            fetch (Callable[[Any], Awaitable[dict]]): the coroutine function that sends a request for an item and
+                returns the 'data'.
+            items (List[Any]): the items to poll jobs for, e.g. chains.
+
+        Returns:
+            list: the 'data' of the latest response for every item, it's pending if the deadline was reached.
+
+        """
+        deadline_at = time.monotonic() + self.deadline
+
+        async def poll_job(item: Any) -> dict:
+            job = _Job(item=item, now=time.monotonic())
+            while True:
+                job.data = await fetch(item)
+                now = time.monotonic()
+                self._update(job=job, now=now)
+                if not self.is_pending(job.data) or now >= deadline_at:
+                    return job.data
+
+                await asyncio.sleep(max(min(job.due_at, deadline_at) - now, 0.0))
+
+        return list(await asyncio.gather(*[poll_job(item) for item in items]))
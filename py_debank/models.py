@@ -1,8 +1,13 @@
+import copy
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Callable
 
 from pretty_utils.type_functions.classes import AutoRepr
 
+from py_debank.exceptions import MalformedItemException
+
 
 @dataclass
 class PublicAPI:
@@ -38,23 +43,52 @@ class ChainNames:
     MOONBEAM = 'mobm'
 
 
+@dataclass
+class Operations:
+    BALANCES = 'balances'
+    PROJECTS = 'projects'
+    NFTS = 'nfts'
+    HISTORY = 'history'
+    TOTAL_BALANCE = 'total_balance'
+
+
+@dataclass
+class Freshness:
+    CACHED = 'cached'
+    FRESH = 'fresh'
+    AUTO = 'auto'
+
+
 @dataclass
 class Mark:
     timestamp: int
     usd_value: float
 
 
+class Model:
+    """
+    The base of the models and of their compact variants, nested models are created from the module in '_models',
+    so a tree consists of models of one kind.
+    """
+    __slots__ = ()
+    _models: Any = sys.modules[__name__]
+
+
 class Curve(AutoRepr):
     def __init__(self, data: dict):
         usd_value_list = data.get('usd_value_list')
-        self.persent_change: float = (usd_value_list[-1][1] / usd_value_list[0][1] - 1) * 100
+        self.persent_change: float = (
+            (usd_value_list[-1][1] / usd_value_list[0][1] - 1) * 100 if usd_value_list[0][1] else 0.0
+        )
         self.usd_change: float = usd_value_list[-1][1] - usd_value_list[0][1]
         self.marks: List[Mark] = []
         for mark in usd_value_list:
             self.marks.append(Mark(timestamp=mark[0], usd_value=mark[1]))
 
 
-class Token(AutoRepr):
+class BaseToken(Model):
+    __slots__ = ()
+
     def __init__(self, data: dict):
         self.chain: str = data.get('chain')
         self.symbol: str = data.get('symbol')
@@ -78,7 +112,13 @@ class Token(AutoRepr):
             self.usd_value = self.amount * self.price
 
 
-class PortfolioItem(AutoRepr):
+class Token(BaseToken, AutoRepr):
+    pass
+
+
+class BasePortfolioItem(Model):
+    __slots__ = ()
+
     def __init__(self, data: dict):
         self.name: str = data.get('name')
         self.asset_usd_value: float = data.get('stats')['asset_usd_value']
@@ -107,12 +147,18 @@ class PortfolioItem(AutoRepr):
 
         self.tokens = []
         for token in tokens:
-            self.tokens.append(Token(data=token))
+            self.tokens.append(self._models.Token(data=token))
 
         self.tokens = sorted(self.tokens, key=lambda token: token.usd_value, reverse=True)
 
 
-class Project(AutoRepr):
+class PortfolioItem(BasePortfolioItem, AutoRepr):
+    pass
+
+
+class BaseProject(Model):
+    __slots__ = ()
+
     def __init__(self, data: dict):
         self.chain: str = data.get('chain')
         self.name: str = data.get('name')
@@ -139,18 +185,26 @@ class Project(AutoRepr):
 
         self.portfolio_item_list = []
         for portfolio_item in portfolio_item_list:
-            portfolio_item = PortfolioItem(data=portfolio_item)
+            portfolio_item = self._models.PortfolioItem(data=portfolio_item)
             self.usd_value += portfolio_item.asset_usd_value
             self.portfolio_item_list.append(portfolio_item)
 
 
-class Collection(AutoRepr):
+class Project(BaseProject, AutoRepr):
+    pass
+
+
+class BaseCollection(Model):
+    __slots__ = ()
+
     def __init__(self, data: dict):
         self.chain: str = data.get('chain')
         self.name: str = data.get('name')
         self.id: str = data.get('id')
         self.nft_amount: Optional[int] = data.get('amount')
-        self.spent_token: Optional[Token] = Token(data=data.get('spent_token')) if 'spent_token' in data else None
+        self.spent_token: Optional[Token] = (
+            self._models.Token(data=data.get('spent_token')) if 'spent_token' in data else None
+        )
         self.avg_price_24h: float = data.get('avg_price_24h')
         self.avg_price_last_24h: float = data.get('avg_price_last_24h')
         self.floor_price: float = data.get('floor_price')
@@ -168,7 +222,13 @@ class Collection(AutoRepr):
         self.thirdparty: dict = data.get('thirdparty')
 
 
-class NFT(AutoRepr):
+class Collection(BaseCollection, AutoRepr):
+    pass
+
+
+class BaseNFT(Model):
+    __slots__ = ()
+
     def __init__(self, data: dict, collection: Optional[Collection] = None):
         self.chain: str = data.get('chain')
         self.collection: Optional[Collection] = collection
@@ -190,20 +250,24 @@ class NFT(AutoRepr):
 
         mint_gas_token = data.get('mint_gas_token')
         if mint_gas_token:
-            self.mint_gas_token = Token(data=mint_gas_token)
+            self.mint_gas_token = self._models.Token(data=mint_gas_token)
             self.usd_spent += self.mint_gas_token.usd_value
 
         mint_pay_token = data.get('mint_pay_token')
         if mint_pay_token:
-            self.mint_pay_token = Token(data=mint_pay_token)
+            self.mint_pay_token = self._models.Token(data=mint_pay_token)
             self.usd_spent += self.mint_pay_token.usd_value
 
         pay_token = data.get('pay_token')
         if pay_token and 'chain' in pay_token:
-            self.pay_token = Token(data=pay_token)
+            self.pay_token = self._models.Token(data=pay_token)
             self.usd_spent += self.pay_token.usd_value
 
 
+class NFT(BaseNFT, AutoRepr):
+    pass
+
+
 class Profit(AutoRepr):
     def __init__(self, data: dict):
         self.chain: str = data.get('chain')
@@ -243,7 +307,15 @@ class ProfitLeaderboard(AutoRepr):
             self.usd_profit += profit.usd_profit
 
 
-class Chain(AutoRepr):
+class PendingJob(AutoRepr):
+    def __init__(self, address: str, chain: str, method: str, job: dict):
+        self.address: str = address
+        self.chain: str = chain
+        self.method: str = method
+        self.job: dict = job
+
+
+class Chain(Model, AutoRepr):
     def __init__(self, name: str, tokens: Optional[list] = None, projects: Optional[list] = None,
                  collections: Optional[list] = None):
         self.name: str = name
@@ -251,6 +323,7 @@ class Chain(AutoRepr):
         self.tokens: Optional[List[Token]] = None
         self.projects: Optional[List[Project]] = None
         self.nfts: Optional[List[NFT]] = None
+        self.pending_nfts: Optional[PendingJob] = None
 
         self.parse_tokens(tokens=tokens)
         self.parse_projects(projects=projects)
@@ -267,7 +340,7 @@ class Chain(AutoRepr):
             if amount and price:
                 self.usd_value += amount * price
 
-            self.tokens.append(Token(data=token))
+            self.tokens.append(self._models.Token(data=token))
 
         self.tokens = sorted(self.tokens, key=lambda token: token.usd_value, reverse=True)
 
@@ -277,67 +350,439 @@ class Chain(AutoRepr):
 
         self.projects = []
         for project in projects:
-            project = Project(data=project)
+            project = self._models.Project(data=project)
             self.usd_value += project.usd_value
             self.projects.append(project)
 
         self.projects = sorted(self.projects, key=lambda project: project.usd_value, reverse=True)
 
-    def parse_nfts(self, collections: list) -> None:
+    def parse_nfts(self, collections: list or PendingJob) -> None:
         if not collections:
             return
 
+        if isinstance(collections, PendingJob):
+            self.pending_nfts = collections
+            return
+
         self.nfts = []
         for collection in collections:
-            collection_instance = Collection(data=collection)
+            collection_instance = self._models.Collection(data=collection)
             for nft in collection.get('nft_list'):
-                nft = NFT(data=nft, collection=collection_instance)
+                nft = self._models.NFT(data=nft, collection=collection_instance)
                 self.nfts.append(nft)
 
         self.nfts = sorted(self.nfts, key=lambda nft: nft.usd_spent, reverse=True)
 
 
-class NFTTx(AutoRepr):
-    def __init__(self, chain: str, data: dict):
+NFT_KEYS = ('inner_id', 'contract_id', 'collection_id', 'is_erc721', 'is_erc1155')
+
+
+def is_nft(data: dict) -> bool:
+    """
+    Check if an item of a token dictionary is an NFT by its schema.
+
+    Args:
+        data (dict): the item.
+
+    Returns:
+        bool: True if it's an NFT.
+
+    """
+    for key in NFT_KEYS:
+        if key in data:
+            return True
+
+    return False
+
+
+def get_token_usd_value(data: dict) -> float:
+    """
+    Get the USD value of a raw token without creating a 'Token' instance.
+    """
+    amount = data.get('amount')
+    price = data.get('price')
+    return amount * price if amount and price else 0.0
+
+
+def get_project_usd_value(data: dict) -> float:
+    """
+    Get the USD value of a raw project without creating a 'Project' instance.
+    """
+    return sum(item['stats']['asset_usd_value'] for item in data.get('portfolio_item_list') or ())
+
+
+def get_nft_usd_spent(data: dict) -> float:
+    """
+    Get the USD spent on a raw NFT without creating an 'NFT' instance.
+    """
+    usd_spent = 0.0
+    for name in ('mint_gas_token', 'mint_pay_token', 'pay_token'):
+        token = data.get(name)
+        if token and (name != 'pay_token' or 'chain' in token):
+            usd_spent += get_token_usd_value(data=token)
+
+    return usd_spent
+
+
+class LazyList(Sequence):
+    """
+    A read-only list of raw items that creates model instances only when they are accessed.
+
+    Items are ordered by the key calculated on raw data in descending order, the same way the eager models are
+    sorted.
+
+    Attributes:
+        materialized (int): how many model instances have been created.
+
+    """
+
+    def __init__(self, items: list, factory: Callable[[Any], Any], key: Optional[Callable[[Any], float]] = None):
+        """
+        Initialize the class.
+
+        Args:
+            items (list): raw items.
+            factory (Callable[[Any], Any]): the function that creates a model instance from a raw item.
+            key (Optional[Callable[[Any], float]]): the function that calculates the sort key of a raw item. (None)
+
+        """
+        self._items: list = sorted(items, key=key, reverse=True) if key else list(items)
+        self._factory: Callable[[Any], Any] = factory
+        self._instances: List[Any] = [None] * len(self._items)
+        self.materialized: int = 0
+
+    def _get(self, index: int) -> Any:
+        instance = self._instances[index]
+        if instance is None:
+            instance = self._factory(self._items[index])
+            self._instances[index] = instance
+            self.materialized += 1
+
+        return instance
+
+    def __getitem__(self, index: int or slice) -> Any:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._items)))]
+
+        if index < 0:
+            index += len(self._items)
+
+        if not 0 <= index < len(self._items):
+            raise IndexError('list index out of range')
+
+        return self._get(index)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, (list, LazyList)) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class LazyPortfolioItem(PortfolioItem):
+    def parse_tokens(self, tokens: list) -> None:
+        if not tokens:
+            return
+
+        self.tokens = LazyList(items=tokens, factory=Token, key=get_token_usd_value)
+
+
+class LazyProject(Project):
+    def parse_items(self, portfolio_item_list: list) -> None:
+        if not portfolio_item_list:
+            return
+
+        self.usd_value += sum(item['stats']['asset_usd_value'] for item in portfolio_item_list)
+        self.portfolio_item_list = LazyList(items=portfolio_item_list, factory=LazyPortfolioItem)
+
+
+class LazyChain(Chain):
+    """
+    A chain that keeps raw data and creates tokens, projects and NFTs only when they are accessed, USD values are
+    calculated on raw data.
+    """
+
+    def parse_tokens(self, tokens: list) -> None:
+        if not tokens:
+            return
+
+        self.usd_value += sum(get_token_usd_value(data=token) for token in tokens)
+        self.tokens = LazyList(items=tokens, factory=Token, key=get_token_usd_value)
+
+    def parse_projects(self, projects: list) -> None:
+        if not projects:
+            return
+
+        self.usd_value += sum(get_project_usd_value(data=project) for project in projects)
+        self.projects = LazyList(items=projects, factory=LazyProject, key=get_project_usd_value)
+
+    def parse_nfts(self, collections: list or PendingJob) -> None:
+        if not collections:
+            return
+
+        if isinstance(collections, PendingJob):
+            self.pending_nfts = collections
+            return
+
+        collection_instances = {}
+
+        def create_nft(item: tuple) -> NFT:
+            nft, collection = item
+            collection_instance = collection_instances.get(id(collection))
+            if collection_instance is None:
+                collection_instance = collection_instances.setdefault(id(collection), Collection(data=collection))
+
+            return NFT(data=nft, collection=collection_instance)
+
+        self.nfts = LazyList(
+            items=[(nft, collection) for collection in collections for nft in collection.get('nft_list')],
+            factory=create_nft, key=lambda item: get_nft_usd_spent(data=item[0])
+        )
+
+
+class TxItem(Model):
+    """
+    The base of tokens and NFTs of transactions, they are instances of the token and NFT classes that hold only the
+    amount of the transaction and take the other attributes from the model shared by all transactions. Attributes
+    assigned to them don't change the shared model.
+
+    Attributes:
+        prototype (Token or NFT): the shared token or NFT.
+
+    """
+    __slots__ = ()
+
+    def __init__(self, prototype: Token or NFT, amount: Optional[float]):
+        """
+        Initialize the class.
+
+        Args:
+            prototype (Token or NFT): the shared token or NFT.
+            amount (Optional[float]): the amount in the transaction.
+
+        """
+        self.prototype: Token or NFT = prototype
+        self.amount: Optional[float] = amount
+        if isinstance(prototype, BaseToken):
+            self.usd_value: float = amount * prototype.price if amount and prototype.price else 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        # Called only for attributes that aren't held, e.g. while unpickling before 'prototype' is set
+        if name == 'prototype' or name.startswith('__'):
+            raise AttributeError(name)
+
+        return getattr(self.prototype, name)
+
+    def __repr__(self) -> str:
+        item = copy.copy(self.prototype)
+        for name in ('amount', 'usd_value'):
+            try:
+                setattr(item, name, object.__getattribute__(self, name))
+
+            except AttributeError:
+                pass
+
+        return repr(item)
+
+
+class TxToken(TxItem, Token):
+    __slots__ = ('prototype', 'amount', 'usd_value')
+
+
+class TxNFT(TxItem, NFT):
+    __slots__ = ('prototype', 'amount')
+
+
+class ModelRegistry(Model):
+    """
+    Interns models built from metadata that is the same in all transactions, so that transactions of a history share
+    them instead of parsing the metadata again.
+
+    Tokens and NFTs are classified by their schema and parsed once per chain and ID, every transaction gets a TxToken
+    or a TxNFT that holds its own amount and refers to the shared model. Projects and collections are shared as they
+    are. Items that can't be parsed are skipped and reported in 'malformed' or raised in the strict mode.
+
+    Attributes:
+        strict (bool): whether to raise an exception on a malformed item instead of skipping it.
+        malformed (List[MalformedItemException]): the skipped malformed items.
+
+    """
+
+    def __init__(self, strict: bool = False):
+        """
+        Initialize the class.
+
+        Args:
+            strict (bool): whether to raise an exception on a malformed item instead of skipping it. (False)
+
+        """
+        self.strict: bool = strict
+        self.malformed: List[MalformedItemException] = []
+        self._tokens: Dict[tuple, Token or NFT] = {}
+        self._projects: Dict[tuple, Project] = {}
+        self._collections: Dict[tuple, Collection] = {}
+
+    def report(self, chain: str, tx_id: Optional[str], token_id: Optional[str], reason: str) -> None:
+        """
+        Report a malformed item, raise it in the strict mode.
+
+        Args:
+            chain (str): the chain of the transaction.
+            tx_id (Optional[str]): the ID of the transaction.
+            token_id (Optional[str]): the ID of the item in the token dictionary.
+            reason (str): why the item is malformed.
+
+        """
+        exception = MalformedItemException(chain=chain, tx_id=tx_id, token_id=token_id, reason=reason)
+        if self.strict:
+            raise exception
+
+        self.malformed.append(exception)
+
+    def get_token(
+            self, chain: str, token_id: str, token_dict: dict, amount: Optional[float], tx_id: Optional[str] = None
+    ) -> Optional[Token or NFT]:
+        """
+        Get a token or an NFT of a transaction.
+
+        Args:
+            chain (str): the chain of the transaction.
+            token_id (str): the ID of the token in the token dictionary.
+            token_dict (dict): the token dictionary of the history page.
+            amount (Optional[float]): the amount of the token in the transaction.
+            tx_id (Optional[str]): the ID of the transaction for reporting a malformed item. (None)
+
+        Returns:
+            Optional[Token or NFT]: the token or the NFT with the amount, None if the item is malformed.
+
+        """
+        key = (chain, token_id)
+        prototype = self._tokens.get(key)
+        if prototype is None:
+            data = token_dict.get(token_id) if token_dict else None
+            if not isinstance(data, dict):
+                reason = 'not in the token dictionary' if data is None else 'not an object'
+                self.report(chain=chain, tx_id=tx_id, token_id=token_id, reason=reason)
+                return
+
+            if is_nft(data=data):
+                pay_token = data.get('pay_token')
+                if pay_token:
+                    data = {**data, 'pay_token': token_dict.get(pay_token.get('id'))}
+
+                prototype = self._models.NFT(data=data)
+
+            else:
+                prototype = self._models.Token(data=data)
+
+            self._tokens[key] = prototype
+
+        if isinstance(prototype, BaseNFT):
+            return self._models.TxNFT(prototype=prototype, amount=amount)
+
+        return self._models.TxToken(prototype=prototype, amount=amount)
+
+    def get_project(self, chain: str, project_id: str, project_dict: dict) -> Project:
+        """
+        Get a project of a transaction.
+
+        Args:
+            chain (str): the chain of the transaction.
+            project_id (str): the ID of the project in the project dictionary.
+            project_dict (dict): the project dictionary of the history page.
+
+        Returns:
+            Project: the shared project.
+
+        """
+        key = (chain, project_id)
+        project = self._projects.get(key)
+        if project is None:
+            project = self._projects[key] = self._models.Project(data=project_dict[project_id])
+
+        return project
+
+    def get_collection(self, chain: str, data: dict) -> Collection:
+        """
+        Get a collection of an NFT transaction.
+
+        Args:
+            chain (str): the chain of the transaction.
+            data (dict): the collection data.
+
+        Returns:
+            Collection: the shared collection.
+
+        """
+        collection_id = data.get('id')
+        if collection_id is None:
+            return self._models.Collection(data=data)
+
+        key = (chain, collection_id)
+        collection = self._collections.get(key)
+        if collection is None:
+            collection = self._collections[key] = self._models.Collection(data=data)
+
+        return collection
+
+
+class BaseNFTTx(Model):
+    __slots__ = ()
+
+    def __init__(self, chain: str, data: dict, registry: Optional[ModelRegistry] = None):
+        registry = registry or self._models.ModelRegistry()
         self.chain: str = chain
         self.type: str = data.get('type')
         self.tx_id: str = data.get('tx_id')
         self.timestamp: float = data.get('time_at')
         self.address: str = data.get('user_addr')
-        self.nft: NFT = NFT(data=data.get('nft'), collection=Collection(data=data.get('collection')))
-        self.pay_token: Token = Token(data=data.get('pay_token'))
+        self.nft: NFT = self._models.NFT(data=data.get('nft'), collection=registry.get_collection(
+            chain=chain, data=data.get('collection')
+        ))
+        self.pay_token: Token = self._models.Token(data=data.get('pay_token'))
 
         self.id: str = data.get('id')
 
 
-class NFTHistory(AutoRepr):
-    def __init__(self, chain: str, address: str, data: dict):
+class NFTTx(BaseNFTTx, AutoRepr):
+    pass
+
+
+class NFTHistory(Model, AutoRepr):
+    def __init__(self, chain: str, address: str, data: dict, registry: Optional[ModelRegistry] = None):
         self.chain: str = chain
         self.address: str = address
         self.txs: Optional[List[AutoRepr]] = None
 
-        self.parse_txs(data=data)
+        self.parse_txs(data=data, registry=registry)
 
-    def parse_txs(self, data: dict) -> None:
+    def parse_txs(self, data: dict, registry: Optional[ModelRegistry] = None) -> None:
         txs = data.get('history_list')
         if not txs:
             return
 
+        registry = registry or self._models.ModelRegistry()
         self.txs = []
         for tx in txs:
-            self.txs.append(NFTTx(chain=self.chain, data=tx))
+            self.txs.append(self._models.NFTTx(chain=self.chain, data=tx, registry=registry))
 
 
-class Tx(AutoRepr):
-    def __init__(self, data: dict):
+class BaseTx(Model):
+    __slots__ = ()
+
+    def __init__(self, data: dict, registry: Optional[ModelRegistry] = None):
+        registry = registry or self._models.ModelRegistry()
         self.chain: str = data.get('chain')
         self.type: str = data.get('cate_id')
         self.tx_id: str = data.get('id')
         self.timestamp: float = data.get('time_at')
         self.sender: Optional[str] = None
         self.recipient: Optional[str] = None
-        self.receives: Optional[List[Token, NFT]] = None
-        self.sends: Optional[List[Token, NFT]] = None
+        self.receives: Optional[List[Token or NFT]] = None
+        self.sends: Optional[List[Token or NFT]] = None
         self.token_approve: Optional[Token] = None
         self.eth_gas_fee: Optional[float] = None
         self.usd_gas_fee: Optional[float] = None
@@ -367,74 +812,60 @@ class Tx(AutoRepr):
         if receives:
             self.receives = []
             for item in receives:
-                token = token_dict.get(item.get('token_id'))
-                token['amount'] = item.get('amount')
-                # if 'price' in token and token['price'] is None:
-                #     token['price'] = 0.0
-
-                try:
-                    token = Token(data=token)
-
-                except:
-                    pay_token = token.get('pay_token')
-                    if pay_token:
-                        token['pay_token'] = token_dict.get(pay_token.get('id'))
-
-                    token = NFT(data=token)
-
-                token.amount = item.get('amount')
-                self.receives.append(token)
+                token = registry.get_token(
+                    chain=self.chain, token_id=item.get('token_id'), token_dict=token_dict, amount=item.get('amount'),
+                    tx_id=self.tx_id
+                )
+                if token:
+                    self.receives.append(token)
 
         sends = data.get('sends')
         if sends:
             self.sends = []
             for item in sends:
-                token = token_dict.get(item.get('token_id'))
-                token['amount'] = item.get('amount')
-                # if 'price' in token and token['price'] is None:
-                #     token['price'] = 0.0
-
-                try:
-                    token = Token(data=token)
-
-                except:
-                    pay_token = token.get('pay_token')
-                    if pay_token:
-                        token['pay_token'] = token_dict.get(pay_token.get('id'))
-
-                    token = NFT(data=token)
-
-                token.amount = item.get('amount')
-                self.sends.append(token)
+                token = registry.get_token(
+                    chain=self.chain, token_id=item.get('token_id'), token_dict=token_dict, amount=item.get('amount'),
+                    tx_id=self.tx_id
+                )
+                if token:
+                    self.sends.append(token)
 
         token_approve = data.get('token_approve')
         if token_approve:
-            token = token_dict.get(token_approve.get('token_id'))
-            token['amount'] = token_approve.get('value')
-            self.token_approve = Token(data=token)
+            self.token_approve = registry.get_token(
+                chain=self.chain, token_id=token_approve.get('token_id'), token_dict=token_dict,
+                amount=token_approve.get('value'), tx_id=self.tx_id
+            )
 
         project_id = data.get('project_id')
         if project_id:
-            self.project = Project(data=data.get('project_dict')[project_id])
+            self.project = registry.get_project(
+                chain=self.chain, project_id=project_id, project_dict=data.get('project_dict')
+            )
 
 
-class History(AutoRepr):
-    def __init__(self, address: str, data: dict):
+class Tx(BaseTx, AutoRepr):
+    pass
+
+
+class History(Model, AutoRepr):
+    def __init__(self, address: str, data: dict, registry: Optional[ModelRegistry] = None):
         self.address: str = address.lower()
         self.txs: Optional[List[AutoRepr]] = None
 
-        self.parse_txs(address=self.address, data=data)
+        self.parse_txs(address=self.address, data=data, registry=registry)
 
-    def parse_txs(self, address: str, data: dict) -> None:
+    def parse_txs(self, address: str, data: dict, registry: Optional[ModelRegistry] = None) -> None:
         txs = data.get('history_list')
         if not txs:
             return
 
+        registry = registry or self._models.ModelRegistry()
         self.txs = []
         for tx in txs:
             tx.update({'address': address, 'project_dict': data.get('project_dict'),
                        'token_dict': data.get('token_dict')})
-            self.txs.append(Tx(data=tx))
+            self.txs.append(self._models.Tx(data=tx, registry=registry))
 
 
 class User(AutoRepr):
@@ -475,3 +906,15 @@ class Info(AutoRepr):
         self.uncharged_offer_value: int = data.get('uncharged_offer_value')
         self.unread_message_count: int = data.get('unread_message_count')
         self.user: User = User(data=data.get('user'))
+
+
+class ScanResult(AutoRepr):
+    def __init__(
+            self, address: str, chains: Optional[Dict[str, Chain]] = None, history: Optional[History] = None,
+            total_balance: Optional[float] = None, exception: Optional[Exception] = None
+    ):
+        self.address: str = address
+        self.chains: Optional[Dict[str, Chain]] = chains
+        self.history: Optional[History] = history
+        self.total_balance: Optional[float] = total_balance
+        self.exception: Optional[Exception] = exception
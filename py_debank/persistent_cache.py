@@ -0,0 +1,251 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+from urllib.parse import urlencode
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+
+class PersistentCacheStats(AutoRepr):
+    def __init__(self, hits: int, misses: int, entries: int, size: int):
+        self.hits: int = hits
+        self.misses: int = misses
+        self.entries: int = entries
+        self.size: int = size
+
+
+class PersistentCache:
+    """
+    An on-disk SQLite cache of immutable responses, e.g. historical token prices and settled history pages.
+
+    The database works in WAL mode, so several threads and processes may read it while one of them writes. When
+    the size of cached responses exceeds the limit, the least recently used ones are removed.
+
+    Attributes:
+        path (str): the path to the database file.
+        max_size (int): the maximum size in bytes of compressed responses.
+        settle_after (float): how many seconds must pass after a point in time for its data to be immutable.
+        price_bucket (int): the width in seconds of buckets historical price timestamps are rounded down to.
+
+    """
+
+    def __init__(
+            self, path: str = 'py_debank_cache.sqlite3', max_size: int = 512 * 1024 * 1024,
+            settle_after: float = 3 * 3600, price_bucket: int = 300
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            path (str): the path to the database file. ('py_debank_cache.sqlite3')
+            max_size (int): the maximum size in bytes of compressed responses. (512 MiB)
+            settle_after (float): how many seconds must pass after a point in time for its data to be immutable.
+                (3 hours)
+            price_bucket (int): the width in seconds of buckets historical price timestamps are rounded down to. (300)
+
+        """
+        self.path: str = path
+        self.max_size: int = max_size
+        self.settle_after: float = settle_after
+        self.price_bucket: int = price_bucket
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+        connection = self._get_connection()
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, content BLOB NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+        connection.commit()
+        self._size: int = connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the database connection of the current thread, it is created on the first call.
+
+        Returns:
+            sqlite3.Connection: the connection.
+
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+
+        return connection
+
+    def close(self) -> None:
+        """
+        Close the database connection of the current thread.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def is_settled(self, time_at: int or str) -> bool:
+        """
+        Check if the data at a point in time can no longer change.
+
+        Args:
+            time_at (int or str): the point in time.
+
+        Returns:
+            bool: True if the data is immutable.
+
+        """
+        return float(time_at) <= time.time() - self.settle_after
+
+    def bucket_time(self, time_at: int or str) -> int:
+        """
+        Round a historical price timestamp down to its bucket, so that close timestamps share a cached price.
+
+        Args:
+            time_at (int or str): the timestamp.
+
+        Returns:
+            int: the rounded timestamp.
+
+        """
+        return int(float(time_at)) // self.price_bucket * self.price_bucket
+
+    @staticmethod
+    def _make_key(url: str, params: Optional[dict]) -> str:
+        return url + '?' + urlencode(sorted((key, str(value)) for key, value in (params or {}).items()))
+
+    def get(self, url: str, params: Optional[dict] = None) -> Optional[bytes]:
+        """
+        Get a cached response.
+
+        Args:
+            url (str): the URL.
+            params (Optional[dict]): the query parameters. (None)
+
+        Returns:
+            Optional[bytes]: the body of the response or None if it isn't cached.
+
+        """
+        key = self._make_key(url=url, params=params)
+        connection = self._get_connection()
+        row = connection.execute('SELECT content, accessed_at FROM responses WHERE key = ?', (key,)).fetchone()
+        with self._lock:
+            if not row:
+                self._misses += 1
+                return
+
+            self._hits += 1
+
+        now = time.time()
+        if row[1] < now - 3600:
+            connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            connection.commit()
+
+        return zlib.decompress(row[0])
+
+    def set(self, url: str, params: Optional[dict], content: bytes) -> None:
+        """
+        Cache a response.
+
+        Args:
+            url (str): the URL.
+            params (Optional[dict]): the query parameters.
+            content (bytes): the body of the response.
+
+        """
+        key = self._make_key(url=url, params=params)
+        compressed = zlib.compress(content)
+        size = len(compressed) + len(key)
+        connection = self._get_connection()
+        with self._lock:
+            row = connection.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            connection.execute(
+                'INSERT OR REPLACE INTO responses (key, content, size, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, compressed, size, time.time())
+            )
+            connection.commit()
+            self._size += size - (row[0] if row else 0)
+            if self._size > self.max_size:
+                self._evict(connection=connection, target_size=int(self.max_size * 0.9))
+
+    def _evict(self, connection: sqlite3.Connection, target_size: int) -> None:
+        """
+        Remove the least recently used responses until their size is not greater than the target, the lock must be
+        held.
+
+        Args:
+            connection (sqlite3.Connection): the database connection.
+            target_size (int): the target size in bytes.
+
+        """
+        excess = self._size - target_size
+        rows = connection.execute('SELECT key, size FROM responses ORDER BY accessed_at')
+        keys = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+
+            keys.append((key,))
+            excess -= size
+            self._size -= size
+
+        rows.close()
+        connection.executemany('DELETE FROM responses WHERE key = ?', keys)
+        connection.commit()
+
+    def compact(self, max_age: Optional[float] = None) -> None:
+        """
+        Remove responses that weren't used for a long time and over the size limit, then shrink the database file.
+
+        Args:
+            max_age (Optional[float]): remove responses that weren't used for this number of seconds. (None)
+
+        """
+        connection = self._get_connection()
+        with self._lock:
+            if max_age is not None:
+                connection.execute('DELETE FROM responses WHERE accessed_at < ?', (time.time() - max_age,))
+                connection.commit()
+                self._size = connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+            if self._size > self.max_size:
+                self._evict(connection=connection, target_size=self.max_size)
+
+            connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            connection.execute('VACUUM')
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        connection = self._get_connection()
+        with self._lock:
+            connection.execute('DELETE FROM responses')
+            connection.commit()
+            self._size = 0
+
+    def stats(self) -> PersistentCacheStats:
+        """
+        Get statistics of the cache.
+
+        Returns:
+            PersistentCacheStats: the statistics, the hits and misses are counted since the cache was opened.
+
+        """
+        entries = self._get_connection().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        with self._lock:
+            return PersistentCacheStats(hits=self._hits, misses=self._misses, entries=entries, size=self._size)
+
+    @property
+    def file_size(self) -> int:
+        """
+        The size in bytes of the database file.
+        """
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
@@ -1,13 +1,13 @@
 from typing import Optional, Dict, List
 
-import requests
-
-from py_debank.models import Entrypoints, Chain
-from py_debank.utils import get_proxy_dict, check_response, get_headers
+from py_debank.client import DebankClient, get_default_client
+from py_debank.models import Chain, LazyChain
+from py_debank.utils import sort_by_usd_value
 
 
 def project_list(
-        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[DebankClient] = None
 ) -> Dict[str, Chain] or Dict[str, dict]:
     """
     Get projects where the account's assets are located (liquidity, staking, etc.)
@@ -17,6 +17,8 @@ def project_list(
         raw_data (bool): if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        lazy (bool): if True, projects will be created only when they are accessed. (False)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
 
     Returns:
         Dict[str, Chain] or Dict[str, dict]: projects where the account's assets are located.
@@ -28,31 +30,12 @@ def project_list(
             }
 
     """
-    params = {
-        'user_addr': address
-    }
-    response = requests.get(
-        url=Entrypoints.PUBLIC.PORTFOLIO + 'project_list', params=params, headers=get_headers(),
-        proxies=get_proxy_dict(proxies=proxies)
-    )
-    json_response = check_response(response=response)
-    chain_dict = {}
-    for token in json_response['data']:
-        chain = token['chain']
-        if chain in chain_dict:
-            chain_dict[chain].append(token)
-
-        else:
-            chain_dict[chain] = [token]
-
+    client = client or get_default_client()
+    chain_dict = client.call(call=client.backend.project_list(address=address), proxies=proxies)
     if not raw_data:
-        chain_list = [Chain(name=name, projects=projects) for name, projects in chain_dict.items()]
-        chain_dict = {}
-        for chain in sorted(chain_list, key=lambda chain: chain.usd_value, reverse=True):
-            chain_dict[chain.name] = chain
-
-        chain_dict = {
-            key: value for key, value in sorted(chain_dict.items(), key=lambda item: item[1].usd_value, reverse=True)
-        }
+        chain_class = LazyChain if lazy else Chain
+        chain_dict = sort_by_usd_value(
+            instances={name: chain_class(name=name, projects=projects) for name, projects in chain_dict.items()}
+        )
 
     return chain_dict
@@ -0,0 +1,132 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple, Iterable
+
+from py_debank import history
+from py_debank.client import DebankClient, get_default_client
+
+
+class PriceService:
+    """
+    Looks up historical token prices in batches on top of 'history.token_price'.
+
+    Timestamps are rounded down to buckets, duplicate lookups are requested once, unique ones are requested
+    concurrently and historical prices are kept in a cache shared by all batches of the service.
+
+    Attributes:
+        client (DebankClient): a client for making requests.
+        bucket (int): the width in seconds of buckets timestamps are rounded down to, 0 disables rounding.
+        max_workers (int): the maximum number of prices requested concurrently.
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making requests.
+
+    """
+
+    def __init__(
+            self, bucket: int = 300, max_workers: Optional[int] = None, proxies: Optional[str or List[str]] = None,
+            client: Optional[DebankClient] = None
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            bucket (int): the width in seconds of buckets timestamps are rounded down to, 0 disables rounding. (300)
+            max_workers (Optional[int]): the maximum number of prices requested concurrently. (the client max_workers)
+            proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+                requests. (the client proxies)
+            client (Optional[DebankClient]): a client for making requests. (the default client)
+
+        """
+        self.client: DebankClient = client or get_default_client()
+        self.bucket: int = bucket
+        self.max_workers: int = max_workers or self.client.max_workers
+        self.proxies: Optional[str or List[str]] = proxies
+        self._prices: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def make_key(self, token_id: str, chain: str, time_at: Optional[int or str] = None) -> tuple:
+        """
+        Make a key of a lookup with the timestamp rounded down to its bucket.
+
+        Args:
+            token_id (str): a token contract address or a coin name.
+            chain (str): a chain.
+            time_at (Optional[int or str]): at what point in time to get a token price. (current time)
+
+        Returns:
+            tuple: the key.
+
+        """
+        if time_at is not None and self.bucket:
+            time_at = int(float(time_at)) // self.bucket * self.bucket
+
+        return token_id.lower(), chain, time_at
+
+    def get_prices(self, lookups: Iterable[Tuple[str, str, Optional[int or str]]]) -> List[float]:
+        """
+        Get token prices of a batch of lookups.
+
+        Args:
+            lookups (Iterable[Tuple[str, str, Optional[int or str]]]): token ID, chain and time lookups, a time of
+                None means the current price, current prices aren't cached between batches.
+
+        Returns:
+            List[float]: the prices in the order of the lookups.
+
+        """
+        keys = [self.make_key(*lookup) for lookup in lookups]
+        with self._lock:
+            prices = {key: self._prices[key] for key in keys if key in self._prices}
+
+        missing = list(dict.fromkeys(key for key in keys if key not in prices))
+        if len(missing) <= 1 or self.max_workers <= 1:
+            fetched = [self._fetch(key=key) for key in missing]
+
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                fetched = list(executor.map(self._fetch, missing))
+
+        prices.update(zip(missing, fetched))
+        return [prices[key] for key in keys]
+
+    def get_price(self, token_id: str, chain: str, time_at: Optional[int or str] = None) -> float:
+        """
+        Get a token price at a certain point in time.
+
+        Args:
+            token_id (str): a token contract address or a coin name.
+            chain (str): a chain.
+            time_at (Optional[int or str]): at what point in time to get a token price. (current time)
+
+        Returns:
+            float: the token price.
+
+        """
+        return self.get_prices(lookups=[(token_id, chain, time_at)])[0]
+
+    def _fetch(self, key: tuple) -> float:
+        """
+        Request a price and cache it if it's historical.
+
+        Args:
+            key (tuple): the key of the lookup.
+
+        Returns:
+            float: the token price.
+
+        """
+        token_id, chain, time_at = key
+        price = history.token_price(
+            token_id=token_id, chain=chain, time_at=time_at, proxies=self.proxies, client=self.client
+        )
+        if time_at is not None:
+            with self._lock:
+                self._prices[key] = price
+
+        return price
+
+    def clear(self) -> None:
+        """
+        Remove all cached prices.
+        """
+        with self._lock:
+            self._prices.clear()
@@ -0,0 +1,163 @@
+import copy
+import random
+import threading
+import time
+from typing import Optional, List, Dict
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+
+class ProxyStats(AutoRepr):
+    def __init__(self, proxy: str):
+        self.proxy: str = proxy
+        self.requests: int = 0
+        self.errors: int = 0
+        self.too_many_requests: int = 0
+        self.latency: Optional[float] = None
+        self.error_rate: float = 0.0
+        self.too_many_requests_rate: float = 0.0
+        self.consecutive_failures: int = 0
+        self.cooldown_until: float = 0.0
+
+    @property
+    def score(self) -> float:
+        """
+        A selection weight of the proxy, the healthier and faster it is, the greater the weight.
+        """
+        latency = self.latency if self.latency is not None else 1.0
+        return (1 - self.error_rate) * (1 - self.too_many_requests_rate) ** 2 / max(latency, 0.05) + 1e-3
+
+
+class ProxyPool:
+    """
+    A proxy pool that prefers healthy proxies and puts failing ones on cooldown.
+
+    Every proxy is weighted by its latency, error rate and "429 Too Many Requests" rate. A proxy that fails is put on
+    cooldown that doubles with every consecutive failure, after the cooldown it returns to the rotation automatically.
+
+    Attributes:
+        base_cooldown (float): the cooldown in seconds after the first failure.
+        max_cooldown (float): the maximum cooldown in seconds.
+        smoothing (float): the weight of the latest request in the moving averages.
+
+    """
+
+    def __init__(
+            self, proxies: List[str], base_cooldown: float = 5.0, max_cooldown: float = 600.0, smoothing: float = 0.2
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            proxies (List[str]): HTTP proxies.
+            base_cooldown (float): the cooldown in seconds after the first failure. (5)
+            max_cooldown (float): the maximum cooldown in seconds. (600)
+            smoothing (float): the weight of the latest request in the moving averages. (0.2)
+
+        """
+        self.base_cooldown: float = base_cooldown
+        self.max_cooldown: float = max_cooldown
+        self.smoothing: float = smoothing
+        self._stats: Dict[str, ProxyStats] = {proxy: ProxyStats(proxy=proxy) for proxy in proxies}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __contains__(self, proxy: str) -> bool:
+        return proxy in self._stats
+
+    def add(self, proxy: str) -> None:
+        """
+        Add a proxy to the pool.
+
+        Args:
+            proxy (str): an HTTP proxy.
+
+        """
+        with self._lock:
+            if proxy not in self._stats:
+                self._stats[proxy] = ProxyStats(proxy=proxy)
+
+    def remove(self, proxy: str) -> None:
+        """
+        Remove a proxy from the pool.
+
+        Args:
+            proxy (str): an HTTP proxy.
+
+        """
+        with self._lock:
+            self._stats.pop(proxy, None)
+
+    def choose(self) -> Optional[str]:
+        """
+        Choose a proxy, healthy proxies are chosen more often, proxies on cooldown aren't chosen.
+
+        Returns:
+            Optional[str]: the proxy, if all proxies are on cooldown, the one that recovers first.
+
+        """
+        with self._lock:
+            if not self._stats:
+                return
+
+            now = time.monotonic()
+            available = [stats for stats in self._stats.values() if stats.cooldown_until <= now]
+            if not available:
+                return min(self._stats.values(), key=lambda stats: stats.cooldown_until).proxy
+
+            return random.choices(available, weights=[stats.score for stats in available])[0].proxy
+
+    def report(
+            self, proxy: str, latency: Optional[float] = None, status_code: Optional[int] = None, error: bool = False
+    ) -> None:
+        """
+        Report the result of a request sent through a proxy.
+
+        Args:
+            proxy (str): the proxy.
+            latency (Optional[float]): how many seconds the request took. (None)
+            status_code (Optional[int]): the status code of a response. (None)
+            error (bool): whether the request failed without a response, e.g. a connection error. (False)
+
+        """
+        with self._lock:
+            stats = self._stats.get(proxy)
+            if not stats:
+                return
+
+            too_many_requests = status_code == 429
+            failed = error or too_many_requests or (status_code is not None and status_code >= 500)
+            stats.requests += 1
+            stats.errors += failed
+            stats.too_many_requests += too_many_requests
+            stats.error_rate += self.smoothing * (failed - stats.error_rate)
+            stats.too_many_requests_rate += self.smoothing * (too_many_requests - stats.too_many_requests_rate)
+            if latency is not None and not error:
+                if stats.latency is None:
+                    stats.latency = latency
+
+                else:
+                    stats.latency += self.smoothing * (latency - stats.latency)
+
+            if failed:
+                stats.consecutive_failures += 1
+                cooldown = min(self.base_cooldown * 2 ** (stats.consecutive_failures - 1), self.max_cooldown)
+                stats.cooldown_until = time.monotonic() + cooldown
+
+            else:
+                stats.consecutive_failures = 0
+
+    def stats(self) -> Dict[str, ProxyStats]:
+        """
+        Get statistics of all proxies.
+
+        Returns:
+            Dict[str, ProxyStats]: snapshots of the statistics, sorted by the score in descending order.
+
+        """
+        with self._lock:
+            snapshots = [copy.copy(stats) for stats in self._stats.values()]
+
+        return {stats.proxy: stats for stats in sorted(snapshots, key=lambda stats: stats.score, reverse=True)}
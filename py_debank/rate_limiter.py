@@ -0,0 +1,143 @@
+import threading
+import time
+from typing import Optional, Dict
+from urllib.parse import urlparse
+
+ENDPOINT_FAMILIES = ('asset', 'history', 'nft', 'portfolio', 'token', 'user')
+
+
+def get_endpoint_family(url: str) -> Optional[str]:
+    """
+    Get the endpoint family of a URL, e.g. 'nft' for 'https://api.debank.com/nft/collection_list'.
+
+    Args:
+        url (str): the URL.
+
+    Returns:
+        Optional[str]: the endpoint family.
+
+    """
+    for part in urlparse(url).path.split('/'):
+        if part in ENDPOINT_FAMILIES:
+            return part
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that hands out reservations instead of blocking.
+
+    Attributes:
+        rate (float): how many tokens are added per second.
+        capacity (float): the maximum number of tokens, i.e. the allowed burst.
+
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the class.
+
+        Args:
+            rate (float): how many tokens are added per second.
+            capacity (Optional[float]): the maximum number of tokens, i.e. the allowed burst. (the rate, at least 1)
+
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens: float = self.capacity
+        self._updated_at: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, the bucket may go into debt if it's empty.
+
+        Returns:
+            float: how many seconds to wait before the token may be used.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Paces outgoing requests per endpoint family (nft, token, portfolio, history, user, asset) and per proxy.
+
+    Attributes:
+        limits (Dict[str, float]): requests per second allowed for endpoint families.
+        proxy_limit (Optional[float]): requests per second allowed for each proxy.
+        burst (Optional[float]): how many requests may be sent at once before pacing starts.
+
+    """
+
+    def __init__(
+            self, limits: Optional[Dict[str, float]] = None, proxy_limit: Optional[float] = None,
+            burst: Optional[float] = None
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            limits (Optional[Dict[str, float]]): requests per second allowed for endpoint families, e.g.
+                {'nft': 0.5, 'token': 5}. (unlimited)
+            proxy_limit (Optional[float]): requests per second allowed for each proxy, requests without a proxy
+                share one limit. (unlimited)
+            burst (Optional[float]): how many requests may be sent at once before pacing starts. (the limit, at least 1)
+
+        """
+        self.limits: Dict[str, float] = limits or {}
+        self.proxy_limit: Optional[float] = proxy_limit
+        self.burst: Optional[float] = burst
+        self._family_buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(rate=rate, capacity=burst) for family, rate in self.limits.items()
+        }
+        self._proxy_buckets: Dict[Optional[str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _get_proxy_bucket(self, proxy: Optional[str]) -> TokenBucket:
+        """
+        Get the bucket of a proxy, it is created on the first call.
+
+        Args:
+            proxy (Optional[str]): the proxy.
+
+        Returns:
+            TokenBucket: the bucket.
+
+        """
+        with self._lock:
+            bucket = self._proxy_buckets.get(proxy)
+            if not bucket:
+                bucket = TokenBucket(rate=self.proxy_limit, capacity=self.burst)
+                self._proxy_buckets[proxy] = bucket
+
+            return bucket
+
+    def reserve(self, url: str, proxy: Optional[str] = None) -> float:
+        """
+        Reserve a slot for a request.
+
+        Args:
+            url (str): the URL of the request.
+            proxy (Optional[str]): the proxy the request will be sent through. (None)
+
+        Returns:
+            float: how many seconds to wait before sending the request.
+
+        """
+        delay = 0.0
+        bucket = self._family_buckets.get(get_endpoint_family(url))
+        if bucket:
+            delay = bucket.reserve()
+
+        if self.proxy_limit:
+            delay = max(delay, self._get_proxy_bucket(proxy=proxy).reserve())
+
+        return delay
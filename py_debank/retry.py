@@ -0,0 +1,118 @@
+import random
+from typing import Optional, Tuple, Type
+
+import requests
+
+from py_debank.exceptions import DebankException
+
+TRANSIENT_ERRORS: Tuple[Type[Exception], ...] = (
+    ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout,
+    requests.exceptions.ChunkedEncodingError
+)
+try:
+    import aiohttp
+
+    TRANSIENT_ERRORS += (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+
+except ImportError:
+    pass
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests to retry and how long to wait before the next attempt.
+
+    Retryable failures are "429 Too Many Requests", 5xx responses, connection errors and timeouts. Other 4xx
+    responses and responses with an 'error_code' are fatal.
+
+    Attributes:
+        attempts (int): the maximum number of attempts including the first one.
+        backoff (float): the delay in seconds before the second attempt, it doubles with every attempt.
+        max_backoff (float): the maximum delay in seconds.
+        jitter (bool): whether to randomize the delay to spread out retries of concurrent requests.
+        retry_statuses (Tuple[int, ...]): status codes to retry.
+        max_retry_after (float): the longest 'Retry-After' in seconds to wait for, a longer one makes the failure fatal.
+
+    """
+
+    def __init__(
+            self, attempts: int = 3, backoff: float = 0.5, max_backoff: float = 30.0, jitter: bool = True,
+            retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504), max_retry_after: float = 60.0
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            attempts (int): the maximum number of attempts including the first one. (3)
+            backoff (float): the delay in seconds before the second attempt, it doubles with every attempt. (0.5)
+            max_backoff (float): the maximum delay in seconds. (30)
+            jitter (bool): whether to randomize the delay to spread out retries of concurrent requests. (True)
+            retry_statuses (Tuple[int, ...]): status codes to retry. (429, 500, 502, 503, 504)
+            max_retry_after (float): the longest 'Retry-After' in seconds to wait for, a longer one makes the failure
+                fatal. (60)
+
+        """
+        self.attempts: int = attempts
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.jitter: bool = jitter
+        self.retry_statuses: Tuple[int, ...] = retry_statuses
+        self.max_retry_after: float = max_retry_after
+
+    def is_retryable(self, exception: Exception) -> bool:
+        """
+        Check if a failure is transient and the request may be retried.
+
+        Args:
+            exception (Exception): the raised exception.
+
+        Returns:
+            bool: True if the request may be retried.
+
+        """
+        if isinstance(exception, DebankException):
+            if exception.error_msg or exception.status_code not in self.retry_statuses:
+                return False
+
+            return exception.retry_after is None or exception.retry_after <= self.max_retry_after
+
+        return isinstance(exception, TRANSIENT_ERRORS)
+
+    def get_delay(self, attempt: int, exception: Optional[Exception] = None) -> float:
+        """
+        Get how long to wait before the next attempt.
+
+        Args:
+            attempt (int): the number of the failed attempt starting from 1.
+            exception (Optional[Exception]): the raised exception. (None)
+
+        Returns:
+            float: the delay in seconds.
+
+        """
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+
+        retry_after = getattr(exception, 'retry_after', None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+    def should_retry(self, attempt: int, exception: Exception) -> bool:
+        """
+        Check if a request should be sent again after a failed attempt.
+
+        Args:
+            attempt (int): the number of the failed attempt starting from 1.
+            exception (Exception): the raised exception.
+
+        Returns:
+            bool: True if the request should be sent again.
+
+        """
+        return attempt < self.attempts and self.is_retryable(exception=exception)
+
+
+NO_RETRY = RetryPolicy(attempts=1)
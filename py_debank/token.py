@@ -1,13 +1,13 @@
 from typing import Optional, List, Dict
 
-import requests
-
-from py_debank.models import Entrypoints, Chain, ChainNames
-from py_debank.utils import get_proxy_dict, check_response, get_headers
+from py_debank.client import DebankClient, get_default_client
+from py_debank.models import Chain, ChainNames, LazyChain
+from py_debank.utils import sort_by_usd_value
 
 
 def balance_list(
-        address: str, chain: ChainNames or str, raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, chain: ChainNames or str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[DebankClient] = None
 ) -> Chain or dict:
     """
     Get token balances of an address of a certain chain.
@@ -18,28 +18,25 @@ def balance_list(
         raw_data (bool): if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        lazy (bool): if True, tokens will be created only when they are accessed. (False)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
 
     Returns:
         Chain: token balances.
 
     """
-    params = {
-        'user_addr': address,
-        'is_all': 'false',
-        'chain': chain}
-    response = requests.get(
-        url=Entrypoints.PUBLIC.TOKEN + 'balance_list', params=params, headers=get_headers(),
-        proxies=get_proxy_dict(proxies=proxies)
-    )
-    json_response = check_response(response=response)
+    client = client or get_default_client()
+    tokens = client.call(call=client.backend.balance_list(address=address, chain=chain), proxies=proxies)
     if raw_data:
-        return {chain: json_response['data']}
+        return {chain: tokens}
 
-    return Chain(name=chain, tokens=json_response['data'])
+    chain_class = LazyChain if lazy else Chain
+    return chain_class(name=chain, tokens=tokens)
 
 
 def cache_balance_list(
-        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        lazy: bool = False, client: Optional[DebankClient] = None
 ) -> Dict[str, Chain] or Dict[str, dict]:
     """
     Get cached token balances of an address of all chains (current at the time of the last balance_list queries).
@@ -49,6 +46,8 @@ def cache_balance_list(
         raw_data (bool): if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        lazy (bool): if True, tokens will be created only when they are accessed. (False)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
 
     Returns:
         Dict[str, Chain] or Dict[str, dict]: token balances.
@@ -60,27 +59,12 @@ def cache_balance_list(
             }
 
     """
-    params = {
-        'user_addr': address
-    }
-    response = requests.get(
-        url=Entrypoints.PUBLIC.TOKEN + 'cache_balance_list', params=params, headers=get_headers(),
-        proxies=get_proxy_dict(proxies=proxies)
-    )
-    json_response = check_response(response=response)
-    chain_dict = {}
-    for token in json_response['data']:
-        chain = token['chain']
-        if chain in chain_dict:
-            chain_dict[chain].append(token)
-
-        else:
-            chain_dict[chain] = [token]
-
+    client = client or get_default_client()
+    chain_dict = client.call(call=client.backend.cache_balance_list(address=address), proxies=proxies)
     if not raw_data:
-        chain_list = [Chain(name=name, tokens=tokens) for name, tokens in chain_dict.items()]
-        chain_dict = {}
-        for chain in sorted(chain_list, key=lambda chain: chain.usd_value, reverse=True):
-            chain_dict[chain.name] = chain
+        chain_class = LazyChain if lazy else Chain
+        chain_dict = sort_by_usd_value(
+            instances={name: chain_class(name=name, tokens=tokens) for name, tokens in chain_dict.items()}
+        )
 
     return chain_dict
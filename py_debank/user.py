@@ -1,12 +1,12 @@
 from typing import Optional, List
 
-import requests
-
+from py_debank.client import DebankClient, get_default_client
 from py_debank.models import Info, User, Entrypoints
-from py_debank.utils import get_proxy_dict, check_response, get_headers
 
 
-def addr(address: str, proxies: Optional[str or List[str]] = None) -> User:
+def addr(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> User:
     """
     Get a DeBank user.
 
@@ -14,23 +14,19 @@ def addr(address: str, proxies: Optional[str or List[str]] = None) -> User:
         address (str): an address.
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
 
     Returns:
         User: the DeBank user.
 
     """
-    params = {
-        'addr': address
-    }
-    response = requests.get(
-        url=Entrypoints.PUBLIC.USER + 'addr', params=params, headers=get_headers(),
-        proxies=get_proxy_dict(proxies=proxies)
-    )
-    json_response = check_response(response=response)
-    return User(data=json_response['data'])
+    client = client or get_default_client()
+    return User(data=client.call(call=client.backend.addr(address=address), proxies=proxies))
 
 
-def info(address: str, proxies: Optional[str or List[str]] = None) -> Info:
+def info(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> Info:
     """
     Get an information about a DeBank user.
 
@@ -38,23 +34,23 @@ def info(address: str, proxies: Optional[str or List[str]] = None) -> Info:
         address (str): an address.
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
 
     Returns:
         Info: the information about the DeBank user.
 
     """
+    client = client or get_default_client()
     params = {
         'id': address
     }
-    response = requests.get(
-        url=Entrypoints.PUBLIC.ENTRYPOINT + 'hi/user/info', params=params, headers=get_headers(),
-        proxies=get_proxy_dict(proxies=proxies)
-    )
-    json_response = check_response(response=response)
+    json_response = client.get(url=Entrypoints.PUBLIC.ENTRYPOINT + 'hi/user/info', params=params, proxies=proxies)
     return Info(data=json_response['data'])
 
 
-def total_balance(address: str, proxies: Optional[str or List[str]] = None) -> float:
+def total_balance(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> float:
     """
     Get a total balance of an address.
 
@@ -62,17 +58,11 @@ def total_balance(address: str, proxies: Optional[str or List[str]] = None) -> f
         address (str): an address.
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client for making requests. (the default client)
 
     Returns:
         float: the total balance.
 
     """
-    params = {
-        'addr': address
-    }
-    response = requests.get(
-        url=Entrypoints.PUBLIC.USER + 'total_balance', params=params, headers=get_headers(),
-        proxies=get_proxy_dict(proxies=proxies)
-    )
-    json_response = check_response(response=response)
-    return json_response['data']['total_usd_value']
+    client = client or get_default_client()
+    return client.call(call=client.backend.total_balance(address=address), proxies=proxies)
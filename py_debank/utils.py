@@ -1,77 +1,209 @@
 import random
-from typing import Optional, List, Dict
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Any, Mapping
 
 import requests
-from fake_useragent import UserAgent
 
 from py_debank import exceptions
+from py_debank.decoders import JsonDecoder, get_default_decoder
+from py_debank.header_provider import get_default_header_provider
+from py_debank.proxy_pool import ProxyPool
 
 
-def get_headers() -> Dict[str, str]:
+def get_headers(proxy: Optional[str] = None) -> Mapping[str, str]:
     """
-    Get headers for a request.
+    Get headers for a request from the default header provider.
+
+    Args:
+        proxy (Optional[str]): the proxy the request will be sent through. (None)
 
     Returns:
-        dict: headers.
+        Mapping[str, str]: read-only headers.
 
     """
-    return {
-        'accept': '*/*',
-        'accept-language': 'en-US,en;q=0.9',
-        'origin': 'https://debank.com',
-        'referer': 'https://debank.com/',
-        'source': 'web',
-        'user-agent': UserAgent().chrome
-    }
+    return get_default_header_provider().get(proxy=proxy)
 
 
-def get_proxy_dict(proxies: Optional[str or List[str]] = None) -> Optional[dict]:
+def choose_proxy(proxies: Optional[str or List[str] or ProxyPool] = None) -> Optional[str]:
     """
-    Construct a proxy dictionary for use in the 'requests' library.
+    Choose a proxy for making a request.
 
     Args:
-        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
-            a request. (None)
+        proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for random choice or a proxy
+            pool for health-weighted choice for making a request. (None)
 
     Returns:
-        Optional[dict]: the proxy dictionary with the selected proxy.
+        Optional[str]: the selected proxy.
 
     """
     if not proxies:
         return
 
     if isinstance(proxies, str):
-        proxy = proxies
+        return proxies
+
+    if isinstance(proxies, list):
+        return random.choice(proxies)
+
+    if isinstance(proxies, ProxyPool):
+        return proxies.choose()
+
+
+def get_proxy_url(proxies: Optional[str or List[str] or ProxyPool] = None) -> Optional[str]:
+    """
+    Construct a proxy URL for use in the 'aiohttp' library.
 
-    elif isinstance(proxies, list):
-        proxy = random.choice(proxies)
+    Args:
+        proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for random choice or a proxy
+            pool for health-weighted choice for making a request. (None)
 
-    else:
+    Returns:
+        Optional[str]: the selected proxy URL.
+
+    """
+    proxy = choose_proxy(proxies=proxies)
+    if not proxy:
         return
 
     if 'http' not in proxy:
         proxy = f'http://{proxy}'
 
+    return proxy
+
+
+def get_proxy_dict(proxies: Optional[str or List[str] or ProxyPool] = None) -> Optional[dict]:
+    """
+    Construct a proxy dictionary for use in the 'requests' library.
+
+    Args:
+        proxies (Optional[str or List[str] or ProxyPool]): an HTTP proxy, a proxy list for random choice or a proxy
+            pool for health-weighted choice for making a request. (None)
+
+    Returns:
+        Optional[dict]: the proxy dictionary with the selected proxy.
+
+    """
+    proxy = get_proxy_url(proxies=proxies)
+    if not proxy:
+        return
+
     return {'http': proxy, 'https': proxy}
 
 
-def check_response(response: requests.Response) -> dict:
+def check_response(response: requests.Response, decoder: Optional[JsonDecoder] = None) -> dict:
     """
     Check if a request was sent successfully.
 
     Args:
         response (requests.Response): the response instance.
+        decoder (Optional[JsonDecoder]): the decoder of the body. (the default decoder)
+
+    Returns:
+        dict: the json-encoded content of a response.
+
+    """
+    return parse_response(
+        status_code=response.status_code, content=response.content, headers=response.headers, decoder=decoder
+    )
+
+
+def parse_response(
+        status_code: int, content: bytes, headers: Optional[Mapping[str, str]] = None,
+        decoder: Optional[JsonDecoder] = None
+) -> dict:
+    """
+    Check if a request was sent successfully by its status code and body, bodies of the Pro API aren't wrapped
+    into {'error_code': ..., 'data': ...}, its errors are reported by the status code only.
+
+    Args:
+        status_code (int): the status code of a response.
+        content (bytes): the body of a response.
+        headers (Optional[Mapping[str, str]]): the headers of a response. (None)
+        decoder (Optional[JsonDecoder]): the decoder of the body. (the default decoder)
 
     Returns:
         dict: the json-encoded content of a response.
 
     """
-    status_code = response.status_code
     if status_code != requests.codes.ok:
-        raise exceptions.DebankException(status_code=status_code)
+        raise exceptions.DebankException(status_code=status_code, retry_after=get_retry_after(headers=headers))
 
-    response = response.json()
-    if response['error_code']:
+    response = (decoder or get_default_decoder()).loads(content)
+    if isinstance(response, dict) and response.get('error_code'):
         raise exceptions.DebankException(status_code=status_code, error_msg=response['error_msg'])
 
     return response
+
+
+def get_retry_after(headers: Optional[Mapping[str, str]] = None) -> Optional[float]:
+    """
+    Get how many seconds the server asks to wait before the next request from the 'Retry-After' header.
+
+    Args:
+        headers (Optional[Mapping[str, str]]): the headers of a response. (None)
+
+    Returns:
+        Optional[float]: the number of seconds.
+
+    """
+    if not headers:
+        return
+
+    retry_after = headers.get('Retry-After')
+    if not retry_after:
+        return
+
+    try:
+        return max(float(retry_after), 0.0)
+
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+
+    except (TypeError, ValueError):
+        return
+
+
+def group_by_chain(items: List[dict]) -> Dict[str, List[dict]]:
+    """
+    Group raw items (tokens, projects, etc.) by their chain.
+
+    Args:
+        items (List[dict]): the raw items.
+
+    Returns:
+        Dict[str, List[dict]]: the items grouped by chain.
+
+    """
+    chain_dict = {}
+    for item in items:
+        chain = item['chain']
+        if chain in chain_dict:
+            chain_dict[chain].append(item)
+
+        else:
+            chain_dict[chain] = [item]
+
+    return chain_dict
+
+
+def sort_by_usd_value(instances: Dict[str, Any], attribute: str = 'usd_value') -> Dict[str, Any]:
+    """
+    Sort a dictionary of instances by their USD value in descending order.
+
+    Args:
+        instances (Dict[str, Any]): the instances, e.g. chains.
+        attribute (str): the name of the attribute with the USD value. ('usd_value')
+
+    Returns:
+        Dict[str, Any]: the sorted dictionary.
+
+    """
+    return {
+        key: value for key, value in sorted(
+            instances.items(), key=lambda item: getattr(item[1], attribute), reverse=True
+        )
+    }
@@ -0,0 +1,221 @@
+import math
+import time
+from typing import Optional, List, Dict, Tuple, Iterable
+
+from py_debank import custom
+from py_debank import history
+from py_debank.client import DebankClient, get_default_client
+from py_debank.models import Chain, Curve, Mark, Tx, BaseNFT
+from py_debank.price_service import PriceService
+
+
+def get_holdings(chains: Dict[str, Chain]) -> Dict[Tuple[str, str], float]:
+    """
+    Get token amounts of chain balances.
+
+    Args:
+        chains (Dict[str, Chain]): the chain balances, e.g. returned by 'custom.current_balance_list'.
+
+    Returns:
+        Dict[Tuple[str, str], float]: the amounts by chain and token ID.
+
+    """
+    holdings = {}
+    for chain in chains.values():
+        for token in chain.tokens or ():
+            if token.amount:
+                key = (token.chain or chain.name, token.id)
+                holdings[key] = holdings.get(key, 0.0) + token.amount
+
+    return holdings
+
+
+def replay_holdings(
+        holdings: Dict[Tuple[str, str], float], txs: Iterable[Tx], times: Iterable[int]
+) -> Dict[int, Dict[Tuple[str, str], float]]:
+    """
+    Rebuild token amounts at points in time by reverting transactions from the newest one, received tokens are
+    subtracted and sent ones are added back. NFTs and gas fees aren't replayed.
+
+    Args:
+        holdings (Dict[Tuple[str, str], float]): the current amounts by chain and token ID.
+        txs (Iterable[Tx]): transactions made after the earliest point in time.
+        times (Iterable[int]): the points in time.
+
+    Returns:
+        Dict[int, Dict[Tuple[str, str], float]]: positive amounts at every point in time.
+
+    """
+    holdings = dict(holdings)
+    txs = sorted(txs, key=lambda tx: float(tx.timestamp), reverse=True)
+    snapshots = {}
+    i = 0
+    for time_at in sorted(times, reverse=True):
+        while i < len(txs) and float(txs[i].timestamp) > time_at:
+            tx = txs[i]
+            for tokens, sign in ((tx.receives, -1), (tx.sends, 1)):
+                for token in tokens or ():
+                    # NFTs aren't valued
+                    if isinstance(token, BaseNFT) or not token.amount:
+                        continue
+
+                    key = (token.chain or tx.chain, token.id)
+                    holdings[key] = holdings.get(key, 0.0) + sign * token.amount
+
+            i += 1
+
+        snapshots[time_at] = {key: amount for key, amount in holdings.items() if amount > 0}
+
+    return snapshots
+
+
+class ValuationEngine:
+    """
+    Builds a net worth curve of an address's wallet tokens by replaying its transaction history backwards from
+    the current balances and valuing the holdings with batched historical prices.
+
+    The curve is extended incrementally: marks that were built are kept, an update values only the new points in time
+    and needs only transactions made after the last mark.
+
+    Attributes:
+        address (str): the address.
+        start_time (int): the time of the first point of the curve.
+        resolution (int): the interval in seconds between points of the curve.
+        price_service (PriceService): the service for looking up historical prices.
+        marks (List[Mark]): the built points of the curve from older to newer ones.
+        updated_at (Optional[float]): the time of the balances the curve was last updated with.
+
+    """
+
+    def __init__(
+            self, address: str, start_time: int, resolution: int = 3600, price_service: Optional[PriceService] = None,
+            client: Optional[DebankClient] = None
+    ):
+        """
+        Initialize the class.
+
+        Args:
+            address (str): the address.
+            start_time (int): the time of the first point of the curve, it's rounded up to the resolution.
+            resolution (int): the interval in seconds between points of the curve. (3600)
+            price_service (Optional[PriceService]): the service for looking up historical prices. (a new service)
+            client (Optional[DebankClient]): a client for making requests. (the default client)
+
+        """
+        self.address: str = address.lower()
+        self.start_time: int = start_time
+        self.resolution: int = resolution
+        self.client: DebankClient = client or get_default_client()
+        self.price_service: PriceService = price_service or PriceService(client=self.client)
+        self.marks: List[Mark] = []
+        self.updated_at: Optional[float] = None
+
+    @property
+    def next_time(self) -> int:
+        """
+        The time of the next point of the curve.
+        """
+        if self.marks:
+            return self.marks[-1].timestamp + self.resolution
+
+        return math.ceil(self.start_time / self.resolution) * self.resolution
+
+    @property
+    def curve(self) -> Optional[Curve]:
+        """
+        The built curve or None if it has no points yet.
+        """
+        if not self.marks:
+            return
+
+        return Curve(data={'usd_value_list': [[mark.timestamp, mark.usd_value] for mark in self.marks]})
+
+    def _plan(
+            self, chains: Dict[str, Chain], txs: Iterable[Tx], now: float
+    ) -> Tuple[List[int], Dict[int, Dict[Tuple[str, str], float]], List[Tuple[str, str, int]]]:
+        """
+        Rebuild holdings at the new points in time and make price lookups for them.
+
+        Args:
+            chains (Dict[str, Chain]): the current chain balances.
+            txs (Iterable[Tx]): transactions made after the last mark.
+            now (float): the time of the balances.
+
+        Returns:
+            Tuple[List[int], Dict[int, Dict[Tuple[str, str], float]], List[Tuple[str, str, int]]]: the new points in
+                time, holdings at them and price lookups.
+
+        """
+        times = list(range(self.next_time, int(now) + 1, self.resolution))
+        txs = [tx for tx in txs if tx.timestamp and times and times[0] < float(tx.timestamp) <= now]
+        snapshots = replay_holdings(holdings=get_holdings(chains=chains), txs=txs, times=times)
+        lookups = [
+            (token_id, chain, time_at) for time_at in times for chain, token_id in snapshots[time_at]
+        ]
+        return times, snapshots, lookups
+
+    def _add_marks(
+            self, times: List[int], snapshots: Dict[int, Dict[Tuple[str, str], float]],
+            lookups: List[Tuple[str, str, int]], prices: List[float], now: float
+    ) -> Optional[Curve]:
+        """
+        Value the holdings and add marks of the new points in time.
+
+        Args:
+            times (List[int]): the new points in time.
+            snapshots (Dict[int, Dict[Tuple[str, str], float]]): holdings at them.
+            lookups (List[Tuple[str, str, int]]): the price lookups.
+            prices (List[float]): the prices of the lookups.
+            now (float): the time of the balances.
+
+        Returns:
+            Optional[Curve]: the built curve.
+
+        """
+        prices = {lookup: price for lookup, price in zip(lookups, prices)}
+        for time_at in times:
+            usd_value = 0.0
+            for (chain, token_id), amount in snapshots[time_at].items():
+                price = prices.get((token_id, chain, time_at))
+                if price:
+                    usd_value += amount * price
+
+            self.marks.append(Mark(timestamp=time_at, usd_value=usd_value))
+
+        self.updated_at = now
+        return self.curve
+
+    def update(self, chains: Dict[str, Chain], txs: Iterable[Tx], now: Optional[float] = None) -> Optional[Curve]:
+        """
+        Extend the curve up to the time of the current balances.
+
+        Args:
+            chains (Dict[str, Chain]): the current chain balances.
+            txs (Iterable[Tx]): transactions made after the last mark, older ones are ignored.
+            now (Optional[float]): the time of the balances, transactions made after it are ignored. (current time)
+
+        Returns:
+            Optional[Curve]: the built curve.
+
+        """
+        now = now or time.time()
+        times, snapshots, lookups = self._plan(chains=chains, txs=txs, now=now)
+        prices = self.price_service.get_prices(lookups=lookups)
+        return self._add_marks(times=times, snapshots=snapshots, lookups=lookups, prices=prices, now=now)
+
+    def refresh(self, proxies: Optional[str or List[str]] = None) -> Optional[Curve]:
+        """
+        Request the current balances and the transactions made after the last mark and extend the curve.
+
+        Args:
+            proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+                requests. (None)
+
+        Returns:
+            Optional[Curve]: the built curve.
+
+        """
+        chains = custom.current_balance_list(address=self.address, proxies=proxies, client=self.client)
+        now = time.time()
+        txs = history.iter_history(address=self.address, until=self.next_time, proxies=proxies, client=self.client)
+        return self.update(chains=chains, txs=txs, now=now)
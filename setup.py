@@ -15,6 +15,7 @@ setup(
     long_description=long_description,
     packages=find_packages(),
     install_requires=['fake-useragent', 'pretty-utils @ git+https://github.com/SecorD0/pretty-utils@main', 'requests'],
+    extras_require={'aio': ['aiohttp']},
     keywords=['debank', 'pydebank', 'py-debank', 'debankpy', 'debank-py'],
     classifiers=[
         'Programming Language :: Python :: 3.11'
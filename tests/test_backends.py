@@ -0,0 +1,190 @@
+"""
+Tests of the Pro OpenAPI backend against a local stand-in server that serves recorded responses.
+"""
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from py_debank import custom, nft, portfolio, token, user
+from py_debank.backends import V1Backend, to_public_project, group_nfts
+from py_debank.client import DebankClient
+from py_debank.models import Chain
+
+ACCESS_KEY = 'test-access-key'
+ADDRESS = '0x5853ed4f26a3fcea565b3fbc698bb19cdf6deb85'
+
+
+def make_token(chain: str, token_id: str, symbol: str, price: float, amount: float) -> dict:
+    return {
+        'id': token_id, 'chain': chain, 'name': symbol, 'symbol': symbol, 'display_symbol': None,
+        'optimized_symbol': symbol, 'decimals': 18, 'logo_url': f'https://static.debank.com/image/{symbol}.png',
+        'protocol_id': '', 'price': price, 'price_24h_change': 0.01, 'is_verified': True, 'is_core': True,
+        'is_wallet': True, 'time_at': 1483200000, 'amount': amount, 'raw_amount': amount * 10 ** 18
+    }
+
+
+def make_nft(chain: str, inner_id: str, contract_id: str, contract_name: str) -> dict:
+    return {
+        'id': f'{contract_id}{inner_id}', 'contract_id': contract_id, 'inner_id': inner_id, 'chain': chain,
+        'name': f'{contract_name} #{inner_id}', 'description': None, 'content_type': 'image_url',
+        'content': f'https://static.debank.com/nft/{inner_id}.png', 'thumbnail_url': None, 'total_supply': 1,
+        'detail_url': f'https://opensea.io/assets/{contract_id}/{inner_id}', 'collection_id': f'{chain}:{contract_id}',
+        'contract_name': contract_name, 'is_erc1155': False, 'amount': 1, 'usd_price': None
+    }
+
+
+WETH = make_token(chain='eth', token_id='0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2', symbol='WETH', price=1800.0,
+                  amount=0.5)
+RESPONSES = {
+    'user/all_token_list': [
+        WETH, make_token(chain='eth', token_id='eth', symbol='ETH', price=1800.0, amount=1.0),
+        make_token(chain='arb', token_id='arb', symbol='ETH', price=1800.0, amount=0.1)
+    ],
+    'user/all_complex_protocol_list': [{
+        'id': 'aave3', 'chain': 'eth', 'name': 'Aave V3', 'site_url': 'https://app.aave.com',
+        'logo_url': 'https://static.debank.com/image/project/aave.png', 'has_supported_portfolio': True, 'tvl': 1e10,
+        'portfolio_item_list': [{
+            'stats': {'asset_usd_value': 900.0, 'debt_usd_value': 0, 'net_usd_value': 900.0},
+            'update_at': 1700000000, 'name': 'Lending', 'detail_types': ['lending'],
+            'detail': {'supply_token_list': [WETH]}, 'proxy_detail': {},
+            'pool': {'id': '0x87870bca3f3fd6335c3f4ce8392d69350b4fa4e2', 'chain': 'eth'}
+        }]
+    }],
+    'user/all_nft_list': [
+        make_nft(chain='eth', inner_id='1', contract_id='0xbc4ca0eda7647a8ab7c2061c2e118a18a936f13d',
+                 contract_name='BoredApeYachtClub'),
+        make_nft(chain='eth', inner_id='2', contract_id='0xbc4ca0eda7647a8ab7c2061c2e118a18a936f13d',
+                 contract_name='BoredApeYachtClub'),
+        make_nft(chain='arb', inner_id='7', contract_id='0x17dacad7975960833f374622fad08b90ed67d1b5',
+                 contract_name='Smol Brains')
+    ],
+    'user/used_chain_list': [
+        {'id': 'eth', 'community_id': 1, 'name': 'Ethereum', 'native_token_id': 'eth', 'born_at': None},
+        {'id': 'arb', 'community_id': 42161, 'name': 'Arbitrum', 'native_token_id': 'arb', 'born_at': 1622243344}
+    ],
+    'user/total_balance': {
+        'total_usd_value': 3600.0, 'chain_list': [{'id': 'eth', 'usd_value': 3420.0}, {'id': 'arb', 'usd_value': 180.0}]
+    }
+}
+# Single-chain endpoints return the items of the chain in the 'chain_id' parameter
+RESPONSES['user/token_list'] = RESPONSES['user/all_token_list']
+RESPONSES['user/nft_list'] = RESPONSES['user/all_nft_list']
+
+
+class ProAPIHandler(BaseHTTPRequestHandler):
+    requests: List[Tuple[str, dict, str]] = []
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        path = url.path[len('/v1/'):]
+        params = {key: value[0] for key, value in parse_qs(url.query).items()}
+        self.requests.append((path, params, self.headers.get('AccessKey')))
+        if self.headers.get('AccessKey') != ACCESS_KEY:
+            status, body = 401, {'message': 'invalid AccessKey'}
+
+        elif path in RESPONSES:
+            status, body = 200, RESPONSES[path]
+            if 'chain_id' in params:
+                body = [item for item in body if item['chain'] == params['chain_id']]
+
+        else:
+            status, body = 404, {'message': 'not found'}
+
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class V1BackendTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ProAPIHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        entrypoint = f'http://127.0.0.1:{cls.server.server_port}/v1/'
+        cls.client = DebankClient(backend=V1Backend(access_key=ACCESS_KEY, entrypoint=entrypoint))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.client.close()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        ProAPIHandler.requests.clear()
+
+    def test_current_balance_list(self) -> None:
+        balances = custom.current_balance_list(address=ADDRESS, client=self.client)
+        self.assertEqual([path for path, _, _ in ProAPIHandler.requests], ['user/all_token_list'])
+        self.assertEqual(ProAPIHandler.requests[0][1], {'id': ADDRESS, 'is_all': 'false'})
+        self.assertEqual(list(balances), ['eth', 'arb'])
+        self.assertIsInstance(balances['eth'], Chain)
+        self.assertEqual([chain_token.symbol for chain_token in balances['eth'].tokens], ['ETH', 'WETH'])
+        self.assertAlmostEqual(balances['eth'].usd_value, 2700.0)
+
+    def test_balance_list(self) -> None:
+        balance = token.balance_list(address=ADDRESS, chain='arb', client=self.client)
+        self.assertEqual(ProAPIHandler.requests[0][1], {'id': ADDRESS, 'chain_id': 'arb', 'is_all': 'false'})
+        self.assertEqual([chain_token.id for chain_token in balance.tokens], ['arb'])
+
+    def test_project_list(self) -> None:
+        projects = portfolio.project_list(address=ADDRESS, client=self.client)
+        self.assertEqual(list(projects), ['eth'])
+        project = projects['eth'].projects[0]
+        self.assertEqual(project.name, 'Aave V3')
+        self.assertEqual(project.usd_value, 900.0)
+        self.assertEqual([item_token.symbol for item_token in project.portfolio_item_list[0].tokens], ['WETH'])
+
+    def test_collection_list(self) -> None:
+        chains = nft.collection_list(address=ADDRESS, client=self.client)
+        self.assertEqual([path for path, _, _ in ProAPIHandler.requests], ['user/all_nft_list'])
+        self.assertEqual(sorted(chains), ['arb', 'eth'])
+        self.assertEqual([chain_nft.inner_id for chain_nft in chains['eth'].nfts], ['1', '2'])
+        self.assertIs(chains['eth'].nfts[0].collection, chains['eth'].nfts[1].collection)
+        self.assertEqual(chains['eth'].nfts[0].collection.name, 'BoredApeYachtClub')
+
+        raw = nft.collection_list(address=ADDRESS, chain='arb', raw_data=True, client=self.client)
+        self.assertEqual(ProAPIHandler.requests[-1][:2], ('user/nft_list', {'id': ADDRESS, 'chain_id': 'arb'}))
+        self.assertEqual(raw['arb'][0]['id'], 'arb:0x17dacad7975960833f374622fad08b90ed67d1b5')
+        self.assertEqual(len(raw['arb'][0]['nft_list']), 1)
+
+    def test_addr(self) -> None:
+        debank_user = user.addr(address=ADDRESS.upper(), client=self.client)
+        self.assertEqual(sorted(path for path, _, _ in ProAPIHandler.requests),
+                         ['user/total_balance', 'user/used_chain_list'])
+        self.assertEqual(debank_user.id, ADDRESS)
+        self.assertEqual(debank_user.used_chains, ['eth', 'arb'])
+        self.assertEqual(debank_user.usd_value, 3600.0)
+
+    def test_total_balance(self) -> None:
+        self.assertEqual(user.total_balance(address=ADDRESS, client=self.client), 3600.0)
+
+    def test_access_key(self) -> None:
+        user.total_balance(address=ADDRESS, client=self.client)
+        self.assertEqual({access_key for _, _, access_key in ProAPIHandler.requests}, {ACCESS_KEY})
+
+
+class ConversionTest(unittest.TestCase):
+    def test_to_public_project(self) -> None:
+        project = to_public_project(data=RESPONSES['user/all_complex_protocol_list'][0])
+        self.assertEqual(project['portfolio_item_list'][0]['details'], {'supply_token_list': [WETH]})
+        self.assertEqual(to_public_project(data={'id': 'uniswap3'}), {'id': 'uniswap3'})
+
+    def test_group_nfts(self) -> None:
+        chains = group_nfts(nfts=RESPONSES['user/all_nft_list'])
+        self.assertEqual(sorted(chains), ['arb', 'eth'])
+        self.assertEqual(len(chains['eth']), 1)
+        self.assertEqual(chains['eth'][0]['name'], 'BoredApeYachtClub')
+        self.assertEqual([item['inner_id'] for item in chains['eth'][0]['nft_list']], ['1', '2'])
+
+
+if __name__ == '__main__':
+    unittest.main()